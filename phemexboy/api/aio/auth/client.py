@@ -0,0 +1,424 @@
+"""Implements AsyncAuthClientInterface"""
+
+import os
+import weakref
+import ccxt.async_support as ccxt_async
+
+from ccxt import BadSymbol, ExchangeError, NetworkError
+from phemexboy.interfaces.aio.auth.client_interface import AsyncAuthClientInterface
+from phemexboy.api.markets import MarketCache, MARKETS
+from phemexboy.api.orders import OpenOrders, OrderStatus
+from phemexboy.api.aio.public import AsyncPublicClient
+from phemexboy.api.aio.auth.order import AsyncOrderClient
+from phemexboy.api.aio.auth.position import AsyncPositionClient
+from phemexboy.api.ws.account import AccountStream
+from phemexboy.api.ws.connection import WS_URL
+from phemexboy.exceptions import InvalidCodeError
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class AsyncAuthClient(AsyncAuthClientInterface):
+    def __init__(
+        self,
+        markets: MarketCache = MARKETS,
+        endpoint: object = None,
+        open_orders: OpenOrders = None,
+    ):
+        # Clients created without an endpoint own theirs and close it
+        self._owner = endpoint is None
+        self._endpoint = (
+            endpoint
+            if endpoint
+            else ccxt_async.phemex(
+                {
+                    "apiKey": os.getenv("KEY"),
+                    "secret": os.getenv("SECRET"),
+                    "enableRateLimit": True,
+                }
+            )
+        )
+        self._markets = markets
+        # Handed to every AsyncOrderClient instead of each creating its own
+        self._pub_client = AsyncPublicClient(markets, self._endpoint)
+        self._account = None
+        self._live = weakref.WeakSet()
+        self._open_orders = open_orders if open_orders else OpenOrders()
+        # Start from the snapshot when one exists, avoiding the first download
+        self._markets.restore(self._endpoint)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _worker(self, task: object, *args):
+        """Runs task against current markets on the running event loop
+
+        Args:
+            task (object): Coroutine function to await
+
+        Raises:
+            Exception: Any
+
+        Returns:
+            Any: Result from task execution
+        """
+        try:
+            await self._markets.aload(self._endpoint)
+            return await task(*args)
+        except BadSymbol:
+            # Symbol may have been listed or delisted since markets were cached
+            self._markets.invalidate()
+            raise
+        except Exception:
+            raise
+
+    async def close(self):
+        """Close the account stream, and the exchange session when this client owns it"""
+        await self.unwatch_account()
+        if self._owner:
+            await self._endpoint.close()
+
+    async def refresh_markets(self):
+        """Download market metadata now instead of waiting for the cache to expire"""
+        await self._markets.arefresh(self._endpoint)
+
+    def _track(self, client: object):
+        """Remember a new client and have the account stream push into it
+
+        Args:
+            client (object): AsyncOrderClient or AsyncPositionClient
+
+        Returns:
+            Object: The same client
+        """
+        self._live.add(client)
+        if self._account is not None:
+            self._account.track(client)
+        return client
+
+    async def watch_account(self, timeout: float = 10, url: str = WS_URL):
+        """Push order, fill and position updates from Phemex's private websocket into every AsyncOrderClient and AsyncPositionClient
+
+        Once synced, pending() and closed() read the pushed state instead of requesting open orders,
+        and close() returns as soon as a fill arrives.
+
+        Args:
+            timeout (float): Seconds to wait for login and subscription. Defaults to 10.
+            url (str): Websocket endpoint, testnet is wss://testnet.phemex.com/ws. Defaults to WS_URL.
+
+        Raises:
+            NetworkError: Not subscribed within timeout
+            ExchangeError: Phemex rejected the login
+
+        Returns:
+            AccountStream: Stream pushing the updates
+        """
+        if self._account is None:
+            self._account = AccountStream(self._endpoint, self._markets, url)
+            await self._account.astart()
+            for client in list(self._live):
+                self._account.track(client)
+        try:
+            synced = await self._account.aready(timeout)
+        except ExchangeError:
+            # Login rejected, stop retrying with the same key
+            await self.unwatch_account()
+            raise
+        if not synced:
+            raise NetworkError(f"Account stream not subscribed within {timeout}s")
+        return self._account
+
+    async def unwatch_account(self):
+        """Close the private websocket, AsyncOrderClient and AsyncPositionClient request their state again"""
+        account, self._account = self._account, None
+        if account is not None:
+            await account.aclose()
+
+    async def leverage(self, amount: int, symbol: str):
+        """Set future account leverage
+
+        Args:
+            amount (int): Set leverage to this amount
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Bool: Leverage successfully set or not
+        """
+        data = await self._worker(self._endpoint.set_leverage, amount, symbol)
+        return data["data"] == "OK"
+
+    async def orders(self, symbol: str):
+        """Retrieve all open orders for symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            List: All open orders
+        """
+        return await self._worker(self._endpoint.fetch_open_orders, symbol)
+
+    async def open_orders(self, symbol: str):
+        """Retrieve open orders for symbol from a snapshot shared by every order client
+
+        Open orders are requested at most once per ttl of the OpenOrders registry,
+        placing or canceling an order for symbol requests them again.
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: Open orders by id, shared and must not be modified
+        """
+        return await self._open_orders.aget(self.orders, symbol)
+
+    async def cancel(self, id: str, symbol: str):
+        """Cancel open order
+
+        Args:
+            id (str): Order id
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: Order data
+        """
+        try:
+            return await self._worker(self._endpoint.cancel_order, id, symbol)
+        finally:
+            self._open_orders.invalidate(symbol)
+
+    async def amend(
+        self,
+        id: str,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: float,
+        config: dict = {},
+    ):
+        """Amend open order in place, keeping its id and place in the book
+
+        Args:
+            id (str): Order id
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            side (str): Side of order ('buy' or 'sell')
+            amount (float): New amount of base currency
+            price (float): New limit order price
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NotSupported: Exchange cannot amend orders
+            OrderNotFound: Order is no longer open
+
+        Returns:
+            Dictionary: Order data
+        """
+        try:
+            return await self._worker(
+                self._endpoint.edit_order, id, symbol, type, side, amount, price, config
+            )
+        finally:
+            self._open_orders.invalidate(symbol)
+
+    async def order_status(self, id: str, symbol: str, client_id: str = None):
+        """Retrieve the state of a single order by id or client order id
+
+        Args:
+            id (str): Order id, ignored when client_id is given
+            symbol (str): Created symbol for base and quote currencies
+            client_id (str): Client order id set when placing the order. Defaults to None.
+
+        Raises:
+            OrderNotFound: No order with id or client_id for symbol
+
+        Returns:
+            OrderStatus: State, filled amount and average price
+        """
+        params = {"clOrdID": client_id} if client_id else {}
+        order = await self._worker(self._endpoint.fetch_order, id, symbol, params)
+        return OrderStatus.parse(order)
+
+    async def balance(self, currency: str, code: str):
+        """Retrieve the balance of an asset on exchange
+
+        Args:
+            currency (str): The currency balance to retrieve (ex. 'BTC')
+            code (str): Market code (ex. 'spot')
+
+        Raises:
+            InvalidCodeError: Codes may be found by calling proxy.codes()
+
+        Returns:
+            Float: Balance for account
+        """
+        if code == "spot":
+            data = await self._worker(self._endpoint.fetch_balance)
+        elif code == "future":
+            params = {"type": "swap", "code": "USD"}
+            data = await self._worker(self._endpoint.fetch_balance, params)
+        else:
+            raise InvalidCodeError()
+
+        return data[currency]["free"]
+
+    async def buy(
+        self,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float = None,
+        config: dict = {},
+    ):
+        """Places a buy order
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (float): Amount of base currency you would like to buy
+            price (float, optional): Set limit order price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Returns:
+            AsyncOrderClient: Object that represents open order and allows for interaction
+        """
+        params = {"timeInForce": "PostOnly"}
+        params.update(config)
+        data = await self._worker(
+            self._endpoint.create_order, symbol, type, "buy", amount, price, params
+        )
+
+        self._open_orders.invalidate(symbol)
+
+        code = "spot"
+        if "type" in params.keys() and params["type"] == "swap":
+            code = "future"
+
+        return self._track(
+            AsyncOrderClient(data, self, code, pub_client=self._pub_client)
+        )
+
+    async def sell(
+        self,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float = None,
+        config: dict = {},
+    ):
+        """Places a sell order
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (float): Amount of base currency you would like to buy
+            price (float, optional): Set limit order price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Returns:
+            AsyncOrderClient: Object that represents open order and allows for interaction
+        """
+        params = {"timeInForce": "PostOnly"}
+        params.update(config)
+        data = await self._worker(
+            self._endpoint.create_order, symbol, type, "sell", amount, price, params
+        )
+
+        self._open_orders.invalidate(symbol)
+
+        code = "spot"
+        if "type" in params.keys() and params["type"] == "swap":
+            code = "future"
+
+        return self._track(
+            AsyncOrderClient(data, self, code, pub_client=self._pub_client)
+        )
+
+    async def position(self, symbol: str):
+        """Create an AsyncPositionClient representing the open position for symbol
+
+        Args:
+            symbol(str): Created symbol for base and quote currencies
+
+        Returns:
+            AsyncPositionClient: Represents open position and allows for interaction
+        """
+        data = await self._worker(self._endpoint.fetch_positions, [symbol])
+        return self._track(AsyncPositionClient(data[0], self))
+
+    async def long(
+        self,
+        symbol: str,
+        type: str,
+        amount: int,
+        price: float = None,
+        sl: float = None,
+        tp: float = None,
+        config: dict = {},
+    ):
+        """Open a long position
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (int): Number of contracts to open
+            price (float, optional): Set limit order price. Defaults to None.
+            sl (float, optional): Set stop loss price. Defaults to None.
+            tp (float, optional): Set take profit price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Returns:
+            AsyncOrderClient: Object that represents open order and allows for interaction
+        """
+        params = {
+            "type": "swap",
+            "code": "USD",
+            "stopLossPrice": sl,
+            "takeProfitPrice": tp,
+            "slTrigger": "ByLastPrice",
+            "tpTrigger": "ByLastPrice",
+            "timeInForce": "PostOnly",
+        }
+        params.update(config)
+        return await self.buy(symbol, type, amount, price, params)
+
+    async def short(
+        self,
+        symbol: str,
+        type: str,
+        amount: int,
+        price: float = None,
+        sl: float = None,
+        tp: float = None,
+        config: dict = {},
+    ):
+        """Open a short position
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (int): Number of contracts to open
+            price (float, optional): Set limit order price. Defaults to None.
+            sl (float, optional): Set stop loss price. Defaults to None.
+            tp (float, optional): Set take profit price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Returns:
+            AsyncOrderClient: Object that represents open order and allows for interaction
+        """
+        params = {
+            "type": "swap",
+            "code": "USD",
+            "stopLossPrice": sl,
+            "takeProfitPrice": tp,
+            "slTrigger": "ByLastPrice",
+            "tpTrigger": "ByLastPrice",
+            "timeInForce": "PostOnly",
+        }
+        params.update(config)
+        return await self.sell(symbol, type, amount, price, params)
@@ -0,0 +1,679 @@
+"""Implements AsyncOrderClientInterface"""
+
+from ccxt.base.errors import InsufficientFunds, NotSupported, OrderNotFound
+
+from phemexboy.interfaces.aio.auth.order_interface import AsyncOrderClientInterface
+from phemexboy.interfaces.aio.auth.client_interface import AsyncAuthClientInterface
+from phemexboy.interfaces.aio.public_interface import AsyncPublicClientInterface
+from phemexboy.api.orders import OrderStatus, order_state
+from phemexboy.api.scheduler import Backoff
+from phemexboy.exceptions import (
+    OrderTypeError,
+    OrderFilledError,
+    InvalidRequestError,
+    InvalidCodeError,
+)
+from phemexboy.helpers.conversions import stop_loss, take_profit
+
+from copy import deepcopy
+from time import monotonic
+from asyncio import Event, wait_for, TimeoutError
+from ccxt import NetworkError, ExchangeError
+
+
+class AsyncOrderClient(AsyncOrderClientInterface):
+    def __init__(
+        self,
+        order_data: dict,
+        client: AsyncAuthClientInterface,
+        code: str,
+        verbose: bool = False,
+        pub_client: AsyncPublicClientInterface = None,
+    ):
+        self._verbose = verbose
+        self._code = code
+        self._update(order_data=order_data, state="None")
+        self._client = client
+        self._pub_client = pub_client if pub_client else client._pub_client
+        # Set by the account stream whenever it pushes an update
+        self._changed = Event()
+        self._epoch = None
+        # Last status fetched by id
+        self._status = None
+
+    def __str__(self):
+        out = ""
+        for key in self._order.keys():
+            out += f"{key}: {self._order[key]}\n"
+
+        out += f"code: {self._code}\n"
+        return out
+
+    def _log(self, msg: str, end: str = None):
+        """Print message to output if not silent
+
+        Args:
+            msg (str): Message to print to output
+            end (str): String appended after the last value. Default a newline.
+        """
+        if self._verbose:
+            print(msg, end=end)
+
+    def _update(self, order_data: dict = None, state: str = None):
+        """Set order data and state
+
+        Args:
+            order_data (Dictionary): Created order data. Defaults to None.
+            state (str): Pending, Cancelled, or Closed. Defaults to None.
+        """
+        if order_data:
+            self._log("Updating order data", end=", ")
+
+            if "info" in order_data.keys():
+                # Extract proper symbol and remove status
+                # Status is managed by client state
+                # Info is original request, not needed
+                symbol = order_data["info"]["symbol"]
+                del order_data["info"]
+                del order_data["status"]
+
+            self._order = order_data
+            self._order["symbol"] = symbol
+
+            self._log("done.")
+
+        if state:
+            self._log(f"Updating state to {state}", end=", ")
+            self._state = state
+            self._log("done.")
+
+    def _push(self, order: dict):
+        """Apply an update pushed by the account stream
+
+        Args:
+            order (dict): Parsed order
+        """
+        self._update(order_data=order, state=order_state(order["status"]))
+        self._changed.set()
+
+    def _settle(self, status: OrderStatus):
+        """Apply a status fetched by id
+
+        Args:
+            status (OrderStatus): Status of this order
+        """
+        self._status = status
+        for key in ["filled", "remaining", "average"]:
+            self._order[key] = getattr(status, key)
+        self._update(state=status.state)
+
+    def _final(self, id: str):
+        """Check if a fetched status already tells how order id ended
+
+        Args:
+            id (str): Order id
+
+        Returns:
+            Bool: Order id is known to be filled or canceled
+        """
+        status = self._status
+        return status is not None and status.id == id and status.state != "pending"
+
+    def _local(self):
+        """Check if the account stream has pushed every update since the last REST check
+
+        Returns:
+            Bool: State may be read without a request
+        """
+        account = getattr(self._client, "_account", None)
+        return account is not None and self._state != "None" and account.current(self)
+
+    def _synced_epoch(self):
+        """Account stream subscription a REST check is current for
+
+        Returns:
+            Int: Epoch of the synced stream, None without one
+        """
+        account = getattr(self._client, "_account", None)
+        return account.epoch if account is not None and account.synced else None
+
+    async def _wait(self, wait: float):
+        """Sleep for wait seconds, returning early when the account stream pushes an update
+
+        Args:
+            wait (float): Seconds to wait
+        """
+        try:
+            await wait_for(self._changed.wait(), wait)
+            self._changed.clear()
+        except TimeoutError:
+            pass
+
+    def requests(self):
+        """Returns a list of all request params
+
+        Returns:
+            List: Request params
+        """
+        return list(self._order.keys())
+
+    def query(self, request: str):
+        """Retrieve order information data
+
+        Args:
+            request (str): Type of data you want to retrieve from AsyncOrderClient
+
+        Raises:
+            InvalidRequestError: AsyncOrderClient failed to retrieve data for {request}
+
+        Returns:
+            String: Requested order data
+        """
+        data = None
+        try:
+            if request not in self.requests():
+                raise InvalidRequestError()
+
+            self._log(f"Retrieving order data based on {request}", end=", ")
+            data = self._order[request]
+        except InvalidRequestError:
+            print(
+                f"InvalidRequestError - AsyncOrderClient failed to retrieve data for {request}"
+            )
+            print("Call requests() in order to retrieve valid params")
+            print(f"Params: {self.requests()}")
+        else:
+            self._log("done.")
+        return data
+
+    async def edit(
+        self,
+        amount: float,
+        price: float,
+        sl_percent: int = None,
+        tp_percent: int = None,
+    ):
+        """Edit pending order
+
+        The order is amended in place when possible, otherwise it is canceled and placed again.
+        An order that was canceled is placed again, an order that already filled raises
+        instead of opening a second one.
+
+        Args:
+            amount (float): Amount of base currency you are using for order
+            price (float): Edit limit order price
+            sl_percent: Set stop loss percent from price. Defaults to None.
+            tp_percent: Set take profit percent from price. Defaults to None.
+
+        Raises:
+            OrderTypeError: Order type must be limit in order to edit
+            OrderFilledError: Order already filled, there is nothing left to edit
+            NetworkError: AsyncOrderClient failed to edit order
+            ExchangeError: AsyncOrderClient failed to edit order
+            Exception: AsyncOrderClient failed to edit order
+        """
+        symbol = self.query("symbol")
+        type = self.query("type")
+        side = self.query("side")
+
+        if type == "market":
+            raise OrderTypeError("Order type must be limit in order to edit")
+
+        if side == "buy":
+            price = price - 0.01
+        else:
+            price = price + 0.01
+
+        self._log(
+            f"Attempting to edit order with {amount} amount at price {price}", end=", "
+        )
+
+        # Amend in place, one request that keeps the order id and its queue position
+        # Stop loss and take profit are only set when placing, so those edits replace
+        if sl_percent is None and tp_percent is None:
+            id = self.query("id")
+            data = None
+            try:
+                data = await self._client.amend(id, symbol, type, side, amount, price)
+            except (NotSupported, OrderNotFound):
+                # No amend for this market, or the order is no longer open to amend
+                pass
+            except NetworkError as e:
+                print(f"NetworkError - AsyncOrderClient failed to edit order: {e}")
+                raise
+            except ExchangeError as e:
+                print(f"ExchangeError - AsyncOrderClient failed to edit order: {e}")
+                raise
+            except Exception as e:
+                print(f"AsyncOrderClient failed to edit order: {e}")
+                raise
+            else:
+                self._update(order_data=data, state=order_state(data["status"]))
+                self._log("done.")
+                return
+
+        # Reopen order
+        if await self.pending():
+            await self.cancel()
+        else:
+            # Tells a canceled order from a filled one
+            await self.closed()
+        if self._state == "closed":
+            # Placing again would open a second position
+            raise OrderFilledError(
+                "Order already filled, there is nothing left to edit"
+            )
+
+        # Format sl and tp
+        sl = None
+        if sl_percent:
+            sl = (
+                stop_loss(price, sl_percent, "long")
+                if side == "buy"
+                else stop_loss(price, sl_percent, "short")
+            )
+
+        tp = None
+        if tp_percent:
+            tp = (
+                take_profit(price, tp_percent, "long")
+                if side == "buy"
+                else take_profit(price, tp_percent, "short")
+            )
+
+        # Retrieve new order data from AsyncOrderClient
+        client = None
+        try:
+            if self._code == "spot":
+                if side == "buy":
+                    self._log(
+                        f"Attempting to place {type} buy order for {symbol} at {price} using {amount}",
+                        end=", ",
+                    )
+                    client = await self._client.buy(symbol, type, amount, price)
+                if side == "sell":
+                    self._log(
+                        f"Attempting to place {type} sell order for {symbol} at {price} using {amount}",
+                        end=", ",
+                    )
+                    client = await self._client.sell(symbol, type, amount, price)
+            elif self._code == "future":
+                if side == "buy":
+                    self._log(
+                        f"Attempting to open long position with {type} long order for {symbol} at {price} using {amount} with stop loss at {sl} and take profit at {tp}",
+                        end=", ",
+                    )
+                    client = await self._client.long(
+                        symbol, type, amount, price, sl, tp
+                    )
+                if side == "sell":
+                    self._log(
+                        f"Attempting to open short position with {type} short order for {symbol} at {price} using {amount} with stop loss at {sl} and take profit at {tp}",
+                        end=", ",
+                    )
+                    client = await self._client.short(
+                        symbol, type, amount, price, sl, tp
+                    )
+            else:
+                raise InvalidCodeError("Wrong code")
+        except InvalidCodeError as e:
+            print(f"AsyncOrderClient failed to edit order: {e}")
+            print(
+                "\nPlease call proxy.codes() in order to retrieve the current market codes that are offered\n"
+            )
+            print(f"Codes: {self._pub_client.codes()}")
+        except NetworkError as e:
+            print(f"NetworkError - AsyncOrderClient failed to edit order: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - AsyncOrderClient failed to edit order: {e}")
+            raise
+        except Exception as e:
+            print(f"AsyncOrderClient failed to edit order: {e}")
+            raise
+        else:
+            self._order = deepcopy(client._order)
+            self._log("done.")
+
+    async def cancel(self):
+        """Cancel pending order
+
+        Raises:
+            OrderTypeError: Order type must be limit in order to cancel
+            NetworkError: AsyncOrderClient failed to cancel order for {symbol} with id {id}
+            ExchangeError: AsyncOrderClient failed to cancel order for {symbol} with id {id}
+            Exception: AsyncOrderClient failed to cancel order for {symbol} with id {id}
+        """
+        type = self.query("type")
+        if type == "market":
+            raise OrderTypeError("Order type must be limit in order to cancel")
+
+        id = self.query("id")
+        symbol = self.query("symbol")
+        data = None
+        try:
+            self._log(f"Attempting to cancel order for {symbol} with id {id}", end=", ")
+            # Cancel order
+            if not await self.closed():
+                data = await self._client.cancel(id, symbol)
+        except NetworkError as e:
+            print(
+                f"NetworkError - AsyncOrderClient failed to cancel order for {symbol} with id {id}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AsyncOrderClient failed to cancel order for {symbol} with id {id}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(
+                f"AsyncOrderClient failed to cancel order for {symbol} with id {id}: {e}"
+            )
+            raise
+        else:
+            self._log("done.")
+        finally:
+            # Update state
+            if data:
+                self._update(order_data=data, state="canceled")
+
+    async def status(self):
+        """Retrieve this order by id instead of looking for it in open orders
+
+        Raises:
+            NetworkError: AsyncOrderClient failed to retrieve order status
+            ExchangeError: AsyncOrderClient failed to retrieve order status
+            Exception: AsyncOrderClient failed to retrieve order status
+
+        Returns:
+            OrderStatus: State, filled amount and average price
+        """
+        id = self.query("id")
+        symbol = self.query("symbol")
+
+        status = None
+        try:
+            self._log(f"Attempting to retrieve status of order {id}", end=", ")
+            status = await self._client.order_status(id, symbol)
+        except NetworkError as e:
+            print(
+                f"NetworkError - AsyncOrderClient failed to retrieve order status: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AsyncOrderClient failed to retrieve order status: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"AsyncOrderClient failed to retrieve order status: {e}")
+            raise
+        else:
+            self._settle(status)
+            self._log("done.")
+
+        return status
+
+    def canceled(self):
+        """Check if order was canceled
+
+        Returns:
+            Bool: Order was successfully canceled
+        """
+        return self._state == "canceled"
+
+    async def pending(self):
+        """Check if order is still open
+
+        Raises:
+            NetworkError: AsyncOrderClient failed to check pending state
+            ExchangeError: AsyncOrderClient failed to check pending state
+            Exception: AsyncOrderClient failed to check pending state
+
+        Returns:
+            Bool: Order is still open
+        """
+        if self._local():
+            return self._state == "pending"
+
+        id = self.query("id")
+        symbol = self.query("symbol")
+        epoch = self._synced_epoch()
+
+        data = None
+        try:
+            self._log(f"Attempting to retrieve orders for {symbol}", end=", ")
+            data = await self._client.open_orders(symbol)
+        except NetworkError as e:
+            print(f"NetworkError - AsyncOrderClient failed to check pending state: {e}")
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AsyncOrderClient failed to check pending state: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"AsyncOrderClient failed to check pending state: {e}")
+            raise
+        else:
+            self._log("done.")
+        finally:
+            if data and id in data:
+                # Snapshot entries are shared with other clients
+                self._update(order_data=dict(data[id]), state="pending")
+                self._epoch = epoch
+
+        return self._state == "pending"
+
+    async def closed(self):
+        """Check if order was filled or cancelled
+
+        Raises:
+            NetworkError: AsyncOrderClient failed to check closed state
+            ExchangeError: AsyncOrderClient failed to check closed state
+            Exception: AsyncOrderClient failed to check closed state
+
+        Returns:
+            Bool: Order was filled or canceled, status() or canceled() tells which
+        """
+        if self._local():
+            return self._state in ["closed", "canceled"]
+
+        id = self.query("id")
+        symbol = self.query("symbol")
+        epoch = self._synced_epoch()
+
+        found = False
+        data = None
+        try:
+            self._log(f"Attempting to retrieve orders for {symbol}", end=", ")
+            data = await self._client.open_orders(symbol)
+        except NetworkError as e:
+            print(f"NetworkError - AsyncOrderClient failed to check closed state: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - AsyncOrderClient failed to check closed state: {e}")
+            raise
+        except Exception as e:
+            print(f"AsyncOrderClient failed to check closed state: {e}")
+            raise
+        else:
+            self._log("done.")
+        finally:
+            if data:
+                found = id in data
+
+            if not found and not self._final(id):
+                self._update(state="closed")
+            if data is not None:
+                self._epoch = epoch
+
+        if not found and not self._final(id):
+            # Gone from open orders, its own record tells filled from canceled
+            try:
+                self._settle(await self._client.order_status(id, symbol))
+            except OrderNotFound:
+                # Already purged by Phemex, counted as filled
+                pass
+
+        return self._state in ["closed", "canceled"]
+
+    async def retry(
+        self,
+        price: float = None,
+        sl_percent: int = None,
+        tp_percent: int = None,
+    ):
+        """Ensure limit order was successfully placed at current ask price, if None then will use current ask price
+
+        Args:
+            price (float): Price to retry order at. Defaults to None.
+            sl_percent: Set stop loss percent from price. Defaults to None.
+            tp_percent: Set take profit percent from price. Defaults to None.
+
+        Raises:
+            OrderTypeError: Order type must be limit in order to retry
+            NetworkError: AsyncOrderClient failed to retry
+            ExchangeError: AsyncOrderClient failed to retry
+            Exception: AsyncOrderClient failed to retry
+
+        Returns:
+            Bool: Order successfully placed
+        """
+        type = self.query("type")
+        if type == "market":
+            raise OrderTypeError("Order type must be limit in order to retry")
+
+        symbol = self.query("symbol")
+        amount = self.query("amount")
+
+        try:
+            if await self.pending():
+                # Reprice in place, amending keeps the order id and needs one request
+                self._log(f"Repricing order...")
+                await self.edit(
+                    amount=amount,
+                    price=(
+                        price if price else await self._pub_client.price(symbol=symbol)
+                    ),
+                    sl_percent=sl_percent,
+                    tp_percent=tp_percent,
+                )
+
+            # Canceled from outside or rejected at the new price, place it again
+            while not await self.pending() and await self.closed() and self.canceled():
+                self._log(f"Retrying order placement...")
+                await self.edit(
+                    amount=amount,
+                    price=(
+                        price if price else await self._pub_client.price(symbol=symbol)
+                    ),
+                    sl_percent=sl_percent,
+                    tp_percent=tp_percent,
+                )
+
+        except OrderFilledError:
+            # Filled while repricing, nothing left to place
+            pass
+        except InsufficientFunds:
+            print(
+                "InsufficientFundsError, more than likely tried to place order that was already closed"
+            )
+            pass
+        except NetworkError as e:
+            print(f"NetworkError - AsyncOrderClient failed to retry: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - AsyncOrderClient failed to retry: {e}")
+            raise
+        except Exception as e:
+            print(f"AsyncOrderClient failed to retry: {e}")
+            raise
+        else:
+            self._log("Order placed, done.")
+        finally:
+            await self.closed()
+
+        return True
+
+    async def close(
+        self,
+        retry: bool = False,
+        wait: int = 1,
+        price: float = None,
+        tries: int = 1,
+        sl_percent: int = None,
+        tp_percent: int = None,
+    ):
+        """Waits until order is filled
+
+        Args:
+            retry (bool): Ensure limit order was successfully placed at current ask price. Defaults to None.
+            wait (int): The amount of time to wait until retry. Defaults to 2 seconds.
+            price (float): Price to retry order at. Defaults to None (will use current market price).
+            tries (int): Number of times to retry. Defaults to 1.
+            sl_percent: Set stop loss percent from price. Defaults to None.
+            tp_percent: Set take profit percent from price. Defaults to None.
+
+        Raises:
+            OrderTypeError: Order type must be limit in order to close
+            NetworkError: AsyncOrderClient failed to close order
+            ExchangeError: AsyncOrderClient failed to close order
+            Exception: AsyncOrderClient failed to close order
+
+        Returns:
+            Bool: Order successfully filled
+        """
+        type = self.query("type")
+        if type == "market":
+            raise OrderTypeError("Order type must be limit in order to close")
+
+        self._log(
+            f"Waiting until order is filled is canceled after {tries} number of retries...",
+            end=", ",
+        )
+
+        closed = False
+        self._changed.clear()
+        backoff = Backoff()
+        try:
+            for _ in range(tries + 1):
+                end = monotonic() + wait
+                # Just placed or repriced, fills are most likely now
+                backoff.reset()
+                while not closed and end > monotonic():
+                    await self._wait(min(backoff.next(), end - monotonic()))
+                    closed = await self.closed()
+                if closed:
+                    closed = self._state == "closed"
+                    break
+
+                if retry:
+                    await self.retry(
+                        price=price, sl_percent=sl_percent, tp_percent=tp_percent
+                    )
+
+            if not closed and await self.pending():
+                await self.cancel()
+        except NetworkError as e:
+            print(f"NetworkError - AsyncOrderClient failed to close order: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - AsyncOrderClient failed to close order: {e}")
+            raise
+        except Exception as e:
+            print(f"AsyncOrderClient failed to close order: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return closed
+
+    def verbose(self):
+        """Turn on logging"""
+        self._verbose = True
+
+    def silent(self):
+        """Turn off logging"""
+        self._verbose = False
@@ -0,0 +1,798 @@
+"""Implements AsyncPublicClientInterface"""
+
+import asyncio
+import ccxt.async_support as ccxt_async
+
+from asyncio import sleep
+from ccxt import BadSymbol, NotSupported, NetworkError
+
+from phemexboy.interfaces.aio.public_interface import AsyncPublicClientInterface
+from phemexboy.api.markets import MarketCache, MARKETS
+from phemexboy.api.store import OhlcvStore, STORE
+from phemexboy.helpers.arrays import OhlcvBuffer, to_array, to_frame
+from phemexboy.helpers.orderbook import OrderBook
+from phemexboy.api.ws.book import OrderBookStream
+from phemexboy.api.ws.candles import CandleStream
+from phemexboy.api.ws.trades import TradeStream
+from phemexboy.api.public import TICKER_GROUPS
+from phemexboy.exceptions import (
+    InvalidCodeError,
+    InvalidSideError,
+    InvalidRequestError,
+)
+
+
+class AsyncPublicClient(AsyncPublicClientInterface):
+    def __init__(
+        self,
+        markets: MarketCache = MARKETS,
+        endpoint: object = None,
+        store: OhlcvStore = STORE,
+    ):
+        # Clients created without an endpoint own theirs and close it
+        self._owner = endpoint is None
+        self._endpoint = (
+            endpoint if endpoint else ccxt_async.phemex({"enableRateLimit": True})
+        )
+        self._markets = markets
+        self._store = store
+        self._streams = {}
+        self._trades = {}
+        self._candles = {}
+        # Start from the snapshot when one exists, avoiding the first download
+        self._markets.restore(self._endpoint)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _worker(self, task: object, *args):
+        """Runs task against current markets on the running event loop
+
+        Args:
+            task (object): Coroutine function to await
+
+        Raises:
+            Exception: Any
+
+        Returns:
+            Any: Result from task execution
+        """
+        try:
+            await self._markets.aload(self._endpoint)
+            return await task(*args)
+        except BadSymbol:
+            # Symbol may have been listed or delisted since markets were cached
+            self._markets.invalidate()
+            raise
+        except Exception:
+            raise
+
+    async def close(self):
+        """Close websocket streams, and the exchange session when this client owns it"""
+        for symbol in list(self._streams):
+            await self.unwatch_orderbook(symbol)
+        for symbol in list(self._trades):
+            await self.unwatch_trades(symbol)
+        if self._owner:
+            await self._endpoint.close()
+
+    async def refresh_markets(self):
+        """Download market metadata now instead of waiting for the cache to expire"""
+        await self._markets.arefresh(self._endpoint)
+
+    def timeframes(self):
+        """Retrieve all timeframes available for exchange
+
+        Returns:
+            List: All available timeframes
+        """
+        return self._endpoint.timeframes
+
+    def codes(self):
+        """A list of markets that the exchange offers
+
+        Returns:
+            List: Available markets
+        """
+        return ["future", "spot"]
+
+    def symbol(self, base: str, quote: str, code: str):
+        """Creates a symbol representing the asset pairing
+
+        Args:
+            base (str): Currency you are buying (ex. 'btc')
+            quote (str): Currency you are selling (ex. 'usd')
+            code (str): Market code (ex. 'spot')
+
+        Raises:
+            InvalidCode: Codes may be found by calling proxy.codes()
+
+        Returns:
+            String: Formatted base and quote currency symbol
+        """
+        if code not in self.codes():
+            raise InvalidCodeError()
+
+        base_curr = base.upper()
+        quote_curr = quote.upper()
+
+        if code == "spot":
+            if quote_curr == "USD":
+                quote_curr = "USDT"
+            return "s" + base_curr + quote_curr
+
+        if code == "future":
+            return base_curr + "/" + quote_curr + ":" + quote_curr
+
+    def _quoted(self, symbols: list):
+        """Keep the symbols whose ticker carries best bid and ask
+
+        Tickers of USDT and USDC settled perpetuals leave top of book out, their
+        24 hour ticker has no bid or ask field for ccxt to parse.
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+
+        Returns:
+            List: Symbols to read from tickers, the rest are read from the book
+        """
+        return [
+            symbol
+            for symbol in symbols
+            if self._endpoint.market(symbol)["settle"] not in ["USDT", "USDC"]
+        ]
+
+    async def _top(self, symbol: str):
+        """Fetch best bid and ask from the order book
+
+        Phemex has no depth 1 book, ccxt requests the 30 level book for spot and inverse
+        contracts and the full book for USDT and USDC settled perpetuals, one request per symbol.
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: symbol, bid, ask and timestamp
+        """
+        book = await self._endpoint.fetch_order_book(symbol, 1)
+        bid = book["bids"][0][0] if book["bids"] else None
+        ask = book["asks"][0][0] if book["asks"] else None
+        return {
+            "symbol": symbol,
+            "bid": bid,
+            "ask": ask,
+            "timestamp": book["timestamp"],
+        }
+
+    async def _bbo(self, symbol: str):
+        """Fetch best bid and ask using the smallest payload available
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: symbol, bid, ask and timestamp
+        """
+        if not self._quoted([symbol]):
+            return await self._top(symbol)
+
+        ticker = await self._endpoint.fetch_ticker(symbol)
+        if ticker["bid"] is None or ticker["ask"] is None:
+            # Top of book missing from this ticker anyway, use the order book
+            return await self._top(symbol)
+
+        return {
+            "symbol": symbol,
+            "bid": ticker["bid"],
+            "ask": ticker["ask"],
+            "timestamp": ticker["timestamp"],
+        }
+
+    async def bbo(self, symbol: str):
+        """Retrieve best bid and best ask of asset pair
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: symbol, bid, ask and timestamp
+        """
+        return await self._worker(self._bbo, symbol)
+
+    async def price(self, symbol: str, side: str = "ask"):
+        """Retrieve price of asset pair
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            side (str): Side of the book, 'ask' or 'bid'. Defaults to 'ask'.
+
+        Raises:
+            InvalidSideError: Side must be either "ask" or "bid"
+
+        Returns:
+            Float: Current best price on side for base currency
+        """
+        if side not in ["ask", "bid"]:
+            raise InvalidSideError('Side must be either "ask" or "bid"')
+
+        return (await self.bbo(symbol))[side]
+
+    def _groups(self, symbols: list):
+        """Split symbols by the ticker endpoint that serves them
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+
+        Returns:
+            Dictionary: Ticker group -> symbols
+        """
+        groups = {}
+        for symbol in symbols:
+            market = self._endpoint.market(symbol)
+            if market["spot"]:
+                group = "spot"
+            elif market["inverse"]:
+                group = "inverse"
+            else:
+                group = "linear"
+            groups.setdefault(group, []).append(symbol)
+        return groups
+
+    async def _group_tickers(self, group: str, symbols: list = None):
+        """Fetch every ticker of one group in a single request
+
+        Args:
+            group (str): Ticker group (ex. 'spot')
+            symbols (list): Symbols to keep, None keeps all. Defaults to None.
+
+        Returns:
+            Dictionary: Symbol -> ticker, None when the exchange can't serve the group at once
+        """
+        try:
+            return await self._endpoint.fetch_tickers(symbols, TICKER_GROUPS[group])
+        except NotSupported:
+            if symbols is None:
+                raise
+            return None
+
+    async def tickers(self, symbols: list = None):
+        """Retrieve tickers for many symbols with one request per market kind
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies, None for every market. Defaults to None.
+
+        Returns:
+            Dictionary: Symbol -> ticker
+        """
+        await self._markets.aload(self._endpoint)
+        if symbols is None:
+            groups = {group: None for group in TICKER_GROUPS}
+        else:
+            groups = self._groups(symbols)
+
+        results = await asyncio.gather(
+            *[
+                self._worker(self._group_tickers, group, group_symbols)
+                for group, group_symbols in groups.items()
+            ]
+        )
+
+        tickers = {}
+        missing = []
+        for (group, group_symbols), result in zip(groups.items(), results):
+            if result is None:
+                missing += group_symbols
+            else:
+                tickers.update(result)
+
+        # Fall back to one request per symbol, run concurrently under the rate limiter
+        fetched = await asyncio.gather(
+            *[self._worker(self._endpoint.fetch_ticker, symbol) for symbol in missing]
+        )
+        tickers.update(zip(missing, fetched))
+        return tickers
+
+    async def prices(self, symbols: list, side: str = "ask"):
+        """Retrieve prices for many symbols at once
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+            side (str): Side of the book, 'ask' or 'bid'. Defaults to 'ask'.
+
+        Raises:
+            InvalidSideError: Side must be either "ask" or "bid"
+
+        Returns:
+            Dictionary: Symbol -> current best price on side
+        """
+        if side not in ["ask", "bid"]:
+            raise InvalidSideError('Side must be either "ask" or "bid"')
+
+        await self._markets.aload(self._endpoint)
+        quoted = self._quoted(symbols)
+        tickers = await self.tickers(quoted) if quoted else {}
+        prices = {
+            symbol: tickers[symbol][side] for symbol in quoted if symbol in tickers
+        }
+
+        # Read the rest, and tickers missing top of book, from the order book
+        missing = [symbol for symbol in symbols if prices.get(symbol) is None]
+        books = await asyncio.gather(
+            *[self._worker(self._top, symbol) for symbol in missing]
+        )
+        for symbol, bbo in zip(missing, books):
+            prices[symbol] = bbo[side]
+
+        return prices
+
+    def _timestamp(self, date):
+        """Convert a date to a millisecond timestamp
+
+        Args:
+            date (str | int): YEAR-MONTH-DAY (ex. 2018-12-01), ISO 8601 datetime or millisecond timestamp
+
+        Returns:
+            Int: Millisecond timestamp, None if date is None
+        """
+        if date is None or isinstance(date, int):
+            return date
+        if len(date) == 10:
+            date += "T00:00:00Z"
+        return self._endpoint.parse8601(date)
+
+    async def _fetch_page(
+        self, symbol: str, tf: str, since: int, limit: int, tries: int
+    ):
+        """Fetch one page of candles, retrying network errors with backoff
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (int): Millisecond timestamp of the first candle
+            limit (int): Maximum number of candles in the page
+            tries (int): Attempts before giving up
+
+        Raises:
+            NetworkError: Page could not be fetched after tries attempts
+
+        Returns:
+            List: Candle data for the page
+        """
+        for attempt in range(tries):
+            try:
+                return await self._worker(
+                    self._endpoint.fetch_ohlcv, symbol, tf, since, limit
+                )
+            except NetworkError:
+                if attempt == tries - 1:
+                    raise
+                await sleep(2**attempt)
+
+    async def pageable(self, symbol: str):
+        """Check if Phemex serves candle history for symbol beyond the latest page
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Bool: OHLCV requests honour since
+        """
+        await self._markets.aload(self._endpoint)
+        market = self._endpoint.market(symbol)
+        return market["linear"] or market["settle"] in ["USDT", "USDC"]
+
+    async def _pages(
+        self,
+        symbol: str,
+        tf: str,
+        since: int,
+        until: int = None,
+        page_size: int = 1000,
+        tries: int = 3,
+    ):
+        """Walk forward from since in exchange sized pages
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (int): Millisecond timestamp of the first candle
+            until (int): Millisecond timestamp to stop before, None for now. Defaults to None.
+            page_size (int): Candles requested per page. Defaults to 1000.
+            tries (int): Attempts per page before giving up. Defaults to 3.
+
+        Yields:
+            List: Candles newer than the previous page, oldest first. Markets Phemex
+            can't page (spot and inverse future) yield their latest page only.
+        """
+        duration = self._endpoint.parse_timeframe(tf) * 1000
+        end = until if until else self._endpoint.milliseconds()
+        if not await self.pageable(symbol):
+            # Phemex only serves the latest candles of these markets
+            page = await self._fetch_page(symbol, tf, None, page_size, tries)
+            fresh = [candle for candle in page if since <= candle[0] < end]
+            if fresh:
+                yield fresh
+            return
+
+        cursor = since
+        last = None
+        while cursor < end:
+            page = await self._fetch_page(symbol, tf, cursor, page_size, tries)
+            if not page:
+                # Nothing traded in this window, skip past it
+                cursor += page_size * duration
+                continue
+
+            # Pages overlap at their edges, keep only candles not seen yet
+            fresh = [
+                candle
+                for candle in page
+                if (last is None or candle[0] > last) and candle[0] < end
+            ]
+            if not fresh:
+                # Caught up with the latest candle
+                break
+
+            yield fresh
+            last = fresh[-1][0]
+            cursor = last + duration
+
+    async def ohlcv(
+        self,
+        symbol: str,
+        tf: str,
+        since: str = None,
+        until: str = None,
+        backfill: bool = False,
+        progress: object = None,
+        cache: bool = False,
+        as_array: bool = False,
+        as_frame: bool = False,
+    ):
+        """Retrieve the open - high - low - close - volume data from exchange
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (str): Optional start date for retrieving OHLCV data, YEAR-MONTH-DAY (ex. 2018-12-01), Default is None.
+            until (str): Optional date to stop backfilling before, YEAR-MONTH-DAY. Defaults to now.
+            backfill (bool): Page forward from since until now instead of returning a single page. Defaults to False.
+            progress (object): Called as progress(candles, timestamp, end) after each backfilled page. Defaults to None.
+            cache (bool): Read from the local store after fetching only candles newer than the last stored one,
+                since is where an empty store starts. Defaults to False.
+            as_array (bool): Return a structured array with OHLCV dtype instead of lists. Defaults to False.
+            as_frame (bool): Return a pandas DataFrame indexed by open time instead of lists. Defaults to False.
+
+        Raises:
+            InvalidRequestError: Since is required to backfill
+            NetworkError: A page failed after retrying, call again with since set to the last timestamp reported by progress to resume
+            ImportError: pandas is required for as_frame
+
+        Returns:
+            List: Candle data for timeframe, Array or DataFrame when requested
+        """
+        since = self._timestamp(since)
+        until = self._timestamp(until)
+
+        if cache:
+            await self._store.aupdate(self, symbol, tf, since)
+            if as_frame:
+                read = self._store.frame
+            elif as_array:
+                read = self._store.array
+            else:
+                read = self._store.candles
+            # Reads the memory mapped files off the event loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, read, symbol, tf, since, until)
+
+        if not backfill:
+            # Get as much data as possible
+            limit = 1000000
+            candles = await self._worker(
+                self._endpoint.fetch_ohlcv, symbol, tf, since, limit
+            )
+            if as_frame:
+                return to_frame(to_array(candles))
+            if as_array:
+                return to_array(candles)
+            return candles
+
+        if since is None:
+            raise InvalidRequestError("Since is required to backfill")
+
+        end = until if until else self._endpoint.milliseconds()
+        if as_array or as_frame:
+            # Pages go straight into a typed buffer sized for the whole range
+            duration = self._endpoint.parse_timeframe(tf) * 1000
+            candles = OhlcvBuffer(min((end - since) // duration + 1, 1 << 20))
+        else:
+            candles = []
+
+        async for page in self._pages(symbol, tf, since, until):
+            candles.extend(page)
+            if progress:
+                progress(len(candles), page[-1][0], end)
+
+        if as_frame:
+            return to_frame(candles.array())
+        if as_array:
+            return candles.array()
+        return candles
+
+    async def iter_ohlcv(
+        self,
+        symbol: str,
+        tf: str,
+        since: str,
+        until: str = None,
+        page_size: int = 1000,
+        as_array: bool = False,
+    ):
+        """Yield candle pages as they arrive instead of collecting the whole range
+
+        The next page is fetched in a task while the current one is consumed.
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (str): Start date, YEAR-MONTH-DAY (ex. 2018-12-01)
+            until (str): Date to stop before, YEAR-MONTH-DAY. Defaults to now.
+            page_size (int): Candles requested per page. Defaults to 1000.
+            as_array (bool): Yield structured arrays with OHLCV dtype instead of lists. Defaults to False.
+
+        Raises:
+            InvalidRequestError: Since is required to iterate
+            NetworkError: A page failed after retrying
+
+        Yields:
+            List: Candles newer than the previous page, oldest first
+        """
+        since = self._timestamp(since)
+        until = self._timestamp(until)
+        if since is None:
+            raise InvalidRequestError("Since is required to iterate")
+
+        pages = self._pages(symbol, tf, since, until, page_size)
+
+        async def advance():
+            try:
+                return await pages.__anext__()
+            except StopAsyncIteration:
+                return None
+
+        pending = asyncio.ensure_future(advance())
+        try:
+            while True:
+                page = await pending
+                if page is None:
+                    return
+                pending = asyncio.ensure_future(advance())
+                yield to_array(page) if as_array else page
+        finally:
+            # Let a running prefetch finish before closing the pages it is reading
+            try:
+                await pending
+            except Exception:
+                pass
+            await pages.aclose()
+
+    async def repair(self, symbol: str, tf: str, since: str = None, until: str = None):
+        """Refetch only the windows missing from the stored candles of symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the stored candles
+            since (str): Date the series should start at, YEAR-MONTH-DAY (ex. 2018-12-01). Defaults to None.
+            until (str): Date the series should reach, YEAR-MONTH-DAY. Defaults to None.
+
+        Returns:
+            Int: Number of candles added to the store, windows Phemex has no candles for stay missing
+        """
+        since = self._timestamp(since)
+        until = self._timestamp(until)
+        duration = self._endpoint.parse_timeframe(tf) * 1000
+
+        # Store reads and the splice run off the event loop
+        loop = asyncio.get_running_loop()
+        windows = await loop.run_in_executor(
+            None, self._store.gaps, symbol, tf, since, until
+        )
+
+        candles = []
+        for start, end in windows.tolist():
+            # Ask for no more candles than the window holds
+            size = min((end - start) // duration + 1, 1000)
+            async for page in self._pages(symbol, tf, start, end, page_size=size):
+                candles += page
+
+        # Splice every window at once, a splice rewrites the whole series
+        return await loop.run_in_executor(None, self._store.splice, symbol, tf, candles)
+
+    async def currencies(self):
+        """Retrieve all currencies the exchange offers
+
+        Returns:
+            Dictionary: All exchange currencies
+        """
+        # Currencies are downloaded along with markets
+        await self._markets.aload(self._endpoint)
+        return self._markets.currencies()
+
+    async def status(self):
+        """Retrieve the current network status of exchange
+
+        Returns:
+            Dictionary: Current exchange status
+        """
+        return await self._worker(self._endpoint.fetch_status)
+
+    async def _book(self, symbol: str, depth: int, info: bool):
+        """Fetch the raw book and parse only the levels asked for
+
+        Follows ccxt's fetch_order_book endpoint choice, trimming before parsing.
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            depth (int): Levels per side to keep, None for all
+            info (bool): Keep the raw exchange response
+
+        Returns:
+            OrderBook: Current orderbook for symbol
+        """
+        endpoint = self._endpoint
+        market = endpoint.market(symbol)
+        request = {"symbol": market["id"]}
+        if market["linear"] and market["settle"] in ["USDT", "USDC"]:
+            response = await endpoint.v2GetMdV2Orderbook(request)
+        elif depth is not None and depth <= 30:
+            # Phemex serves a 30 level book, much smaller than the full book
+            response = await endpoint.v1GetMdOrderbook(request)
+        else:
+            response = await endpoint.v1GetMdFullbook(request)
+
+        result = endpoint.safe_dict(response, "result", {})
+        book = dict(endpoint.safe_dict_2(result, "book", "orderbook_p", {}))
+        if depth is not None:
+            book["bids"] = book.get("bids", [])[:depth]
+            book["asks"] = book.get("asks", [])[:depth]
+
+        timestamp = endpoint.safe_integer_product(result, "timestamp", 0.000001)
+        data = endpoint.custom_parse_order_book(
+            book, symbol, timestamp, "bids", "asks", 0, 1, market
+        )
+        return OrderBook(
+            symbol,
+            data["bids"],
+            data["asks"],
+            timestamp,
+            endpoint.safe_integer(result, "sequence"),
+            response if info else None,
+        )
+
+    async def orderbook(self, symbol: str, depth: int = None, info: bool = False):
+        """Retrieve orderbook for symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            depth (int): Levels per side to return, 30 or less uses Phemex's smaller book. Defaults to None (all).
+            info (bool): Include the raw exchange response as info. Defaults to False.
+
+        Returns:
+            OrderBook: Current orderbook for symbol, reads like the ccxt dictionary
+        """
+        stream = self._streams.get(symbol)
+        if stream is not None and stream.synced and not info:
+            try:
+                # Served from the websocket book, no request needed
+                return stream.orderbook(depth)
+            except NetworkError:
+                # Sync dropped since the check, fetch the book instead
+                pass
+        return await self._worker(self._book, symbol, depth, info)
+
+    async def watch_orderbook(self, symbol: str, timeout: float = 10):
+        """Keep the orderbook for symbol current over a websocket, orderbook() then reads it locally
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            timeout (float): Seconds to wait for the first snapshot. Defaults to 10.
+
+        Raises:
+            NetworkError: No snapshot within timeout
+
+        Returns:
+            OrderBookStream: Stream keeping the book current
+        """
+        stream = self._streams.get(symbol)
+        if stream is None:
+            stream = OrderBookStream(symbol, self._markets, self._endpoint)
+            await stream.astart()
+            self._streams[symbol] = stream
+        if not await stream.aready(timeout):
+            raise NetworkError(f"No orderbook snapshot for {symbol} within {timeout}s")
+        return stream
+
+    async def watch_trades(
+        self, symbol: str, capacity: int = 100000, timeout: float = 10
+    ):
+        """Stream public trades for symbol into a preallocated ring buffer
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            capacity (int): Trades kept before the oldest is overwritten. Defaults to 100000.
+            timeout (float): Seconds to wait for the first trades. Defaults to 10.
+
+        Raises:
+            NetworkError: No trades within timeout
+
+        Returns:
+            TradeStream: Stream holding the latest trades, read them with latest(n)
+        """
+        stream = self._trades.get(symbol)
+        if stream is None:
+            stream = TradeStream(
+                symbol, self._markets, self._endpoint, capacity=capacity
+            )
+            await stream.astart()
+            self._trades[symbol] = stream
+        if not await stream.aready(timeout):
+            raise NetworkError(f"No trades for {symbol} within {timeout}s")
+        return stream
+
+    async def watch_candles(self, symbol: str, tfs: list, timeout: float = 10):
+        """Build candles for symbol from its trade stream, storing them as they close
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tfs (list): Timeframes to build (ex. ['1m', '1h'])
+            timeout (float): Seconds to wait for the first trades. Defaults to 10.
+
+        Raises:
+            NetworkError: No trades within timeout
+
+        Returns:
+            CandleStream: Stream firing listeners as candles close, partial(tf) reads the open one
+        """
+        key = (symbol, tuple(tfs))
+        stream = self._candles.get(key)
+        if stream is None:
+            trades = await self.watch_trades(symbol, timeout=timeout)
+            stream = CandleStream(trades, tfs, self, self._store)
+            await stream.astart()
+            self._candles[key] = stream
+        return stream
+
+    async def unwatch_candles(self, symbol: str):
+        """Stop building candles for symbol, the trade stream keeps running
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+        """
+        for key in [key for key in self._candles if key[0] == symbol]:
+            stream = self._candles.pop(key)
+            await stream.aclose()
+
+    async def unwatch_trades(self, symbol: str):
+        """Close the trade stream for symbol and the candles built from it
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+        """
+        await self.unwatch_candles(symbol)
+        stream = self._trades.pop(symbol, None)
+        if stream is not None:
+            await stream.aclose()
+
+    async def unwatch_orderbook(self, symbol: str):
+        """Close the websocket book for symbol, orderbook() requests it again
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+        """
+        stream = self._streams.pop(symbol, None)
+        if stream is not None:
+            await stream.aclose()
@@ -1,12 +1,19 @@
 """Implements AuthClientInterface"""
 
 import os
-import ccxt
+import weakref
 
-from botboy.core import BotBoy
+from ccxt import BadSymbol, ExchangeError, NetworkError
 from phemexboy.interfaces.auth.client_interface import AuthClientInterface
+from phemexboy.api.markets import MarketCache, MARKETS
+from phemexboy.api.orders import OpenOrders, OrderStatus
+from phemexboy.api.session import SESSIONS
+from phemexboy.api.pool import WorkerPool, POOL
+from phemexboy.api.public import PublicClient
 from phemexboy.api.auth.order import OrderClient
 from phemexboy.api.auth.position import PositionClient
+from phemexboy.api.ws.account import AccountStream
+from phemexboy.api.ws.connection import WS_URL
 from phemexboy.exceptions import InvalidCodeError
 from dotenv import load_dotenv
 
@@ -14,17 +21,53 @@ load_dotenv()
 
 
 class AuthClient(AuthClientInterface):
-    def __init__(self):
-        self._endpoint = ccxt.phemex(
-            {
-                "apiKey": os.getenv("KEY"),
-                "secret": os.getenv("SECRET"),
-                "enableRateLimit": True,
-            }
+    def __init__(
+        self,
+        markets: MarketCache = MARKETS,
+        endpoint: object = None,
+        pool: WorkerPool = POOL,
+        open_orders: OpenOrders = None,
+    ):
+        # Share one session and rate limiter with every client using this key
+        self._endpoint = (
+            endpoint
+            if endpoint
+            else SESSIONS.endpoint(os.getenv("KEY"), os.getenv("SECRET"))
         )
+        self._markets = markets
+        self._pool = pool
+        # Handed to every OrderClient instead of each creating its own
+        self._pub_client = PublicClient(markets, self._endpoint, pool)
+        self._account = None
+        self._live = weakref.WeakSet()
+        self._open_orders = open_orders if open_orders else OpenOrders()
+        # Start from the snapshot when one exists, avoiding the first download
+        self._markets.restore(self._endpoint)
+
+    def _call(self, task: object, *args):
+        """Runs task against current markets
+
+        Args:
+            task (object): Method to execute
+
+        Raises:
+            Exception: Any
+
+        Returns:
+            Any: Result from task execution
+        """
+        try:
+            self._markets.load(self._endpoint)
+            return task(*args)
+        except BadSymbol:
+            # Symbol may have been listed or delisted since markets were cached
+            self._markets.invalidate()
+            raise
+        except Exception:
+            raise
 
     def _worker(self, task: object, *args):
-        """Runs tasks on separate thread
+        """Runs tasks on the shared worker pool and waits for the result
 
         Args:
             task (object): Method to execute on separate thread
@@ -35,13 +78,78 @@ class AuthClient(AuthClientInterface):
         Returns:
             Any: Result from task execution
         """
+        return self._pool.run(self._call, task, *args)
+
+    def submit(self, method: str, *args, **kwargs):
+        """Run a client method on the shared worker pool without waiting
+
+        Args:
+            method (str): Name of the client method (ex. 'price')
+
+        Returns:
+            Future: Resolves to the result of the method
+        """
+        return self._pool.submit(getattr(self, method), *args, **kwargs)
+
+    def refresh_markets(self):
+        """Download market metadata now instead of waiting for the cache to expire"""
+        self._markets.refresh(self._endpoint)
+
+    def _track(self, client: object):
+        """Remember a new client and have the account stream push into it
+
+        Args:
+            client (object): OrderClient or PositionClient
+
+        Returns:
+            Object: The same client
+        """
+        self._live.add(client)
+        if self._account is not None:
+            self._account.track(client)
+        return client
+
+    def watch_account(self, timeout: float = 10, url: str = WS_URL):
+        """Push order, fill and position updates from Phemex's private websocket into every OrderClient and PositionClient
+
+        Once synced, pending() and closed() read the pushed state instead of requesting open orders,
+        and close() returns as soon as a fill arrives.
+
+        Args:
+            timeout (float): Seconds to wait for login and subscription. Defaults to 10.
+            url (str): Websocket endpoint, testnet is wss://testnet.phemex.com/ws. Defaults to WS_URL.
+
+        Raises:
+            NetworkError: Not subscribed within timeout
+            ExchangeError: Phemex rejected the login
+
+        Returns:
+            AccountStream: Stream pushing the updates
+        """
+        if self._account is None:
+            self._account = AccountStream(self._endpoint, self._markets, url)
+            self._account.start()
+            for client in list(self._live):
+                self._account.track(client)
         try:
-            self._endpoint.load_markets(reload=True)
-            worker = BotBoy(name='AuthWorker', task=task, params=args)
-            result = worker.execute()
-            return result
-        except Exception:
+            synced = self._account.ready(timeout)
+        except ExchangeError:
+            # Login rejected, stop retrying with the same key
+            self.unwatch_account()
             raise
+        if not synced:
+            raise NetworkError(f"Account stream not subscribed within {timeout}s")
+        return self._account
+
+    def unwatch_account(self):
+        """Close the private websocket, OrderClient and PositionClient request their state again"""
+        account, self._account = self._account, None
+        if account is not None:
+            account.close()
+
+    def close(self):
+        """Close the account stream, the shared exchange session stays open"""
+        self.unwatch_account()
 
     def leverage(self, amount: int, symbol: str):
         """Set future account leverage
@@ -66,6 +174,20 @@ class AuthClient(AuthClientInterface):
         """
         return self._worker(self._endpoint.fetch_open_orders, symbol)
 
+    def open_orders(self, symbol: str):
+        """Retrieve open orders for symbol from a snapshot shared by every order client
+
+        Open orders are requested at most once per ttl of the OpenOrders registry,
+        placing or canceling an order for symbol requests them again.
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: Open orders by id, shared and must not be modified
+        """
+        return self._open_orders.get(self.orders, symbol)
+
     def cancel(self, id: str, symbol: str):
         """Cancel open order
 
@@ -76,7 +198,63 @@ class AuthClient(AuthClientInterface):
         Returns:
             Dictionary: Order data
         """
-        return self._worker(self._endpoint.cancel_order, id, symbol)
+        try:
+            return self._worker(self._endpoint.cancel_order, id, symbol)
+        finally:
+            self._open_orders.invalidate(symbol)
+
+    def amend(
+        self,
+        id: str,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: float,
+        config: dict = {},
+    ):
+        """Amend open order in place, keeping its id and place in the book
+
+        Args:
+            id (str): Order id
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            side (str): Side of order ('buy' or 'sell')
+            amount (float): New amount of base currency
+            price (float): New limit order price
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NotSupported: Exchange cannot amend orders
+            OrderNotFound: Order is no longer open
+
+        Returns:
+            Dictionary: Order data
+        """
+        try:
+            return self._worker(
+                self._endpoint.edit_order, id, symbol, type, side, amount, price, config
+            )
+        finally:
+            self._open_orders.invalidate(symbol)
+
+    def order_status(self, id: str, symbol: str, client_id: str = None):
+        """Retrieve the state of a single order by id or client order id
+
+        Args:
+            id (str): Order id, ignored when client_id is given
+            symbol (str): Created symbol for base and quote currencies
+            client_id (str): Client order id set when placing the order. Defaults to None.
+
+        Raises:
+            OrderNotFound: No order with id or client_id for symbol
+
+        Returns:
+            OrderStatus: State, filled amount and average price
+        """
+        params = {"clOrdID": client_id} if client_id else {}
+        order = self._worker(self._endpoint.fetch_order, id, symbol, params)
+        return OrderStatus.parse(order)
 
     def balance(self, currency: str, code: str):
         """Retrieve the balance of an asset on exchange
@@ -125,11 +303,13 @@ class AuthClient(AuthClientInterface):
             self._endpoint.create_order, symbol, type, "buy", amount, price, params
         )
 
+        self._open_orders.invalidate(symbol)
+
         code = "spot"
         if "type" in params.keys() and params["type"] == "swap":
             code = "future"
 
-        return OrderClient(data, self, code)
+        return self._track(OrderClient(data, self, code, pub_client=self._pub_client))
 
     def sell(
         self,
@@ -157,11 +337,13 @@ class AuthClient(AuthClientInterface):
             self._endpoint.create_order, symbol, type, "sell", amount, price, params
         )
 
+        self._open_orders.invalidate(symbol)
+
         code = "spot"
         if "type" in params.keys() and params["type"] == "swap":
             code = "future"
 
-        return OrderClient(data, self, code)
+        return self._track(OrderClient(data, self, code, pub_client=self._pub_client))
 
     def position(self, symbol: str):
         """Create a PositionClient representing the open position for symbol
@@ -173,7 +355,7 @@ class AuthClient(AuthClientInterface):
             PositionClient: Represents open position and allows for interaction
         """
         data = self._worker(self._endpoint.fetch_positions, [symbol])
-        return PositionClient(data[0], self)
+        return self._track(PositionClient(data[0], self))
 
     def long(
         self,
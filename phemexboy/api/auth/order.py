@@ -1,15 +1,24 @@
 """Implements OrderClientInterface"""
 
-from ccxt.base.errors import InsufficientFunds
+from ccxt.base.errors import InsufficientFunds, NotSupported, OrderNotFound
 
 from phemexboy.interfaces.auth.order_interface import OrderClientInterface
 from phemexboy.interfaces.auth.client_interface import AuthClientInterface
+from phemexboy.interfaces.public_interface import PublicClientInterface
 from phemexboy.api.public import PublicClient
-from phemexboy.exceptions import OrderTypeError, InvalidRequestError, InvalidCodeError
+from phemexboy.api.orders import OrderStatus, order_state
+from phemexboy.api.scheduler import Backoff, SCHEDULER
+from phemexboy.exceptions import (
+    OrderTypeError,
+    OrderFilledError,
+    InvalidRequestError,
+    InvalidCodeError,
+)
 from phemexboy.helpers.conversions import stop_loss, take_profit
 
 from copy import deepcopy
-from time import sleep
+from threading import Event
+from time import monotonic
 from ccxt import NetworkError, ExchangeError
 
 
@@ -20,12 +29,21 @@ class OrderClient(OrderClientInterface):
         client: AuthClientInterface,
         code: str,
         verbose: bool = False,
+        pub_client: PublicClientInterface = None,
     ):
         self._verbose = verbose
         self._code = code
         self._update(order_data=order_data, state="None")
         self._client = client
-        self._pub_client = PublicClient()
+        self._pub_client = pub_client if pub_client else PublicClient()
+        # Set by the account stream whenever it pushes an update
+        self._changed = Event()
+        self._epoch = None
+        # Last status fetched by id
+        self._status = None
+        # Steps of a close() in progress, woken by pushed updates
+        self._scheduler = SCHEDULER
+        self._steps = None
 
     def __str__(self):
         out = ""
@@ -73,6 +91,59 @@ class OrderClient(OrderClientInterface):
             self._state = state
             self._log("done.")
 
+    def _push(self, order: dict):
+        """Apply an update pushed by the account stream
+
+        Args:
+            order (dict): Parsed order
+        """
+        self._update(order_data=order, state=order_state(order["status"]))
+        self._changed.set()
+        if self._steps is not None:
+            # Check straight away instead of at the scheduled time
+            self._scheduler.wake(self._steps)
+
+    def _settle(self, status: OrderStatus):
+        """Apply a status fetched by id
+
+        Args:
+            status (OrderStatus): Status of this order
+        """
+        self._status = status
+        for key in ["filled", "remaining", "average"]:
+            self._order[key] = getattr(status, key)
+        self._update(state=status.state)
+
+    def _final(self, id: str):
+        """Check if a fetched status already tells how order id ended
+
+        Args:
+            id (str): Order id
+
+        Returns:
+            Bool: Order id is known to be filled or canceled
+        """
+        status = self._status
+        return status is not None and status.id == id and status.state != "pending"
+
+    def _local(self):
+        """Check if the account stream has pushed every update since the last REST check
+
+        Returns:
+            Bool: State may be read without a request
+        """
+        account = getattr(self._client, "_account", None)
+        return account is not None and self._state != "None" and account.current(self)
+
+    def _synced_epoch(self):
+        """Account stream subscription a REST check is current for
+
+        Returns:
+            Int: Epoch of the synced stream, None without one
+        """
+        account = getattr(self._client, "_account", None)
+        return account.epoch if account is not None and account.synced else None
+
     def requests(self):
         """Returns a list of all request params
 
@@ -119,6 +190,10 @@ class OrderClient(OrderClientInterface):
     ):
         """Edit pending order
 
+        The order is amended in place when possible, otherwise it is canceled and placed again.
+        An order that was canceled is placed again, an order that already filled raises
+        instead of opening a second one.
+
         Args:
             amount (float): Amount of base currency you are using for order
             price (float): Edit limit order price
@@ -127,6 +202,7 @@ class OrderClient(OrderClientInterface):
 
         Raises:
             OrderTypeError: Order type must be limit in order to edit
+            OrderFilledError: Order already filled, there is nothing left to edit
             NetworkError: OrderClient failed to edit order
             ExchangeError: OrderClient failed to edit order
             Exception: OrderClient failed to edit order
@@ -147,9 +223,41 @@ class OrderClient(OrderClientInterface):
             f"Attempting to edit order with {amount} amount at price {price}", end=", "
         )
 
+        # Amend in place, one request that keeps the order id and its queue position
+        # Stop loss and take profit are only set when placing, so those edits replace
+        if sl_percent is None and tp_percent is None:
+            id = self.query("id")
+            data = None
+            try:
+                data = self._client.amend(id, symbol, type, side, amount, price)
+            except (NotSupported, OrderNotFound):
+                # No amend for this market, or the order is no longer open to amend
+                pass
+            except NetworkError as e:
+                print(f"NetworkError - OrderClient failed to edit order: {e}")
+                raise
+            except ExchangeError as e:
+                print(f"ExchangeError - OrderClient failed to edit order: {e}")
+                raise
+            except Exception as e:
+                print(f"OrderClient failed to edit order: {e}")
+                raise
+            else:
+                self._update(order_data=data, state=order_state(data["status"]))
+                self._log("done.")
+                return
+
         # Reopen order
         if self.pending():
             self.cancel()
+        else:
+            # Tells a canceled order from a filled one
+            self.closed()
+        if self._state == "closed":
+            # Placing again would open a second position
+            raise OrderFilledError(
+                "Order already filled, there is nothing left to edit"
+            )
 
         # Format sl and tp
         sl = None
@@ -259,6 +367,39 @@ class OrderClient(OrderClientInterface):
             if data:
                 self._update(order_data=data, state="canceled")
 
+    def status(self):
+        """Retrieve this order by id instead of looking for it in open orders
+
+        Raises:
+            NetworkError: OrderClient failed to retrieve order status
+            ExchangeError: OrderClient failed to retrieve order status
+            Exception: OrderClient failed to retrieve order status
+
+        Returns:
+            OrderStatus: State, filled amount and average price
+        """
+        id = self.query("id")
+        symbol = self.query("symbol")
+
+        status = None
+        try:
+            self._log(f"Attempting to retrieve status of order {id}", end=", ")
+            status = self._client.order_status(id, symbol)
+        except NetworkError as e:
+            print(f"NetworkError - OrderClient failed to retrieve order status: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - OrderClient failed to retrieve order status: {e}")
+            raise
+        except Exception as e:
+            print(f"OrderClient failed to retrieve order status: {e}")
+            raise
+        else:
+            self._settle(status)
+            self._log("done.")
+
+        return status
+
     def canceled(self):
         """Check if order was canceled
 
@@ -278,13 +419,17 @@ class OrderClient(OrderClientInterface):
         Returns:
             Bool: Order is still open
         """
+        if self._local():
+            return self._state == "pending"
+
         id = self.query("id")
         symbol = self.query("symbol")
+        epoch = self._synced_epoch()
 
         data = None
         try:
             self._log(f"Attempting to retrieve orders for {symbol}", end=", ")
-            data = self._client.orders(symbol)
+            data = self._client.open_orders(symbol)
         except NetworkError as e:
             print(f"NetworkError - OrderClient failed to check pending state: {e}")
             raise
@@ -297,11 +442,10 @@ class OrderClient(OrderClientInterface):
         else:
             self._log("done.")
         finally:
-            if data:
-                for order in data:
-                    if order["id"] == id:
-                        self._update(order_data=order, state="pending")
-                        break
+            if data and id in data:
+                # Snapshot entries are shared with other clients
+                self._update(order_data=dict(data[id]), state="pending")
+                self._epoch = epoch
 
         return self._state == "pending"
 
@@ -314,16 +458,20 @@ class OrderClient(OrderClientInterface):
             Exception: OrderClient failed to check closed state
 
         Returns:
-            Bool: Order was successfully filled
+            Bool: Order was filled or canceled, status() or canceled() tells which
         """
+        if self._local():
+            return self._state in ["closed", "canceled"]
+
         id = self.query("id")
         symbol = self.query("symbol")
+        epoch = self._synced_epoch()
 
         found = False
         data = None
         try:
             self._log(f"Attempting to retrieve orders for {symbol}", end=", ")
-            data = self._client.orders(symbol)
+            data = self._client.open_orders(symbol)
         except NetworkError as e:
             print(f"NetworkError - OrderClient failed to check closed state: {e}")
             raise
@@ -337,14 +485,22 @@ class OrderClient(OrderClientInterface):
             self._log("done.")
         finally:
             if data:
-                for res in data:
-                    if res["id"] == id:
-                        found = True
+                found = id in data
 
-            if not found:
+            if not found and not self._final(id):
                 self._update(state="closed")
+            if data is not None:
+                self._epoch = epoch
+
+        if not found and not self._final(id):
+            # Gone from open orders, its own record tells filled from canceled
+            try:
+                self._settle(self._client.order_status(id, symbol))
+            except OrderNotFound:
+                # Already purged by Phemex, counted as filled
+                pass
 
-        return self._state == "closed"
+        return self._state in ["closed", "canceled"]
 
     def retry(
         self,
@@ -372,27 +528,33 @@ class OrderClient(OrderClientInterface):
         if type == "market":
             raise OrderTypeError("Order type must be limit in order to retry")
 
-        if self.pending():
-            self.cancel()
-
         symbol = self.query("symbol")
         amount = self.query("amount")
 
         try:
-            while not self.pending() and self.closed():
-                self._log(f"Retrying order placement...")
+            if self.pending():
+                # Reprice in place, amending keeps the order id and needs one request
+                self._log(f"Repricing order...")
                 self.edit(
                     amount=amount,
-                    price=price,
+                    price=price if price else self._pub_client.price(symbol=symbol),
                     sl_percent=sl_percent,
                     tp_percent=tp_percent,
-                ) if price else self.edit(
+                )
+
+            # Canceled from outside or rejected at the new price, place it again
+            while not self.pending() and self.closed() and self.canceled():
+                self._log(f"Retrying order placement...")
+                self.edit(
                     amount=amount,
-                    price=self._pub_client.price(symbol=symbol),
+                    price=price if price else self._pub_client.price(symbol=symbol),
                     sl_percent=sl_percent,
                     tp_percent=tp_percent,
                 )
 
+        except OrderFilledError:
+            # Filled while repricing, nothing left to place
+            pass
         except InsufficientFunds:
             print(
                 "InsufficientFundsError, more than likely tried to place order that was already closed"
@@ -414,6 +576,80 @@ class OrderClient(OrderClientInterface):
 
         return True
 
+    def _closing(
+        self,
+        retry: bool,
+        wait: float,
+        price: float,
+        tries: int,
+        sl_percent: int,
+        tp_percent: int,
+        backoff: Backoff,
+    ):
+        """Steps of close, yields seconds until the next check
+
+        Checks start fast and back off while the order rests, each of the tries + 1
+        windows lasts wait seconds and ends with a retry when asked for.
+
+        Returns:
+            Bool: Order successfully filled
+        """
+        for _ in range(tries + 1):
+            end = monotonic() + wait
+            # Just placed or repriced, fills are most likely now
+            backoff.reset()
+            while True:
+                remaining = end - monotonic()
+                if remaining <= 0:
+                    break
+                yield min(backoff.next(), remaining)
+                if self.closed():
+                    return self._state == "closed"
+
+            if retry:
+                self.retry(price=price, sl_percent=sl_percent, tp_percent=tp_percent)
+
+        if self.pending():
+            self.cancel()
+        return False
+
+    def schedule_close(
+        self,
+        retry: bool = False,
+        wait: int = 1,
+        price: float = None,
+        tries: int = 1,
+        sl_percent: int = None,
+        tp_percent: int = None,
+    ):
+        """Wait for the fill on the shared scheduler without blocking, see close()
+
+        One scheduler thread times the checks of every order being closed,
+        so many orders can be closed at once without a thread each.
+
+        Args:
+            retry (bool): Ensure limit order was successfully placed at current ask price. Defaults to None.
+            wait (int): The amount of time to wait until retry. Defaults to 1 second.
+            price (float): Price to retry order at. Defaults to None (will use current market price).
+            tries (int): Number of times to retry. Defaults to 1.
+            sl_percent: Set stop loss percent from price. Defaults to None.
+            tp_percent: Set take profit percent from price. Defaults to None.
+
+        Raises:
+            OrderTypeError: Order type must be limit in order to close
+
+        Returns:
+            Future: Resolves to True once filled, False when canceled or still open after every try
+        """
+        type = self.query("type")
+        if type == "market":
+            raise OrderTypeError("Order type must be limit in order to close")
+
+        self._steps = self._closing(
+            retry, wait, price, tries, sl_percent, tp_percent, Backoff()
+        )
+        return self._scheduler.submit(self._steps)
+
     def close(
         self,
         retry: bool = False,
@@ -425,9 +661,12 @@ class OrderClient(OrderClientInterface):
     ):
         """Waits until order is filled
 
+        The order is checked soon after each placement and less often while it rests,
+        updates pushed by the account stream end a wait early.
+
         Args:
             retry (bool): Ensure limit order was successfully placed at current ask price. Defaults to None.
-            wait (int): The amount of time to wait until retry. Defaults to 2 seconds.
+            wait (int): The amount of time to wait until retry. Defaults to 1 second.
             price (float): Price to retry order at. Defaults to None (will use current market price).
             tries (int): Number of times to retry. Defaults to 1.
             sl_percent: Set stop loss percent from price. Defaults to None.
@@ -451,24 +690,13 @@ class OrderClient(OrderClientInterface):
             end=", ",
         )
 
-        i = 0
         closed = False
+        self._changed.clear()
+        self._steps = self._closing(
+            retry, wait, price, tries, sl_percent, tp_percent, Backoff()
+        )
         try:
-            while i <= tries:
-                sleep(wait)
-
-                if self.closed():
-                    closed = True
-                    break
-
-                if retry and not self.closed():
-                    self.retry(
-                        price=price, sl_percent=sl_percent, tp_percent=tp_percent)
-
-                i += 1
-
-            if not closed and self.pending():
-                self.cancel()
+            closed = self._scheduler.run(self._steps, self._changed)
         except NetworkError as e:
             print(f"NetworkError - OrderClient failed to close order: {e}")
             raise
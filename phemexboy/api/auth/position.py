@@ -95,6 +95,15 @@ class PositionClient(PositionClientInterface):
             return True
         return False
 
+    def _push(self, position: dict):
+        """Apply an update pushed by the account stream
+
+        Args:
+            position (dict): Parsed position
+        """
+        state = "closed" if not position["contracts"] else "open"
+        self._update(position_data=position, state=state)
+
     def requests(self):
         """Returns a list of all request params
 
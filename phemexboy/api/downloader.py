@@ -0,0 +1,128 @@
+"""Parallel OHLCV downloads split into time shards"""
+
+import threading
+import ccxt
+
+from phemexboy.api.public import PublicClient
+from phemexboy.api.pool import WorkerPool, POOL
+
+
+class OhlcvDownloader:
+    def __init__(
+        self,
+        client: PublicClient = None,
+        pool: WorkerPool = POOL,
+        shard_size: int = 5000,
+    ):
+        self._client = client if client else PublicClient()
+        self._pool = pool
+        self._shard_size = shard_size
+
+    def _timestamp(self, date):
+        """Convert a date to a millisecond timestamp
+
+        Args:
+            date (str | int): YEAR-MONTH-DAY (ex. 2018-12-01), ISO 8601 datetime or millisecond timestamp
+
+        Returns:
+            Int: Millisecond timestamp, now if date is None
+        """
+        if date is None:
+            return ccxt.Exchange.milliseconds()
+        if isinstance(date, int):
+            return date
+        if len(date) == 10:
+            date += "T00:00:00Z"
+        return ccxt.Exchange.parse8601(date)
+
+    def _shards(self, tf: str, since: int, until: int):
+        """Split a time range into shards of at most shard_size candles
+
+        Args:
+            tf (str): Timeframe of the candles
+            since (int): Millisecond timestamp of the first candle
+            until (int): Millisecond timestamp to stop before
+
+        Returns:
+            List: (start, end) millisecond ranges, oldest first
+        """
+        width = ccxt.Exchange.parse_timeframe(tf) * 1000 * self._shard_size
+        return [
+            (start, min(start + width, until)) for start in range(since, until, width)
+        ]
+
+    def _fetch(self, symbol: str, tf: str, start: int, end: int):
+        """Backfill one shard
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            start (int): Millisecond timestamp of the first candle
+            end (int): Millisecond timestamp to stop before
+
+        Returns:
+            List: Candle data for the shard
+        """
+        return self._client.ohlcv(symbol, tf, since=start, until=end, backfill=True)
+
+    def download(
+        self,
+        symbols: list,
+        tfs: list,
+        since: str,
+        until: str = None,
+        progress: object = None,
+    ):
+        """Download candles for every symbol and timeframe concurrently
+
+        Shards run on the worker pool and share the session rate limiter, so
+        requests are spread up to the exchange limit and no further.
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+            tfs (list): Timeframes to retrieve OHLCV data for
+            since (str): Start date, YEAR-MONTH-DAY (ex. 2018-12-01) or millisecond timestamp
+            until (str): Date to stop before, YEAR-MONTH-DAY or millisecond timestamp. Defaults to now.
+            progress (object): Called as progress(done, total) after each shard. Defaults to None.
+
+        Raises:
+            NetworkError: A shard failed after retrying
+            ExchangeError: A shard was rejected by the exchange
+
+        Returns:
+            Dictionary: Symbol -> timeframe -> candle data, oldest first
+        """
+        since = self._timestamp(since)
+        until = self._timestamp(until)
+
+        jobs = []
+        for symbol in symbols:
+            # Markets without history only serve their latest page, one request covers it
+            pageable = self._client.pageable(symbol)
+            for tf in tfs:
+                shards = (
+                    self._shards(tf, since, until) if pageable else [(since, until)]
+                )
+                jobs += [(symbol, tf, start, end) for start, end in shards]
+
+        lock = threading.Lock()
+        done = [0]
+
+        def run(symbol, tf, start, end):
+            candles = self._fetch(symbol, tf, start, end)
+            if progress:
+                with lock:
+                    done[0] += 1
+                    progress(done[0], len(jobs))
+            return candles
+
+        results = self._pool.gather([(run, job) for job in jobs])
+
+        # Shards come back in job order, merge them dropping candles seen twice
+        merged = {symbol: {tf: [] for tf in tfs} for symbol in symbols}
+        for (symbol, tf, start, end), candles in zip(jobs, results):
+            series = merged[symbol][tf]
+            last = series[-1][0] if series else None
+            series += [candle for candle in candles if last is None or candle[0] > last]
+
+        return merged
@@ -0,0 +1,223 @@
+"""Process wide market metadata cache shared by every client"""
+
+import os
+import json
+import asyncio
+import threading
+import ccxt
+
+from time import time
+from weakref import WeakKeyDictionary
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 1
+
+
+class MarketCache:
+    def __init__(self, ttl: int = 900, snapshot: str = None, max_age: int = 86400):
+        self._ttl = ttl
+        self._snapshot = snapshot
+        self._max_age = max_age
+        self._markets = None
+        self._currencies = None
+        self._loaded_at = 0
+        self._lock = threading.RLock()
+        # Endpoint -> timestamp of the markets it currently holds
+        self._endpoints = WeakKeyDictionary()
+        # Event loop -> lock deduplicating async downloads
+        self._async_locks = WeakKeyDictionary()
+
+    def _expired(self):
+        """Check if cached markets are missing or older than ttl
+
+        Returns:
+            Bool: Markets must be downloaded again
+        """
+        if self._markets is None:
+            return True
+        return (time() - self._loaded_at) >= self._ttl
+
+    def _store(self, endpoint: object):
+        """Keep the markets and currencies an endpoint just downloaded
+
+        Args:
+            endpoint (object): ccxt exchange with freshly loaded markets
+        """
+        self._markets = list(endpoint.markets.values())
+        self._currencies = dict(endpoint.currencies or {})
+        self._loaded_at = time()
+        self._endpoints[endpoint] = self._loaded_at
+        self._save()
+
+    def _save(self):
+        """Write cached markets and currencies to the snapshot file"""
+        if not self._snapshot:
+            return
+
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "ccxt": ccxt.__version__,
+            "timestamp": self._loaded_at,
+            "markets": self._markets,
+            "currencies": self._currencies,
+        }
+        try:
+            # Write then rename so readers never see a partial file
+            tmp = self._snapshot + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self._snapshot)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"MarketCache failed to write snapshot {self._snapshot}: {e}")
+
+    def _read(self):
+        """Read markets and currencies from the snapshot file
+
+        Returns:
+            Bool: Snapshot was current and loaded into the cache
+        """
+        if not self._snapshot or not os.path.exists(self._snapshot):
+            return False
+
+        try:
+            with open(self._snapshot) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"MarketCache failed to read snapshot {self._snapshot}: {e}")
+            return False
+
+        # Market structure depends on the layout and the ccxt release that parsed it
+        if data.get("version") != SNAPSHOT_VERSION or data.get("ccxt") != ccxt.__version__:
+            return False
+        if (time() - data.get("timestamp", 0)) >= self._max_age:
+            return False
+
+        self._markets = data["markets"]
+        self._currencies = data["currencies"]
+        # Keeps the download time so ttl still counts from when they were fetched
+        self._loaded_at = data["timestamp"]
+        return True
+
+    def set_ttl(self, ttl: int):
+        """Set how long markets stay valid
+
+        Args:
+            ttl (int): Seconds before markets are downloaded again
+        """
+        with self._lock:
+            self._ttl = ttl
+
+    def ttl(self):
+        """Retrieve how long markets stay valid
+
+        Returns:
+            Int: Seconds before markets are downloaded again
+        """
+        return self._ttl
+
+    def set_snapshot(self, path: str, max_age: int = 86400):
+        """Keep a copy of markets on disk for fast cold starts
+
+        Args:
+            path (str): File to read and write the snapshot
+            max_age (int): Seconds before a snapshot is too old to use. Defaults to a day.
+        """
+        with self._lock:
+            self._snapshot = path
+            self._max_age = max_age
+
+    def restore(self, endpoint: object):
+        """Load markets into endpoint from memory or the snapshot without any network requests
+
+        Args:
+            endpoint (object): ccxt exchange to load markets into
+
+        Returns:
+            Bool: Endpoint holds markets
+        """
+        with self._lock:
+            if self._markets is None and not self._read():
+                return False
+
+            if self._endpoints.get(endpoint) != self._loaded_at:
+                endpoint.set_markets(self._markets, self._currencies)
+                self._endpoints[endpoint] = self._loaded_at
+            return True
+
+    def load(self, endpoint: object):
+        """Ensure endpoint holds current markets, downloading them only when expired
+
+        Args:
+            endpoint (object): ccxt exchange to load markets into
+        """
+        with self._lock:
+            if self._markets is None:
+                self._read()
+
+            if self._expired():
+                endpoint.load_markets(reload=True)
+                self._store(endpoint)
+            elif self._endpoints.get(endpoint) != self._loaded_at:
+                endpoint.set_markets(self._markets, self._currencies)
+                self._endpoints[endpoint] = self._loaded_at
+
+    def refresh(self, endpoint: object):
+        """Download markets now regardless of ttl
+
+        Args:
+            endpoint (object): ccxt exchange used to download markets
+        """
+        with self._lock:
+            self.invalidate()
+            self.load(endpoint)
+
+    async def aload(self, endpoint: object):
+        """Ensure an async endpoint holds current markets, downloading them only when expired
+
+        Args:
+            endpoint (object): ccxt.async_support exchange to load markets into
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._async_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            with self._lock:
+                if self._markets is None:
+                    self._read()
+                expired = self._expired()
+
+            if expired:
+                # Download outside the thread lock so the event loop never blocks on it
+                await endpoint.load_markets(reload=True)
+                with self._lock:
+                    self._store(endpoint)
+            else:
+                self.restore(endpoint)
+
+    async def arefresh(self, endpoint: object):
+        """Download markets now regardless of ttl using an async endpoint
+
+        Args:
+            endpoint (object): ccxt.async_support exchange used to download markets
+        """
+        self.invalidate()
+        await self.aload(endpoint)
+
+    def invalidate(self):
+        """Mark cached markets as stale so the next request downloads them"""
+        with self._lock:
+            self._loaded_at = 0
+
+    def currencies(self):
+        """Retrieve cached currencies
+
+        Returns:
+            Dictionary: All exchange currencies, None if markets were never loaded
+        """
+        return self._currencies
+
+
+# Shared by all clients in the process
+MARKETS = MarketCache(snapshot=os.getenv("MARKETS_SNAPSHOT"))
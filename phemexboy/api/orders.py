@@ -0,0 +1,209 @@
+"""Order states and the open orders snapshot shared by every order client of an account"""
+
+import asyncio
+import threading
+
+from time import time
+from typing import NamedTuple
+from weakref import WeakKeyDictionary
+
+
+def order_state(status: str):
+    """Translate a ccxt order status into an order client state
+
+    Args:
+        status (str): ccxt status (ex. 'open')
+
+    Returns:
+        String: pending, closed or canceled, None when status is unknown
+    """
+    if status == "open":
+        return "pending"
+    if status == "closed":
+        return "closed"
+    if status:
+        # Canceled, expired or rejected
+        return "canceled"
+    return None
+
+
+class OrderStatus(NamedTuple):
+    """State of a single order as Phemex reports it"""
+
+    id: str
+    client_id: str
+    symbol: str
+    state: str
+    amount: float
+    filled: float
+    remaining: float
+    average: float
+    timestamp: int
+
+    @classmethod
+    def parse(cls, order: dict):
+        """Build a status from a ccxt order
+
+        Args:
+            order (dict): ccxt order
+
+        Returns:
+            OrderStatus: pending, closed or canceled state with fill amounts, canceled orders may be partially filled
+        """
+        return cls(
+            id=order.get("id"),
+            client_id=order.get("clientOrderId"),
+            symbol=order.get("symbol"),
+            state=order_state(order.get("status")),
+            amount=order.get("amount"),
+            filled=order.get("filled") or 0.0,
+            remaining=order.get("remaining"),
+            average=order.get("average"),
+            timestamp=order.get("timestamp"),
+        )
+
+
+class OpenOrders:
+    def __init__(self, ttl: float = 1):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # Symbol -> (time the request was sent, orders by id)
+        self._snapshots = {}
+        # Symbol, or None for all, -> count of invalidations, a request racing one is not kept
+        self._generations = {}
+        # Symbol -> lock letting one thread request while the rest wait for it
+        self._fetching = {}
+        # Event loop -> symbol -> lock deduplicating async requests
+        self._async_locks = WeakKeyDictionary()
+
+    def set_ttl(self, ttl: float):
+        """Set how long a snapshot stays valid
+
+        Args:
+            ttl (float): Seconds before open orders are requested again
+        """
+        with self._lock:
+            self._ttl = ttl
+
+    def ttl(self):
+        """Retrieve how long a snapshot stays valid
+
+        Returns:
+            Float: Seconds before open orders are requested again
+        """
+        return self._ttl
+
+    def _fresh(self, symbol: str):
+        """Snapshot for symbol when younger than ttl
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: Open orders by id, None when a request is due
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(symbol)
+            if snapshot is None or (time() - snapshot[0]) >= self._ttl:
+                return None
+            return snapshot[1]
+
+    def _begin(self, symbol: str):
+        """Note when and against which generation a request starts
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Tuple: (start time, generation)
+        """
+        with self._lock:
+            return time(), self._generation(symbol)
+
+    def _generation(self, symbol: str):
+        """Invalidations affecting symbol so far, call holding the lock
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Tuple: (invalidations of every symbol, invalidations of symbol)
+        """
+        return self._generations.get(None, 0), self._generations.get(symbol, 0)
+
+    def _keep(self, symbol: str, orders: list, started: tuple):
+        """Index orders by id and keep them unless invalidated meanwhile
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            orders (list): Open orders returned by the request
+            started (tuple): Result of _begin before the request
+
+        Returns:
+            Dictionary: Open orders by id
+        """
+        index = {order["id"]: order for order in orders}
+        with self._lock:
+            if self._generation(symbol) == started[1]:
+                self._snapshots[symbol] = (started[0], index)
+        return index
+
+    def get(self, fetch: object, symbol: str):
+        """Open orders for symbol, requested at most once per ttl
+
+        Args:
+            fetch (object): Function requesting the open orders of a symbol
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: Open orders by id, shared and must not be modified
+        """
+        index = self._fresh(symbol)
+        if index is not None:
+            return index
+
+        with self._lock:
+            lock = self._fetching.setdefault(symbol, threading.Lock())
+        with lock:
+            # Another thread may have requested while this one waited
+            index = self._fresh(symbol)
+            if index is not None:
+                return index
+            started = self._begin(symbol)
+            return self._keep(symbol, fetch(symbol), started)
+
+    async def aget(self, fetch: object, symbol: str):
+        """Open orders for symbol, requested at most once per ttl
+
+        Args:
+            fetch (object): Coroutine function requesting the open orders of a symbol
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: Open orders by id, shared and must not be modified
+        """
+        index = self._fresh(symbol)
+        if index is not None:
+            return index
+
+        loop = asyncio.get_running_loop()
+        lock = self._async_locks.setdefault(loop, {}).setdefault(symbol, asyncio.Lock())
+        async with lock:
+            index = self._fresh(symbol)
+            if index is not None:
+                return index
+            started = self._begin(symbol)
+            return self._keep(symbol, await fetch(symbol), started)
+
+    def invalidate(self, symbol: str = None):
+        """Drop snapshots so the next check requests open orders again
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies. Defaults to None (all).
+        """
+        with self._lock:
+            if symbol is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(symbol, None)
+            self._generations[symbol] = self._generations.get(symbol, 0) + 1
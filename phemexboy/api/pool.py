@@ -0,0 +1,140 @@
+"""Persistent worker pool shared by every client"""
+
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+
+
+class WorkerPool:
+    def __init__(self, workers: int = 8, name: str = "PhemexWorker"):
+        self._workers = workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=name
+        )
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._busy = 0.0
+        self._started = monotonic()
+
+    def _run(self, task: object, args: tuple, kwargs: dict):
+        """Execute task on a pool thread while keeping metrics
+
+        Args:
+            task (object): Method to execute
+            args (tuple): Positional arguments for task
+            kwargs (dict): Keyword arguments for task
+
+        Returns:
+            Any: Result from task execution
+        """
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+
+        self._local.inside = True
+        start = monotonic()
+        try:
+            return task(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+                self._busy += monotonic() - start
+
+    def inside(self):
+        """Check if the calling thread is one of the pool workers
+
+        Returns:
+            Bool: Waiting on the pool from this thread could deadlock
+        """
+        return getattr(self._local, "inside", False)
+
+    def submit(self, task: object, *args, **kwargs):
+        """Queue task without waiting for it
+
+        Args:
+            task (object): Method to execute on a pool thread
+
+        Returns:
+            Future: Resolves to the result from task execution
+        """
+        with self._lock:
+            self._queued += 1
+
+        try:
+            return self._executor.submit(self._run, task, args, kwargs)
+        except Exception:
+            with self._lock:
+                self._queued -= 1
+            raise
+
+    def run(self, task: object, *args, **kwargs):
+        """Execute task on a pool thread and wait for the result
+
+        Args:
+            task (object): Method to execute on a pool thread
+
+        Raises:
+            Exception: Any
+
+        Returns:
+            Any: Result from task execution
+        """
+        # Tasks submitted from a pool thread run inline, waiting on the pool
+        # from inside it could deadlock once every worker is busy
+        if self.inside():
+            return task(*args, **kwargs)
+
+        return self.submit(task, *args, **kwargs).result()
+
+    def gather(self, calls: list):
+        """Execute several tasks concurrently and wait for all of them
+
+        Args:
+            calls (list): (task, args) pairs to execute
+
+        Raises:
+            Exception: Any
+
+        Returns:
+            List: Results in the same order as calls
+        """
+        if self.inside():
+            return [task(*args) for task, args in calls]
+
+        futures = [self.submit(task, *args) for task, args in calls]
+        return [future.result() for future in futures]
+
+    def metrics(self):
+        """Retrieve queue depth and worker utilisation
+
+        Returns:
+            Dictionary: workers, queued, active, completed, utilisation (busy workers right now)
+            and load (share of worker time spent on tasks since start)
+        """
+        with self._lock:
+            elapsed = monotonic() - self._started
+            return {
+                "workers": self._workers,
+                "queued": self._queued,
+                "active": self._active,
+                "completed": self._completed,
+                "utilisation": self._active / self._workers,
+                "load": self._busy / (self._workers * elapsed) if elapsed else 0.0,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting tasks and release the worker threads
+
+        Args:
+            wait (bool): Block until queued tasks finish. Defaults to True.
+        """
+        self._executor.shutdown(wait=wait)
+
+
+# Shared by all clients in the process
+POOL = WorkerPool()
@@ -1,21 +1,63 @@
 """Implements PublicClientInterface"""
 
-import ccxt
+from time import sleep
+from ccxt import BadSymbol, NotSupported, NetworkError
 
 from phemexboy.interfaces.public_interface import PublicClientInterface
-from phemexboy.exceptions import InvalidCodeError
-from botboy.core import BotBoy
+from phemexboy.api.markets import MarketCache, MARKETS
+from phemexboy.api.store import OhlcvStore, STORE
+from phemexboy.helpers.arrays import OhlcvBuffer, to_array, to_frame
+from phemexboy.helpers.orderbook import OrderBook
+from phemexboy.api.session import SESSIONS
+from phemexboy.api.pool import WorkerPool, POOL
+from phemexboy.api.ws.book import OrderBookStream
+from phemexboy.api.ws.candles import CandleStream
+from phemexboy.api.ws.trades import TradeStream
+from phemexboy.exceptions import (
+    InvalidCodeError,
+    InvalidSideError,
+    InvalidRequestError,
+)
+
+# Phemex serves all tickers of one market kind per request
+TICKER_GROUPS = {
+    "spot": {"type": "spot"},
+    "inverse": {"type": "swap", "subType": "inverse"},
+    "linear": {"type": "swap", "subType": "linear"},
+}
 
 
 class PublicClient(PublicClientInterface):
-    def __init__(self):
-        self._endpoint = ccxt.phemex({"enableRateLimit": True})
-
-    def _worker(self, task: object, *args):
-        """Runs tasks on separate thread
+    def __init__(
+        self,
+        markets: MarketCache = MARKETS,
+        endpoint: object = None,
+        pool: WorkerPool = POOL,
+        store: OhlcvStore = STORE,
+    ):
+        # Share one session and rate limiter with every other public client
+        self._endpoint = endpoint if endpoint else SESSIONS.endpoint()
+        self._markets = markets
+        self._pool = pool
+        self._store = store
+        self._streams = {}
+        self._trades = {}
+        self._candles = {}
+        # Start from the snapshot when one exists, avoiding the first download
+        self._markets.restore(self._endpoint)
+
+    def close(self):
+        """Close websocket streams, the shared exchange session stays open"""
+        for symbol in list(self._streams):
+            self.unwatch_orderbook(symbol)
+        for symbol in list(self._trades):
+            self.unwatch_trades(symbol)
+
+    def _call(self, task: object, *args):
+        """Runs task against current markets
 
         Args:
-            task (object): Method to execute on separate thread
+            task (object): Method to execute
 
         Raises:
             Exception: Any
@@ -24,13 +66,44 @@ class PublicClient(PublicClientInterface):
             Any: Result from task execution
         """
         try:
-            self._endpoint.load_markets(reload=True)
-            worker = BotBoy(name="PublicWorker", task=task, params=args)
-            result = worker.execute()
-            return result
+            self._markets.load(self._endpoint)
+            return task(*args)
+        except BadSymbol:
+            # Symbol may have been listed or delisted since markets were cached
+            self._markets.invalidate()
+            raise
         except Exception:
             raise
 
+    def _worker(self, task: object, *args):
+        """Runs tasks on the shared worker pool and waits for the result
+
+        Args:
+            task (object): Method to execute on separate thread
+
+        Raises:
+            Exception: Any
+
+        Returns:
+            Any: Result from task execution
+        """
+        return self._pool.run(self._call, task, *args)
+
+    def submit(self, method: str, *args, **kwargs):
+        """Run a client method on the shared worker pool without waiting
+
+        Args:
+            method (str): Name of the client method (ex. 'price')
+
+        Returns:
+            Future: Resolves to the result of the method
+        """
+        return self._pool.submit(getattr(self, method), *args, **kwargs)
+
+    def refresh_markets(self):
+        """Download market metadata now instead of waiting for the cache to expire"""
+        self._markets.refresh(self._endpoint)
+
     def timeframes(self):
         """Retrieve all timeframes available for exchange
 
@@ -75,38 +148,472 @@ class PublicClient(PublicClientInterface):
         if code == "future":
             return base_curr + "/" + quote_curr + ":" + quote_curr
 
-    def price(self, symbol: str):
+    def _quoted(self, symbols: list):
+        """Keep the symbols whose ticker carries best bid and ask
+
+        Tickers of USDT and USDC settled perpetuals leave top of book out, their
+        24 hour ticker has no bid or ask field for ccxt to parse.
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+
+        Returns:
+            List: Symbols to read from tickers, the rest are read from the book
+        """
+        return [
+            symbol
+            for symbol in symbols
+            if self._endpoint.market(symbol)["settle"] not in ["USDT", "USDC"]
+        ]
+
+    def _top(self, symbol: str):
+        """Fetch best bid and ask from the order book
+
+        Phemex has no depth 1 book, ccxt requests the 30 level book for spot and inverse
+        contracts and the full book for USDT and USDC settled perpetuals, one request per symbol.
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: symbol, bid, ask and timestamp
+        """
+        book = self._endpoint.fetch_order_book(symbol, 1)
+        bid = book["bids"][0][0] if book["bids"] else None
+        ask = book["asks"][0][0] if book["asks"] else None
+        return {
+            "symbol": symbol,
+            "bid": bid,
+            "ask": ask,
+            "timestamp": book["timestamp"],
+        }
+
+    def _bbo(self, symbol: str):
+        """Fetch best bid and ask using the smallest payload available
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: symbol, bid, ask and timestamp
+        """
+        if not self._quoted([symbol]):
+            return self._top(symbol)
+
+        ticker = self._endpoint.fetch_ticker(symbol)
+        if ticker["bid"] is None or ticker["ask"] is None:
+            # Top of book missing from this ticker anyway, use the order book
+            return self._top(symbol)
+
+        return {
+            "symbol": symbol,
+            "bid": ticker["bid"],
+            "ask": ticker["ask"],
+            "timestamp": ticker["timestamp"],
+        }
+
+    def bbo(self, symbol: str):
+        """Retrieve best bid and best ask of asset pair
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Returns:
+            Dictionary: symbol, bid, ask and timestamp
+        """
+        return self._worker(self._bbo, symbol)
+
+    def price(self, symbol: str, side: str = "ask"):
         """Retrieve price of asset pair
 
         Args:
             symbol (str): Created symbol for base and quote currencies
+            side (str): Side of the book, 'ask' or 'bid'. Defaults to 'ask'.
+
+        Raises:
+            InvalidSideError: Side must be either "ask" or "bid"
+
+        Returns:
+            Float: Current best price on side for base currency
+        """
+        if side not in ["ask", "bid"]:
+            raise InvalidSideError('Side must be either "ask" or "bid"')
+
+        return self.bbo(symbol)[side]
+
+    def _groups(self, symbols: list):
+        """Split symbols by the ticker endpoint that serves them
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+
+        Returns:
+            Dictionary: Ticker group -> symbols
+        """
+        groups = {}
+        for symbol in symbols:
+            market = self._endpoint.market(symbol)
+            if market["spot"]:
+                group = "spot"
+            elif market["inverse"]:
+                group = "inverse"
+            else:
+                group = "linear"
+            groups.setdefault(group, []).append(symbol)
+        return groups
+
+    def _group_tickers(self, group: str, symbols: list = None):
+        """Fetch every ticker of one group in a single request
+
+        Args:
+            group (str): Ticker group (ex. 'spot')
+            symbols (list): Symbols to keep, None keeps all. Defaults to None.
+
+        Returns:
+            Dictionary: Symbol -> ticker, None when the exchange can't serve the group at once
+        """
+        try:
+            return self._endpoint.fetch_tickers(symbols, TICKER_GROUPS[group])
+        except NotSupported:
+            if symbols is None:
+                raise
+            return None
+
+    def tickers(self, symbols: list = None):
+        """Retrieve tickers for many symbols with one request per market kind
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies, None for every market. Defaults to None.
+
+        Returns:
+            Dictionary: Symbol -> ticker
+        """
+        if symbols is None:
+            groups = {group: None for group in TICKER_GROUPS}
+        else:
+            groups = self._worker(self._groups, symbols)
+
+        results = self._pool.gather(
+            [
+                (self._call, (self._group_tickers, group, group_symbols))
+                for group, group_symbols in groups.items()
+            ]
+        )
+
+        tickers = {}
+        missing = []
+        for (group, group_symbols), result in zip(groups.items(), results):
+            if result is None:
+                missing += group_symbols
+            else:
+                tickers.update(result)
+
+        # Fall back to one request per symbol, run concurrently under the shared rate limiter
+        fetched = self._pool.gather(
+            [(self._call, (self._endpoint.fetch_ticker, symbol)) for symbol in missing]
+        )
+        tickers.update(zip(missing, fetched))
+        return tickers
+
+    def prices(self, symbols: list, side: str = "ask"):
+        """Retrieve prices for many symbols at once
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+            side (str): Side of the book, 'ask' or 'bid'. Defaults to 'ask'.
+
+        Raises:
+            InvalidSideError: Side must be either "ask" or "bid"
+
+        Returns:
+            Dictionary: Symbol -> current best price on side
+        """
+        if side not in ["ask", "bid"]:
+            raise InvalidSideError('Side must be either "ask" or "bid"')
+
+        quoted = self._worker(self._quoted, symbols)
+        tickers = self.tickers(quoted) if quoted else {}
+        prices = {
+            symbol: tickers[symbol][side] for symbol in quoted if symbol in tickers
+        }
+
+        # Read the rest, and tickers missing top of book, from the order book
+        missing = [symbol for symbol in symbols if prices.get(symbol) is None]
+        books = self._pool.gather(
+            [(self._call, (self._top, symbol)) for symbol in missing]
+        )
+        for symbol, bbo in zip(missing, books):
+            prices[symbol] = bbo[side]
+
+        return prices
+
+    def _timestamp(self, date):
+        """Convert a date to a millisecond timestamp
+
+        Args:
+            date (str | int): YEAR-MONTH-DAY (ex. 2018-12-01), ISO 8601 datetime or millisecond timestamp
+
+        Returns:
+            Int: Millisecond timestamp, None if date is None
+        """
+        if date is None or isinstance(date, int):
+            return date
+        if len(date) == 10:
+            date += "T00:00:00Z"
+        return self._endpoint.parse8601(date)
+
+    def _fetch_page(self, symbol: str, tf: str, since: int, limit: int, tries: int):
+        """Fetch one page of candles, retrying network errors with backoff
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (int): Millisecond timestamp of the first candle
+            limit (int): Maximum number of candles in the page
+            tries (int): Attempts before giving up
+
+        Raises:
+            NetworkError: Page could not be fetched after tries attempts
 
         Returns:
-            Float: Current ask price for base currency
+            List: Candle data for the page
         """
-        return self._worker(self._endpoint.fetch_order_book, symbol)["asks"][0][0]
+        for attempt in range(tries):
+            try:
+                return self._worker(
+                    self._endpoint.fetch_ohlcv, symbol, tf, since, limit
+                )
+            except NetworkError:
+                if attempt == tries - 1:
+                    raise
+                sleep(2**attempt)
+
+    def pageable(self, symbol: str):
+        """Check if Phemex serves candle history for symbol beyond the latest page
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
 
-    def ohlcv(self, symbol: str, tf: str, since: str = None):
+        Returns:
+            Bool: OHLCV requests honour since
+        """
+        market = self._worker(self._endpoint.market, symbol)
+        return market["linear"] or market["settle"] in ["USDT", "USDC"]
+
+    def _pages(
+        self,
+        symbol: str,
+        tf: str,
+        since: int,
+        until: int = None,
+        page_size: int = 1000,
+        tries: int = 3,
+    ):
+        """Walk forward from since in exchange sized pages
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (int): Millisecond timestamp of the first candle
+            until (int): Millisecond timestamp to stop before, None for now. Defaults to None.
+            page_size (int): Candles requested per page. Defaults to 1000.
+            tries (int): Attempts per page before giving up. Defaults to 3.
+
+        Yields:
+            List: Candles newer than the previous page, oldest first. Markets Phemex
+            can't page (spot and inverse future) yield their latest page only.
+        """
+        duration = self._endpoint.parse_timeframe(tf) * 1000
+        end = until if until else self._endpoint.milliseconds()
+        if not self.pageable(symbol):
+            # Phemex only serves the latest candles of these markets
+            page = self._fetch_page(symbol, tf, None, page_size, tries)
+            fresh = [candle for candle in page if since <= candle[0] < end]
+            if fresh:
+                yield fresh
+            return
+
+        cursor = since
+        last = None
+        while cursor < end:
+            page = self._fetch_page(symbol, tf, cursor, page_size, tries)
+            if not page:
+                # Nothing traded in this window, skip past it
+                cursor += page_size * duration
+                continue
+
+            # Pages overlap at their edges, keep only candles not seen yet
+            fresh = [
+                candle
+                for candle in page
+                if (last is None or candle[0] > last) and candle[0] < end
+            ]
+            if not fresh:
+                # Caught up with the latest candle
+                break
+
+            yield fresh
+            last = fresh[-1][0]
+            cursor = last + duration
+
+    def ohlcv(
+        self,
+        symbol: str,
+        tf: str,
+        since: str = None,
+        until: str = None,
+        backfill: bool = False,
+        progress: object = None,
+        cache: bool = False,
+        as_array: bool = False,
+        as_frame: bool = False,
+    ):
         """Retrieve the open - high - low - close - volume data from exchange
 
         Args:
             symbol (str): Created symbol for base and quote currencies
             tf (str): Timeframe to retrieve OHLCV data for
             since (str): Optional start date for retrieving OHLCV data, YEAR-MONTH-DAY (ex. 2018-12-01), Default is None.
+            until (str): Optional date to stop backfilling before, YEAR-MONTH-DAY. Defaults to now.
+            backfill (bool): Page forward from since until now instead of returning a single page. Defaults to False.
+            progress (object): Called as progress(candles, timestamp, end) after each backfilled page. Defaults to None.
+            cache (bool): Read from the local store after fetching only candles newer than the last stored one,
+                since is where an empty store starts. Defaults to False.
+            as_array (bool): Return a structured array with OHLCV dtype instead of lists. Defaults to False.
+            as_frame (bool): Return a pandas DataFrame indexed by open time instead of lists. Defaults to False.
+
+        Raises:
+            InvalidRequestError: Since is required to backfill
+            NetworkError: A page failed after retrying, call again with since set to the last timestamp reported by progress to resume
+            ImportError: pandas is required for as_frame
 
         Returns:
-            List: Candle data for timeframe
+            List: Candle data for timeframe, Array or DataFrame when requested
         """
-        # Get as much data as possible
-        limit = 1000000
-        formatted_date = None
-        if since:
-            formatted_date = since + "T00:00:00Z"
-            formatted_date = self._endpoint.parse8601(formatted_date)
+        since = self._timestamp(since)
+        until = self._timestamp(until)
+
+        if cache:
+            self._store.update(self, symbol, tf, since)
+            if as_frame:
+                return self._store.frame(symbol, tf, since, until)
+            if as_array:
+                return self._store.array(symbol, tf, since, until)
+            return self._store.candles(symbol, tf, since, until)
+
+        if not backfill:
+            # Get as much data as possible
+            limit = 1000000
+            candles = self._worker(self._endpoint.fetch_ohlcv, symbol, tf, since, limit)
+            if as_frame:
+                return to_frame(to_array(candles))
+            if as_array:
+                return to_array(candles)
+            return candles
+
+        if since is None:
+            raise InvalidRequestError("Since is required to backfill")
+
+        end = until if until else self._endpoint.milliseconds()
+        if as_array or as_frame:
+            # Pages go straight into a typed buffer sized for the whole range
+            duration = self._endpoint.parse_timeframe(tf) * 1000
+            candles = OhlcvBuffer(min((end - since) // duration + 1, 1 << 20))
+        else:
+            candles = []
+
+        for page in self._pages(symbol, tf, since, until):
+            candles.extend(page)
+            if progress:
+                progress(len(candles), page[-1][0], end)
+
+        if as_frame:
+            return to_frame(candles.array())
+        if as_array:
+            return candles.array()
+        return candles
+
+    def iter_ohlcv(
+        self,
+        symbol: str,
+        tf: str,
+        since: str,
+        until: str = None,
+        page_size: int = 1000,
+        as_array: bool = False,
+    ):
+        """Yield candle pages as they arrive instead of collecting the whole range
+
+        The next page is fetched on the worker pool while the current one is consumed.
 
-        return self._worker(
-            self._endpoint.fetch_ohlcv, symbol, tf, formatted_date, limit
-        )
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (str): Start date, YEAR-MONTH-DAY (ex. 2018-12-01)
+            until (str): Date to stop before, YEAR-MONTH-DAY. Defaults to now.
+            page_size (int): Candles requested per page. Defaults to 1000.
+            as_array (bool): Yield structured arrays with OHLCV dtype instead of lists. Defaults to False.
+
+        Raises:
+            InvalidRequestError: Since is required to iterate
+            NetworkError: A page failed after retrying
+
+        Yields:
+            List: Candles newer than the previous page, oldest first
+        """
+        since = self._timestamp(since)
+        until = self._timestamp(until)
+        if since is None:
+            raise InvalidRequestError("Since is required to iterate")
+
+        pages = self._pages(symbol, tf, since, until, page_size)
+        if self._pool.inside():
+            # Waiting on a prefetch from a worker could deadlock the pool
+            for page in pages:
+                yield to_array(page) if as_array else page
+            return
+
+        pending = self._pool.submit(next, pages, None)
+        try:
+            while True:
+                page = pending.result()
+                if page is None:
+                    return
+                pending = self._pool.submit(next, pages, None)
+                yield to_array(page) if as_array else page
+        finally:
+            # Let a running prefetch finish before closing the pages it is reading
+            try:
+                pending.result()
+            except Exception:
+                pass
+            pages.close()
+
+    def repair(self, symbol: str, tf: str, since: str = None, until: str = None):
+        """Refetch only the windows missing from the stored candles of symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the stored candles
+            since (str): Date the series should start at, YEAR-MONTH-DAY (ex. 2018-12-01). Defaults to None.
+            until (str): Date the series should reach, YEAR-MONTH-DAY. Defaults to None.
+
+        Returns:
+            Int: Number of candles added to the store, windows Phemex has no candles for stay missing
+        """
+        since = self._timestamp(since)
+        until = self._timestamp(until)
+        duration = self._endpoint.parse_timeframe(tf) * 1000
+
+        candles = []
+        for start, end in self._store.gaps(symbol, tf, since, until).tolist():
+            # Ask for no more candles than the window holds
+            size = min((end - start) // duration + 1, 1000)
+            for page in self._pages(symbol, tf, start, end, page_size=size):
+                candles += page
+
+        # Splice every window at once, a splice rewrites the whole series
+        return self._store.splice(symbol, tf, candles)
 
     def currencies(self):
         """Retrieve all currencies the exchange offers
@@ -114,7 +621,8 @@ class PublicClient(PublicClientInterface):
         Returns:
             Dictionary: All exchange currencies
         """
-        return self._worker(self._endpoint.fetch_currencies)
+        # Currencies are downloaded along with markets
+        return self._worker(self._markets.currencies)
 
     def status(self):
         """Retrieve the current network status of exchange
@@ -124,13 +632,167 @@ class PublicClient(PublicClientInterface):
         """
         return self._worker(self._endpoint.fetch_status)
 
-    def orderbook(self, symbol: str):
+    def _book(self, symbol: str, depth: int, info: bool):
+        """Fetch the raw book and parse only the levels asked for
+
+        Follows ccxt's fetch_order_book endpoint choice, trimming before parsing.
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            depth (int): Levels per side to keep, None for all
+            info (bool): Keep the raw exchange response
+
+        Returns:
+            OrderBook: Current orderbook for symbol
+        """
+        endpoint = self._endpoint
+        market = endpoint.market(symbol)
+        request = {"symbol": market["id"]}
+        if market["linear"] and market["settle"] in ["USDT", "USDC"]:
+            response = endpoint.v2GetMdV2Orderbook(request)
+        elif depth is not None and depth <= 30:
+            # Phemex serves a 30 level book, much smaller than the full book
+            response = endpoint.v1GetMdOrderbook(request)
+        else:
+            response = endpoint.v1GetMdFullbook(request)
+
+        result = endpoint.safe_dict(response, "result", {})
+        book = dict(endpoint.safe_dict_2(result, "book", "orderbook_p", {}))
+        if depth is not None:
+            book["bids"] = book.get("bids", [])[:depth]
+            book["asks"] = book.get("asks", [])[:depth]
+
+        timestamp = endpoint.safe_integer_product(result, "timestamp", 0.000001)
+        data = endpoint.custom_parse_order_book(
+            book, symbol, timestamp, "bids", "asks", 0, 1, market
+        )
+        return OrderBook(
+            symbol,
+            data["bids"],
+            data["asks"],
+            timestamp,
+            endpoint.safe_integer(result, "sequence"),
+            response if info else None,
+        )
+
+    def orderbook(self, symbol: str, depth: int = None, info: bool = False):
         """Retrieve orderbook for symbol
 
         Args:
             symbol (str): Created symbol for base and quote currencies
+            depth (int): Levels per side to return, 30 or less uses Phemex's smaller book. Defaults to None (all).
+            info (bool): Include the raw exchange response as info. Defaults to False.
+
+        Returns:
+            OrderBook: Current orderbook for symbol, reads like the ccxt dictionary
+        """
+        stream = self._streams.get(symbol)
+        if stream is not None and stream.synced and not info:
+            try:
+                # Served from the websocket book, no request needed
+                return stream.orderbook(depth)
+            except NetworkError:
+                # Sync dropped since the check, fetch the book instead
+                pass
+        return self._worker(self._book, symbol, depth, info)
+
+    def watch_orderbook(self, symbol: str, timeout: float = 10):
+        """Keep the orderbook for symbol current over a websocket, orderbook() then reads it locally
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            timeout (float): Seconds to wait for the first snapshot. Defaults to 10.
+
+        Raises:
+            NetworkError: No snapshot within timeout
+
+        Returns:
+            OrderBookStream: Stream keeping the book current
+        """
+        stream = self._streams.get(symbol)
+        if stream is None:
+            stream = OrderBookStream(symbol, self._markets, self._endpoint)
+            stream.start()
+            self._streams[symbol] = stream
+        if not stream.ready(timeout):
+            raise NetworkError(f"No orderbook snapshot for {symbol} within {timeout}s")
+        return stream
+
+    def watch_trades(self, symbol: str, capacity: int = 100000, timeout: float = 10):
+        """Stream public trades for symbol into a preallocated ring buffer
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            capacity (int): Trades kept before the oldest is overwritten. Defaults to 100000.
+            timeout (float): Seconds to wait for the first trades. Defaults to 10.
+
+        Raises:
+            NetworkError: No trades within timeout
 
         Returns:
-            Dictionary: Current orderbook for symbol
+            TradeStream: Stream holding the latest trades, read them with latest(n)
+        """
+        stream = self._trades.get(symbol)
+        if stream is None:
+            stream = TradeStream(
+                symbol, self._markets, self._endpoint, capacity=capacity
+            )
+            stream.start()
+            self._trades[symbol] = stream
+        if not stream.ready(timeout):
+            raise NetworkError(f"No trades for {symbol} within {timeout}s")
+        return stream
+
+    def watch_candles(self, symbol: str, tfs: list, timeout: float = 10):
+        """Build candles for symbol from its trade stream, storing them as they close
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tfs (list): Timeframes to build (ex. ['1m', '1h'])
+            timeout (float): Seconds to wait for the first trades. Defaults to 10.
+
+        Raises:
+            NetworkError: No trades within timeout
+
+        Returns:
+            CandleStream: Stream firing listeners as candles close, partial(tf) reads the open one
+        """
+        key = (symbol, tuple(tfs))
+        stream = self._candles.get(key)
+        if stream is None:
+            trades = self.watch_trades(symbol, timeout=timeout)
+            stream = CandleStream(trades, tfs, self, self._store)
+            stream.start()
+            self._candles[key] = stream
+        return stream
+
+    def unwatch_candles(self, symbol: str):
+        """Stop building candles for symbol, the trade stream keeps running
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+        """
+        for key in [key for key in self._candles if key[0] == symbol]:
+            stream = self._candles.pop(key)
+            stream.close()
+
+    def unwatch_trades(self, symbol: str):
+        """Close the trade stream for symbol and the candles built from it
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+        """
+        self.unwatch_candles(symbol)
+        stream = self._trades.pop(symbol, None)
+        if stream is not None:
+            stream.close()
+
+    def unwatch_orderbook(self, symbol: str):
+        """Close the websocket book for symbol, orderbook() requests it again
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
         """
-        return self._worker(self._endpoint.fetch_order_book, symbol)
+        stream = self._streams.pop(symbol, None)
+        if stream is not None:
+            stream.close()
@@ -0,0 +1,188 @@
+"""Single thread timing the checks of every order waiting to fill"""
+
+import heapq
+import itertools
+import threading
+
+from concurrent.futures import Future
+from time import monotonic, sleep
+
+from phemexboy.api.pool import WorkerPool, POOL
+
+
+class Backoff:
+    def __init__(self, fast: float = 0.25, slow: float = 10, factor: float = 2):
+        self._fast = fast
+        self._slow = slow
+        self._factor = factor
+        self._delay = fast
+
+    def reset(self):
+        """Poll fast again, the order was just placed or repriced"""
+        self._delay = self._fast
+
+    def next(self):
+        """Seconds until the next check, growing while nothing changes
+
+        Returns:
+            Float: Delay in seconds
+        """
+        delay = self._delay
+        self._delay = min(delay * self._factor, self._slow)
+        return delay
+
+
+class _Task:
+    def __init__(self, steps: object):
+        self.steps = steps
+        self.future = Future()
+        # Set while queued, None while a step runs
+        self.deadline = None
+        self.woken = False
+
+
+class WaitScheduler:
+    def __init__(self, pool: WorkerPool = POOL):
+        self._pool = pool
+        self._heap = []
+        self._tasks = {}
+        self._order = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def _start(self):
+        """Start the scheduling thread on first use, call holding the condition"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._loop, name="PhemexWaitScheduler", daemon=True
+            )
+            self._thread.start()
+
+    def _queue(self, task: _Task, delay: float):
+        """Queue the next step of task, call holding the condition
+
+        Args:
+            task (_Task): Task to advance
+            delay (float): Seconds until the step runs
+        """
+        task.deadline = monotonic() + delay
+        heapq.heappush(self._heap, (task.deadline, next(self._order), task))
+        self._condition.notify()
+
+    def _loop(self):
+        """Hand every step to the worker pool once it is due"""
+        with self._condition:
+            while True:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                deadline, _, task = self._heap[0]
+                if deadline != task.deadline:
+                    # Moved by wake, a newer entry exists
+                    heapq.heappop(self._heap)
+                    continue
+
+                now = monotonic()
+                if deadline > now:
+                    self._condition.wait(deadline - now)
+                    continue
+
+                heapq.heappop(self._heap)
+                task.deadline = None
+                self._pool.submit(self._step, task)
+
+    def _step(self, task: _Task):
+        """Advance task by one step on a pool thread
+
+        Args:
+            task (_Task): Task to advance
+        """
+        try:
+            delay = next(task.steps)
+        except StopIteration as done:
+            self._finish(task)
+            task.future.set_result(done.value)
+            return
+        except BaseException as e:
+            self._finish(task)
+            task.future.set_exception(e)
+            return
+
+        with self._condition:
+            if task.woken:
+                # Woken while the step ran, check again straight away
+                task.woken = False
+                delay = 0
+            self._queue(task, delay)
+
+    def _finish(self, task: _Task):
+        """Forget a finished task
+
+        Args:
+            task (_Task): Finished task
+        """
+        with self._condition:
+            self._tasks.pop(id(task.steps), None)
+
+    def submit(self, steps: object):
+        """Drive a generator that yields seconds to wait before it runs again
+
+        Args:
+            steps (object): Generator, its return value resolves the future
+
+        Returns:
+            Future: Resolves to the value returned by steps
+        """
+        task = _Task(steps)
+        with self._condition:
+            self._tasks[id(steps)] = task
+            self._start()
+            self._queue(task, 0)
+        return task.future
+
+    def wake(self, steps: object):
+        """Run the next step of a submitted generator now instead of at its deadline
+
+        Args:
+            steps (object): Generator passed to submit
+        """
+        with self._condition:
+            task = self._tasks.get(id(steps))
+            if task is None:
+                return
+            if task.deadline is None:
+                task.woken = True
+            else:
+                self._queue(task, 0)
+
+    def run(self, steps: object, event: threading.Event = None):
+        """Drive a generator and wait for its return value
+
+        Args:
+            steps (object): Generator yielding seconds to wait before it runs again
+            event (threading.Event): Ends a wait early when driven inline. Defaults to None.
+
+        Raises:
+            Exception: Any raised by steps
+
+        Returns:
+            Any: Value returned by steps
+        """
+        if not self._pool.inside():
+            return self.submit(steps).result()
+
+        # Waiting on the pool from inside it could deadlock, run the steps here
+        try:
+            while True:
+                delay = next(steps)
+                if event is None:
+                    sleep(delay)
+                elif event.wait(delay):
+                    event.clear()
+        except StopIteration as done:
+            return done.value
+
+
+# Shared by all clients in the process
+SCHEDULER = WaitScheduler()
@@ -0,0 +1,66 @@
+"""Shared exchange sessions, one per API key"""
+
+import threading
+import ccxt
+
+from requests.adapters import HTTPAdapter
+
+
+class SessionRegistry:
+    def __init__(self, pool_size: int = 16):
+        self._pool_size = pool_size
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def _share_throttle(self, endpoint: object):
+        """Serialize the rate limiter so every thread using endpoint shares one budget
+
+        Args:
+            endpoint (object): ccxt exchange to guard
+        """
+        lock = threading.Lock()
+        throttle = endpoint.throttle
+
+        def shared_throttle(cost=None):
+            with lock:
+                throttle(cost)
+                # Claim the slot before releasing so the next caller waits for it
+                endpoint.lastRestRequestTimestamp = endpoint.milliseconds()
+
+        endpoint.throttle = shared_throttle
+
+    def endpoint(self, key: str = None, secret: str = None):
+        """Retrieve the exchange session for an API key, creating it on first use
+
+        Args:
+            key (str): API key, None for public only access. Defaults to None.
+            secret (str): API secret. Defaults to None.
+
+        Returns:
+            Object: ccxt exchange shared by every client using key
+        """
+        with self._lock:
+            if key not in self._sessions:
+                config = {"enableRateLimit": True}
+                if key:
+                    config.update({"apiKey": key, "secret": secret})
+
+                endpoint = ccxt.phemex(config)
+                # Keep enough connections alive for concurrent requests
+                adapter = HTTPAdapter(pool_maxsize=self._pool_size)
+                endpoint.session.mount("https://", adapter)
+                self._share_throttle(endpoint)
+                self._sessions[key] = endpoint
+
+            return self._sessions[key]
+
+    def close(self):
+        """Close every session and forget them"""
+        with self._lock:
+            for endpoint in self._sessions.values():
+                endpoint.session.close()
+            self._sessions = {}
+
+
+# Shared by all clients in the process
+SESSIONS = SessionRegistry()
@@ -0,0 +1,399 @@
+"""Local OHLCV store with one memory mapped file per column"""
+
+import os
+import asyncio
+import threading
+import ccxt
+import numpy as np
+
+from phemexboy.helpers.arrays import OHLCV, to_array, to_frame
+from phemexboy.helpers.gaps import gaps
+from phemexboy.helpers.resample import resample, resolution
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Column name -> fixed width dtype, timestamps in milliseconds
+COLUMNS = {name: OHLCV[name] for name in OHLCV.names}
+# Written once every column of a splice is staged, removed once all are swapped in
+JOURNAL = "splice"
+
+
+class OhlcvStore:
+    def __init__(self, root: str = None):
+        self._root = root if root else os.path.join("~", ".phemexboy", "ohlcv")
+        self._root = os.path.expanduser(self._root)
+        self._lock = threading.Lock()
+
+    def _path(self, symbol: str, tf: str):
+        """Directory holding the column files of a series
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+
+        Returns:
+            String: Path to the series directory
+        """
+        name = symbol.replace("/", "-").replace(":", "_")
+        return os.path.join(self._root, name, tf)
+
+    def _length(self, path: str):
+        """Count rows written to every column of a series
+
+        Args:
+            path (str): Series directory
+
+        Returns:
+            Int: Rows present in all columns
+        """
+        lengths = []
+        for name, dtype in COLUMNS.items():
+            file = os.path.join(path, name)
+            size = os.path.getsize(file) if os.path.exists(file) else 0
+            lengths.append(size // dtype.itemsize)
+        return min(lengths)
+
+    def _recover(self, path: str):
+        """Finish a splice interrupted while swapping its columns in, call holding the lock
+
+        Columns staged without a journal belong to a splice that never finished
+        writing them, they are dropped and the series stays as it was.
+
+        Args:
+            path (str): Series directory
+        """
+        journal = os.path.join(path, JOURNAL)
+        committed = os.path.exists(journal)
+        for name in COLUMNS:
+            staged = os.path.join(path, name) + ".tmp"
+            if not os.path.exists(staged):
+                continue
+            if committed:
+                os.replace(staged, os.path.join(path, name))
+            else:
+                os.remove(staged)
+        if committed:
+            os.remove(journal)
+
+    def _column(self, path: str, name: str, length: int):
+        """Memory map a column
+
+        Args:
+            path (str): Series directory
+            name (str): Column name
+            length (int): Rows to map
+
+        Returns:
+            Array: Read only view of the column
+        """
+        if not length:
+            # Empty files cannot be mapped
+            return np.empty(0, dtype=COLUMNS[name])
+        file = os.path.join(path, name)
+        return np.memmap(file, dtype=COLUMNS[name], mode="r", shape=(length,))
+
+    def last(self, symbol: str, tf: str):
+        """Retrieve the timestamp of the newest stored candle
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+
+        Returns:
+            Int: Millisecond timestamp, None if nothing is stored
+        """
+        path = self._path(symbol, tf)
+        with self._lock:
+            self._recover(path)
+            length = self._length(path)
+            if not length:
+                return None
+            return int(self._column(path, "timestamp", length)[-1])
+
+    def append(self, symbol: str, tf: str, candles: list):
+        """Add candles newer than the last stored one
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+            candles (list): Candle data, oldest first
+
+        Returns:
+            Int: Number of candles written
+        """
+        path = self._path(symbol, tf)
+        with self._lock:
+            os.makedirs(path, exist_ok=True)
+            self._recover(path)
+            length = self._length(path)
+            last = int(self._column(path, "timestamp", length)[-1]) if length else None
+            rows = [candle for candle in candles if last is None or candle[0] > last]
+            if not rows:
+                return 0
+
+            data = np.array(rows, dtype=np.float64)
+            for i, (name, dtype) in enumerate(COLUMNS.items()):
+                with open(os.path.join(path, name), "ab") as f:
+                    # Drop rows left by an interrupted append before adding new ones
+                    f.truncate(length * dtype.itemsize)
+                    f.write(data[:, i].astype(dtype).tobytes())
+
+            return len(rows)
+
+    def splice(self, symbol: str, tf: str, candles: list):
+        """Merge closed candles anywhere into the stored series, keeping stored ones
+
+        Every column is staged next to the series before a journal file is written
+        and the columns are swapped in, a splice interrupted before the journal
+        leaves the series as it was and one interrupted after is finished on the
+        next access, so columns never disagree. Readers holding a memory map keep
+        their old view.
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+            candles (list): Candle data, oldest first
+
+        Returns:
+            Int: Number of candles added
+        """
+        path = self._path(symbol, tf)
+        with self._lock:
+            os.makedirs(path, exist_ok=True)
+            self._recover(path)
+            length = self._length(path)
+            stored = np.empty(length, dtype=OHLCV)
+            for name in COLUMNS:
+                stored[name] = self._column(path, name, length)
+
+            fresh = to_array(candles)
+            fresh = fresh[~np.isin(fresh["timestamp"], stored["timestamp"])]
+            # Candles still forming are left for update() to store once closed
+            duration = resolution(tf)
+            fresh = fresh[fresh["timestamp"] + duration <= ccxt.Exchange.milliseconds()]
+            fresh = fresh[np.unique(fresh["timestamp"], return_index=True)[1]]
+            if not len(fresh):
+                return 0
+
+            merged = np.concatenate((stored, fresh))
+            merged = merged[np.argsort(merged["timestamp"], kind="stable")]
+            for name in COLUMNS:
+                with open(os.path.join(path, name) + ".tmp", "wb") as f:
+                    f.write(np.ascontiguousarray(merged[name]).tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+            with open(os.path.join(path, JOURNAL), "wb") as f:
+                os.fsync(f.fileno())
+            self._recover(path)
+
+            return len(fresh)
+
+    def read(self, symbol: str, tf: str, since: int = None, until: int = None):
+        """Memory map stored candles
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+            since (int): Millisecond timestamp of the first candle. Defaults to None.
+            until (int): Millisecond timestamp to stop before. Defaults to None.
+
+        Returns:
+            Dictionary: Column name -> read only array, oldest first
+        """
+        path = self._path(symbol, tf)
+        with self._lock:
+            # Mapped together so a concurrent splice can't swap columns in between
+            self._recover(path)
+            length = self._length(path)
+            columns = {name: self._column(path, name, length) for name in COLUMNS}
+
+        timestamps = columns["timestamp"]
+        start = 0 if since is None else np.searchsorted(timestamps, since, "left")
+        end = length if until is None else np.searchsorted(timestamps, until, "left")
+        return {name: column[start:end] for name, column in columns.items()}
+
+    def candles(self, symbol: str, tf: str, since: int = None, until: int = None):
+        """Read stored candles in the layout fetch_ohlcv returns
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+            since (int): Millisecond timestamp of the first candle. Defaults to None.
+            until (int): Millisecond timestamp to stop before. Defaults to None.
+
+        Returns:
+            List: Candle data, oldest first
+        """
+        columns = self.read(symbol, tf, since, until)
+        return [list(row) for row in zip(*(c.tolist() for c in columns.values()))]
+
+    def array(self, symbol: str, tf: str, since: int = None, until: int = None):
+        """Read stored candles into a structured array
+
+        Columns are interleaved so this copies them once, read() returns views.
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+            since (int): Millisecond timestamp of the first candle. Defaults to None.
+            until (int): Millisecond timestamp to stop before. Defaults to None.
+
+        Returns:
+            Array: Candles with OHLCV dtype, oldest first
+        """
+        columns = self.read(symbol, tf, since, until)
+        data = np.empty(len(columns["timestamp"]), dtype=OHLCV)
+        for name, column in columns.items():
+            data[name] = column
+        return data
+
+    def frame(self, symbol: str, tf: str, since: int = None, until: int = None):
+        """Read stored candles into a DataFrame backed by the memory mapped columns
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+            since (int): Millisecond timestamp of the first candle. Defaults to None.
+            until (int): Millisecond timestamp to stop before. Defaults to None.
+
+        Returns:
+            DataFrame: One row per candle, oldest first
+        """
+        return to_frame(self.read(symbol, tf, since, until))
+
+    def resample(
+        self,
+        symbol: str,
+        tf: str,
+        since: int = None,
+        until: int = None,
+        base: str = "1m",
+    ):
+        """Build candles for tf from stored base candles instead of fetching them
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to build (ex. '4h')
+            since (int): Millisecond timestamp, the candle containing it comes first. Defaults to None.
+            until (int): Millisecond timestamp to stop before. Defaults to None.
+            base (str): Stored timeframe to build from. Defaults to '1m'.
+
+        Returns:
+            Array: Candles with OHLCV dtype, the last one is partial when the store ends mid candle
+        """
+        if since is not None:
+            # Start at the candle boundary so the first candle is complete
+            since -= since % resolution(tf)
+        return resample(self.read(symbol, base, since, until), tf)
+
+    def gaps(self, symbol: str, tf: str, since: int = None, until: int = None):
+        """Find windows missing from the stored series
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+            since (int): Millisecond timestamp the series should start at. Defaults to None.
+            until (int): Millisecond timestamp the series should reach. Defaults to None.
+
+        Returns:
+            Array: (start, end) rows of missing open times, end exclusive
+        """
+        timestamps = self.read(symbol, tf, since, until)["timestamp"]
+        return gaps(timestamps, tf, since, until)
+
+    def _start(self, symbol: str, tf: str, since: int):
+        """Find where an update has to start fetching from
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+            since (int): Millisecond timestamp to start from when nothing is stored
+
+        Returns:
+            Int: Millisecond timestamp, None to fetch the latest page
+        """
+        last = self.last(symbol, tf)
+        if last is None:
+            return since
+        return last + ccxt.Exchange.parse_timeframe(tf) * 1000
+
+    def _open(self, tf: str, start: int):
+        """Check if the candle at start is still forming, nothing newer can be stored yet
+
+        Args:
+            tf (str): Timeframe of the candles
+            start (int): Millisecond timestamp an update would fetch from
+
+        Returns:
+            Bool: Fetching would return no closed candles
+        """
+        if start is None:
+            return False
+        duration = ccxt.Exchange.parse_timeframe(tf) * 1000
+        return start + duration > ccxt.Exchange.milliseconds()
+
+    def _closed(self, tf: str, candles: list):
+        """Drop the candle still forming, it would be stored before it closes
+
+        Args:
+            tf (str): Timeframe of the candles
+            candles (list): Candle data, oldest first
+
+        Returns:
+            List: Closed candles
+        """
+        duration = ccxt.Exchange.parse_timeframe(tf) * 1000
+        now = ccxt.Exchange.milliseconds()
+        return [candle for candle in candles if candle[0] + duration <= now]
+
+    def update(self, client: object, symbol: str, tf: str, since: int = None):
+        """Fetch and store only the candles newer than the last stored one
+
+        Args:
+            client (object): PublicClient used to fetch candles
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+            since (int): Millisecond timestamp to start from when nothing is stored,
+                None stores the latest page. Defaults to None.
+
+        Returns:
+            Int: Number of candles written
+        """
+        start = self._start(symbol, tf, since)
+        if self._open(tf, start):
+            return 0
+        if start is None:
+            candles = client.ohlcv(symbol, tf)
+        else:
+            candles = client.ohlcv(symbol, tf, since=start, backfill=True)
+        return self.append(symbol, tf, self._closed(tf, candles))
+
+    async def aupdate(self, client: object, symbol: str, tf: str, since: int = None):
+        """Fetch and store only the candles newer than the last stored one
+
+        Args:
+            client (object): AsyncPublicClient used to fetch candles
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the candles
+            since (int): Millisecond timestamp to start from when nothing is stored,
+                None stores the latest page. Defaults to None.
+
+        Returns:
+            Int: Number of candles written
+        """
+        # File reads and writes run on the default executor, keeping the event loop free
+        loop = asyncio.get_running_loop()
+        start = await loop.run_in_executor(None, self._start, symbol, tf, since)
+        if self._open(tf, start):
+            return 0
+        if start is None:
+            candles = await client.ohlcv(symbol, tf)
+        else:
+            candles = await client.ohlcv(symbol, tf, since=start, backfill=True)
+        closed = self._closed(tf, candles)
+        return await loop.run_in_executor(None, self.append, symbol, tf, closed)
+
+
+# Shared by all clients in the process
+STORE = OhlcvStore(os.getenv("OHLCV_STORE"))
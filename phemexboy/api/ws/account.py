@@ -0,0 +1,293 @@
+"""Order, fill and position updates from Phemex's private websocket channels"""
+
+import time
+import asyncio
+import hashlib
+import threading
+import weakref
+
+from collections import OrderedDict
+from ccxt import ExchangeError, NetworkError
+
+from phemexboy.api.markets import MarketCache, MARKETS
+from phemexboy.api.ws.connection import Connection, WS_URL, load_markets, notify
+from phemexboy.api.ws.loop import LOOP
+
+# Spot orders, inverse contracts and USDT perpetuals stream on separate channels
+CHANNELS = ("wo", "aop", "aop_p")
+
+
+class AccountStream:
+    def __init__(
+        self,
+        endpoint: object,
+        markets: MarketCache = MARKETS,
+        url: str = WS_URL,
+        channels: tuple = CHANNELS,
+        history: int = 1000,
+    ):
+        # Signs the login and parses updates, never used for requests
+        self._endpoint = endpoint
+        self._markets = markets
+        self._channels = channels
+        self._history = history
+        self._orders = OrderedDict()
+        self._positions = {}
+        self._order_clients = {}
+        self._position_clients = {}
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._connection = Connection(
+            url,
+            on_open=self._subscribe,
+            on_message=self._handle,
+            on_close=self._synced.clear,
+        )
+        self.error = None
+        # Counts subscriptions, updates may have been missed between two of them
+        self.epoch = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def __aenter__(self):
+        await self.astart()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    @property
+    def synced(self):
+        """Check if the stream is logged in and subscribed
+
+        Returns:
+            Bool: Updates are arriving
+        """
+        return (
+            self._synced.is_set() and self.error is None and self._connection.connected
+        )
+
+    def _login(self):
+        """Sign a login valid for two minutes
+
+        Returns:
+            List: user.auth params
+        """
+        endpoint = self._endpoint
+        expiry = int(time.time()) + 120
+        signature = endpoint.hmac(
+            endpoint.encode(endpoint.apiKey + str(expiry)),
+            endpoint.encode(endpoint.secret),
+            hashlib.sha256,
+        )
+        return ["API", endpoint.apiKey, signature, expiry]
+
+    async def _subscribe(self, connection: Connection):
+        """Log in and subscribe on every connect
+
+        Args:
+            connection (Connection): Newly opened connection
+        """
+        self._synced.clear()
+        try:
+            await connection.request("user.auth", self._login())
+        except NetworkError:
+            # Dropped before the reply, the next connect logs in again
+            return
+        except ExchangeError as e:
+            # Wrong key or secret, retrying will not help
+            self.error = e
+            self._synced.set()
+            return
+
+        for channel in self._channels:
+            try:
+                await connection.request(f"{channel}.subscribe")
+            except ExchangeError:
+                # Product not enabled for this account
+                pass
+            except NetworkError:
+                return
+
+        with self._lock:
+            self.error = None
+            self.epoch += 1
+        self._synced.set()
+
+    def _parse(self, parser: object, raw: dict):
+        """Parse a raw update with the market it belongs to
+
+        Args:
+            parser (object): ccxt parse method
+            raw (dict): Raw order or position
+
+        Returns:
+            Dictionary: Parsed update, None when it can't be parsed
+        """
+        try:
+            market = self._endpoint.safe_market(raw.get("symbol"))
+            return parser(raw, market)
+        except Exception:
+            return None
+
+    def _handle(self, message: dict):
+        """Push order and position updates to the clients tracking them
+
+        Args:
+            message (dict): Decoded private message
+        """
+        orders = message.get("orders", message.get("orders_p"))
+        if isinstance(orders, dict):
+            # Spot updates group orders by state
+            orders = orders.get("open", []) + orders.get("closed", [])
+        for raw in orders or []:
+            order = self._parse(self._endpoint.parse_order, raw)
+            if order is not None and order["id"]:
+                self._order(order)
+
+        positions = message.get("positions", message.get("positions_p"))
+        for raw in positions or []:
+            position = self._parse(self._endpoint.parse_position, raw)
+            if position is not None and position["symbol"]:
+                self._position(position)
+
+    def _order(self, order: dict):
+        """Record the latest state of an order and push it
+
+        Args:
+            order (dict): Parsed order
+        """
+        with self._lock:
+            self._orders[order["id"]] = order
+            self._orders.move_to_end(order["id"])
+            if len(self._orders) > self._history:
+                self._orders.popitem(last=False)
+            clients = list(self._order_clients.get(order["id"], ()))
+
+        for client in clients:
+            notify(client._push, dict(order))
+        for callback in self._callbacks:
+            notify(callback, "order", order)
+
+    def _position(self, position: dict):
+        """Record the latest state of a position and push it
+
+        Args:
+            position (dict): Parsed position
+        """
+        with self._lock:
+            self._positions[position["symbol"]] = position
+            clients = list(self._position_clients.get(position["symbol"], ()))
+
+        for client in clients:
+            notify(client._push, dict(position))
+        for callback in self._callbacks:
+            notify(callback, "position", position)
+
+    def listen(self, callback: object):
+        """Call callback with ('order' or 'position', update) for every update
+
+        Args:
+            callback (object): Function taking the kind and parsed update, runs on the stream's event loop
+        """
+        self._callbacks.append(callback)
+
+    def track(self, client: object):
+        """Push updates into an OrderClient or PositionClient for as long as it is alive
+
+        Args:
+            client (object): OrderClient, PositionClient or their async versions
+        """
+        if hasattr(client, "_order"):
+            key, registry, latest = (
+                client._order["id"],
+                self._order_clients,
+                self._orders,
+            )
+        else:
+            key, registry, latest = (
+                client._position["symbol"],
+                self._position_clients,
+                self._positions,
+            )
+
+        with self._lock:
+            registry.setdefault(key, weakref.WeakSet()).add(client)
+            update = latest.get(key)
+            # Updates for orders created while the stream was synced can't have been missed
+            if self.synced:
+                client._epoch = self.epoch
+
+        if update is not None:
+            # Arrived before the client existed
+            client._push(dict(update))
+
+    def current(self, client: object):
+        """Check if every update for client since its last REST check has been pushed
+
+        Args:
+            client (object): Tracked client
+
+        Returns:
+            Bool: Client state may be read locally
+        """
+        return self.synced and getattr(client, "_epoch", None) == self.epoch
+
+    def ready(self, timeout: float = None):
+        """Block until the stream is logged in and subscribed
+
+        Args:
+            timeout (float): Seconds to wait. Defaults to None.
+
+        Raises:
+            ExchangeError: Phemex rejected the login
+
+        Returns:
+            Bool: Stream is synced
+        """
+        synced = self._synced.wait(timeout)
+        if self.error:
+            raise self.error
+        return synced
+
+    async def aready(self, timeout: float = None):
+        """Wait until the stream is logged in and subscribed
+
+        Args:
+            timeout (float): Seconds to wait. Defaults to None.
+
+        Raises:
+            ExchangeError: Phemex rejected the login
+
+        Returns:
+            Bool: Stream is synced
+        """
+        loop = asyncio.get_running_loop()
+        synced = await loop.run_in_executor(None, self._synced.wait, timeout)
+        if self.error:
+            raise self.error
+        return synced
+
+    async def astart(self):
+        """Connect, log in and subscribe on the running event loop"""
+        await load_markets(self._markets, self._endpoint)
+        await self._connection.start()
+
+    async def aclose(self):
+        """Unsubscribe by closing the connection"""
+        await self._connection.close()
+        self._synced.clear()
+
+    def start(self):
+        """Connect, log in and subscribe on the shared background event loop"""
+        LOOP.run(self.astart())
+
+    def close(self):
+        """Close a stream started with start"""
+        LOOP.run(self.aclose())
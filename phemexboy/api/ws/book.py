@@ -0,0 +1,288 @@
+"""Order book kept current from Phemex's websocket book channel"""
+
+import asyncio
+import threading
+
+from bisect import bisect_left, insort
+from ccxt import NetworkError
+
+from phemexboy.api.markets import MarketCache, MARKETS
+from phemexboy.api.session import SESSIONS
+from phemexboy.api.ws.connection import (
+    Connection,
+    WS_URL,
+    channel,
+    load_markets,
+    notify,
+)
+from phemexboy.api.ws.loop import LOOP
+from phemexboy.helpers.orderbook import OrderBook
+
+
+class _Side:
+    def __init__(self, descending: bool):
+        # Prices are kept ascending, bids are negated so the best level comes first
+        self._sign = -1 if descending else 1
+        self._keys = []
+        self._sizes = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def clear(self):
+        """Remove every level"""
+        self._keys.clear()
+        self._sizes.clear()
+
+    def update(self, price: float, size: float):
+        """Set the size resting at price, a size of 0 removes the level
+
+        Args:
+            price (float): Level price
+            size (float): Size resting at price
+        """
+        key = self._sign * price
+        if not size:
+            if self._sizes.pop(key, None) is not None:
+                del self._keys[bisect_left(self._keys, key)]
+        else:
+            if key not in self._sizes:
+                insort(self._keys, key)
+            self._sizes[key] = size
+
+    def best(self):
+        """Best price on this side
+
+        Returns:
+            Float: Best price, None when the side is empty
+        """
+        return self._sign * self._keys[0] if self._keys else None
+
+    def levels(self, depth: int = None):
+        """Levels best first
+
+        Args:
+            depth (int): Levels to return, None for all. Defaults to None.
+
+        Returns:
+            List: [price, size] levels
+        """
+        keys = self._keys if depth is None else self._keys[:depth]
+        return [[self._sign * key, self._sizes[key]] for key in keys]
+
+
+class OrderBookStream:
+    def __init__(
+        self,
+        symbol: str,
+        markets: MarketCache = MARKETS,
+        endpoint: object = None,
+        url: str = WS_URL,
+    ):
+        self.symbol = symbol
+        self._markets = markets
+        # Only used to look up the market and parse levels, never for requests
+        self._endpoint = endpoint if endpoint else SESSIONS.endpoint()
+        self._market = None
+        self._channel = None
+        self._bids = _Side(descending=True)
+        self._asks = _Side(descending=False)
+        self._timestamp = None
+        self._sequence = None
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._waiters = []
+        self._callbacks = []
+        self._connection = Connection(
+            url,
+            on_open=self._subscribe,
+            on_message=self._handle,
+            on_close=self._synced.clear,
+        )
+        self.resyncs = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def __aenter__(self):
+        await self.astart()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    @property
+    def synced(self):
+        """Check if the book holds a snapshot and every update since
+
+        Returns:
+            Bool: Book is current
+        """
+        return self._synced.is_set()
+
+    async def _subscribe(self, connection: Connection):
+        """Subscribe on every connect, Phemex replies with a snapshot
+
+        Args:
+            connection (Connection): Newly opened connection
+        """
+        try:
+            await connection.request(f"{self._channel}.subscribe", [self._market["id"]])
+        except NetworkError:
+            # Dropped before the reply, the next connect subscribes again
+            pass
+
+    def _handle(self, message: dict):
+        """Apply a snapshot or incremental update
+
+        Args:
+            message (dict): Decoded book message
+        """
+        if message.get("symbol") != self._market["id"]:
+            return
+        book = message.get("book") or message.get("orderbook_p")
+        if book is None:
+            return
+
+        endpoint = self._endpoint
+        sequence = endpoint.safe_integer(message, "sequence")
+        timestamp = endpoint.safe_integer_product(message, "timestamp", 0.000001)
+        with self._lock:
+            if message.get("type") == "snapshot":
+                self._bids.clear()
+                self._asks.clear()
+            elif not self.synced:
+                # Updates before the snapshot are already part of it
+                return
+            elif sequence is None or sequence <= self._sequence:
+                self._resync()
+                return
+
+            try:
+                for level in book.get("bids", []):
+                    self._bids.update(
+                        *endpoint.custom_parse_bid_ask(level, 0, 1, self._market)
+                    )
+                for level in book.get("asks", []):
+                    self._asks.update(
+                        *endpoint.custom_parse_bid_ask(level, 0, 1, self._market)
+                    )
+            except Exception:
+                # Partly applied, only a fresh snapshot can be trusted
+                self._resync()
+                raise
+            self._sequence = sequence
+            self._timestamp = timestamp
+
+            bid, ask = self._bids.best(), self._asks.best()
+            if bid is not None and ask is not None and bid >= ask:
+                # A crossed book means an update was lost
+                self._resync()
+                return
+
+            self._synced.set()
+            self._wake()
+
+        for callback in self._callbacks:
+            notify(callback, self)
+
+    def _resync(self):
+        """Drop the book and reconnect for a fresh snapshot"""
+        self._synced.clear()
+        self.resyncs += 1
+        asyncio.ensure_future(self._connection.reconnect())
+
+    def _wake(self):
+        """Resolve coroutines waiting in aready"""
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.get_loop().call_soon_threadsafe(
+                    lambda w=waiter: w.done() or w.set_result(True)
+                )
+
+    def listen(self, callback: object):
+        """Call callback with this stream after every applied update
+
+        Args:
+            callback (object): Function taking the stream, runs on the stream's event loop
+        """
+        self._callbacks.append(callback)
+
+    def orderbook(self, depth: int = None):
+        """Current book
+
+        Args:
+            depth (int): Levels per side to return. Defaults to None (all).
+
+        Raises:
+            NetworkError: Book is not synced
+
+        Returns:
+            OrderBook: Current orderbook for symbol, reads like the ccxt dictionary
+        """
+        with self._lock:
+            if not self.synced:
+                raise NetworkError(f"Orderbook stream for {self.symbol} is not synced")
+            return OrderBook(
+                self.symbol,
+                self._bids.levels(depth),
+                self._asks.levels(depth),
+                self._timestamp,
+                self._sequence,
+            )
+
+    def ready(self, timeout: float = None):
+        """Block until the book is synced
+
+        Args:
+            timeout (float): Seconds to wait. Defaults to None.
+
+        Returns:
+            Bool: Book is synced
+        """
+        return self._synced.wait(timeout)
+
+    async def aready(self, timeout: float = None):
+        """Wait until the book is synced
+
+        Args:
+            timeout (float): Seconds to wait. Defaults to None.
+
+        Returns:
+            Bool: Book is synced
+        """
+        with self._lock:
+            if self.synced:
+                return True
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return False
+
+    async def astart(self):
+        """Connect and subscribe on the running event loop"""
+        if self._market is None:
+            await load_markets(self._markets, self._endpoint)
+            self._market = self._endpoint.market(self.symbol)
+            self._channel = channel(self._market, "orderbook")
+        await self._connection.start()
+
+    async def aclose(self):
+        """Unsubscribe by closing the connection"""
+        await self._connection.close()
+        self._synced.clear()
+
+    def start(self):
+        """Connect and subscribe on the shared background event loop"""
+        LOOP.run(self.astart())
+
+    def close(self):
+        """Close a stream started with start"""
+        LOOP.run(self.aclose())
@@ -0,0 +1,201 @@
+"""Live candles built from a trade stream and handed off to the candle store"""
+
+import asyncio
+import ccxt
+
+from phemexboy.api.store import OhlcvStore, STORE
+from phemexboy.api.ws.connection import notify
+from phemexboy.api.ws.loop import LOOP
+from phemexboy.api.ws.trades import TradeStream
+from phemexboy.helpers.resample import CandleBuilder, resolution
+
+
+class CandleStream:
+    def __init__(
+        self,
+        trades: TradeStream,
+        tfs: list,
+        client: object = None,
+        store: OhlcvStore = STORE,
+        delay: float = 0.5,
+    ):
+        self.symbol = trades.symbol
+        self._trades = trades
+        self._tfs = list(tfs)
+        self._builder = CandleBuilder(tfs)
+        self._lengths = {tf: resolution(tf) for tf in tfs}
+        # Closed candles are stored only when a client can fetch what trades miss
+        self._client = client
+        self._store = store
+        # Trades for a bucket may still arrive shortly after it ends
+        self._delay = delay
+        self._epoch = None
+        # Per timeframe, buckets up to this open time may be missing trades
+        self._suspect = dict.fromkeys(tfs)
+        self._callbacks = []
+        self._queue = None
+        self._tasks = []
+        self._running = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def __aenter__(self):
+        await self.astart()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    @property
+    def tfs(self):
+        """Timeframes being built
+
+        Returns:
+            List: Timeframes
+        """
+        return list(self._tfs)
+
+    def partial(self, tf: str):
+        """Candle still being built
+
+        Args:
+            tf (str): Timeframe of the candle
+
+        Returns:
+            Array: Single candle with OHLCV dtype, None when nothing traded since the last close
+        """
+        return self._builder.partial(tf)
+
+    def listen(self, callback: object):
+        """Call callback with (tf, candles) whenever candles close
+
+        Args:
+            callback (object): Function taking the timeframe and closed candles with OHLCV dtype, runs on the stream's event loop
+        """
+        self._callbacks.append(callback)
+
+    def _on_trades(self, trades: object):
+        """Fold a batch of new trades into the candles
+
+        Args:
+            trades (object): TRADE array, oldest first
+        """
+        if self._trades.epoch != self._epoch:
+            # First batch after a (re)connect, the bucket it starts in saw only part of its trades
+            self._epoch = self._trades.epoch
+            first = int(trades["timestamp"][0])
+            for tf, length in self._lengths.items():
+                self._suspect[tf] = first - first % length
+        self._emit(self._builder.update(trades))
+
+    def _emit(self, closed: dict):
+        """Hand closed candles to listeners and the store
+
+        Args:
+            closed (dict): Candles with OHLCV dtype per timeframe
+        """
+        for tf, bars in closed.items():
+            if not len(bars):
+                continue
+            for callback in self._callbacks:
+                notify(callback, tf, bars)
+            if self._queue is not None:
+                self._queue.put_nowait((tf, bars))
+
+    async def _tick(self):
+        """Close buckets at their boundary when no later trade arrives"""
+        shortest = min(self._lengths.values())
+        while True:
+            now = ccxt.Exchange.milliseconds()
+            await asyncio.sleep((shortest - now % shortest) / 1000 + self._delay)
+            # Empty buckets seen while disconnected may have had trades
+            if self._trades.synced:
+                now = ccxt.Exchange.milliseconds() - int(self._delay * 1000)
+                self._emit(self._builder.flush(now))
+
+    async def _backfill(self, tf: str):
+        """Fetch closed candles the store is missing over REST
+
+        Args:
+            tf (str): Timeframe of the candles
+        """
+        client = self._client
+        try:
+            if asyncio.iscoroutinefunction(client.ohlcv):
+                await self._store.aupdate(client, self.symbol, tf)
+            else:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None, self._store.update, client, self.symbol, tf
+                )
+        except (ccxt.NetworkError, ccxt.ExchangeError):
+            # Retried before the next candles are stored
+            pass
+
+    async def _persist(self):
+        """Append closed candles to the store in order, backfilling over REST first"""
+        # Store reads and writes run off the event loop that also reads the socket
+        loop = asyncio.get_running_loop()
+        while True:
+            tf, bars = await self._queue.get()
+            length = self._lengths[tf]
+            suspect = self._suspect[tf]
+            if suspect is not None:
+                bars = bars[bars["timestamp"] > suspect]
+            if not len(bars):
+                continue
+
+            last = await loop.run_in_executor(None, self._store.last, self.symbol, tf)
+            if last is None or last + length < bars["timestamp"][0]:
+                await self._backfill(tf)
+                last = await loop.run_in_executor(
+                    None, self._store.last, self.symbol, tf
+                )
+            if last is None or last + length < bars["timestamp"][0]:
+                # REST is not caught up yet, the next backfill fetches these too
+                continue
+            await loop.run_in_executor(
+                None, self._store.append, self.symbol, tf, bars.tolist()
+            )
+
+    async def astart(self):
+        """Start building candles on the running event loop, the trade stream must be started"""
+        if self._running:
+            return
+        self._running = True
+        # Candles left from a previous run would be filled flat across the pause
+        self._builder = CandleBuilder(self._tfs)
+        self._epoch = None
+        self._suspect = dict.fromkeys(self._tfs)
+        if self._client is not None:
+            self._queue = asyncio.Queue()
+            for tf in self.tfs:
+                await self._backfill(tf)
+            self._tasks.append(asyncio.ensure_future(self._persist()))
+        self._tasks.append(asyncio.ensure_future(self._tick()))
+        self._trades.listen(self._on_trades)
+
+    async def aclose(self):
+        """Stop building candles, the partial candles are dropped"""
+        if not self._running:
+            return
+        self._running = False
+        self._trades.unlisten(self._on_trades)
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._queue = None
+
+    def start(self):
+        """Start building candles on the shared background event loop"""
+        LOOP.run(self.astart())
+
+    def close(self):
+        """Stop a stream started with start"""
+        LOOP.run(self.aclose())
@@ -0,0 +1,231 @@
+"""Websocket connection to Phemex with heartbeats, requests and reconnects"""
+
+import json
+import asyncio
+import itertools
+import websockets
+
+from ccxt import ExchangeError, NetworkError
+
+# Public and private streams share this endpoint
+WS_URL = "wss://ws.phemex.com"
+
+
+async def load_markets(markets: object, endpoint: object):
+    """Load markets into endpoint without blocking the event loop
+
+    Args:
+        markets (object): MarketCache holding the markets
+        endpoint (object): ccxt exchange, sync or async
+    """
+    if asyncio.iscoroutinefunction(endpoint.load_markets):
+        await markets.aload(endpoint)
+    else:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, markets.load, endpoint)
+
+
+def channel(market: dict, name: str):
+    """Name of the public channel streaming market
+
+    Args:
+        market (dict): ccxt market
+        name (str): Channel name (ex. 'trade')
+
+    Returns:
+        String: Channel name, suffixed with _p for USDT and USDC perpetuals
+    """
+    if market["linear"] and market["settle"] in ["USDT", "USDC"]:
+        return f"{name}_p"
+    return name
+
+
+def notify(callback: object, *args):
+    """Call a listener, printing instead of raising so the stream keeps reading
+
+    Args:
+        callback (object): Function added with listen
+    """
+    try:
+        callback(*args)
+    except Exception as e:
+        print(f"Websocket listener {callback} failed: {e}")
+
+
+class Connection:
+    def __init__(
+        self,
+        url: str = WS_URL,
+        on_open: object = None,
+        on_message: object = None,
+        on_close: object = None,
+        heartbeat: float = 10,
+        timeout: float = 10,
+    ):
+        self._url = url
+        self._on_open = on_open
+        self._on_message = on_message
+        self._on_close = on_close
+        self._heartbeat = heartbeat
+        self._timeout = timeout
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._socket = None
+        self._task = None
+        self._closed = False
+        self._retry = False
+
+    @property
+    def connected(self):
+        """Check if the socket is open
+
+        Returns:
+            Bool: Socket is open
+        """
+        return self._socket is not None
+
+    async def start(self):
+        """Connect in the background, reconnecting until closed"""
+        self._closed = False
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        """Keep a socket open, replaying on_open after every connect and on_close after every drop"""
+        delay = 1
+        while not self._closed:
+            try:
+                async with websockets.connect(self._url) as socket:
+                    self._socket = socket
+                    delay = 1
+                    await self._serve(socket)
+            except (OSError, asyncio.TimeoutError, websockets.WebSocketException):
+                pass
+            except Exception as e:
+                # Anything else reconnects too instead of ending the reader for good
+                print(f"Websocket {self._url} failed: {e}")
+            finally:
+                self._socket = None
+                self._fail(NetworkError(f"Websocket {self._url} disconnected"))
+                if self._on_close:
+                    # Streams stop reporting synced until the next connect catches up
+                    notify(self._on_close)
+
+            if self._retry:
+                # Reconnect requested, the connection itself is fine
+                self._retry = False
+            elif not self._closed:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+
+    async def _serve(self, socket: object):
+        """Read messages until the socket closes
+
+        Args:
+            socket (object): Open websocket
+        """
+        tasks = [asyncio.ensure_future(self._beat())]
+        if self._on_open:
+            # Runs alongside the reader, its requests wait on replies read below
+            tasks.append(asyncio.ensure_future(self._on_open(self)))
+        try:
+            async for raw in socket:
+                self._dispatch(raw)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _beat(self):
+        """Ping the server so it keeps the connection open"""
+        while True:
+            await asyncio.sleep(self._heartbeat)
+            try:
+                await self.request("server.ping")
+            except (ExchangeError, NetworkError):
+                pass
+
+    def _dispatch(self, raw: str):
+        """Hand replies to their requests and everything else to on_message
+
+        A message that fails to decode or to be handled is printed and skipped.
+
+        Args:
+            raw (str): Message as received
+        """
+        try:
+            message = json.loads(raw)
+        except ValueError as e:
+            print(f"Websocket {self._url} sent an unreadable message: {e}")
+            return
+        if not isinstance(message, dict):
+            return
+
+        future = self._pending.pop(message.get("id"), None)
+        if future is None:
+            if self._on_message:
+                try:
+                    self._on_message(message)
+                except Exception as e:
+                    print(f"Websocket {self._url} failed to handle a message: {e}")
+        elif future.done():
+            pass
+        elif message.get("error"):
+            future.set_exception(ExchangeError(f"{message['error']}"))
+        else:
+            future.set_result(message.get("result"))
+
+    def _fail(self, error: Exception):
+        """Fail every request still waiting for a reply
+
+        Args:
+            error (Exception): Raised by the waiting requests
+        """
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def request(self, method: str, params: list = None):
+        """Send a request and wait for its reply
+
+        Args:
+            method (str): Phemex method (ex. 'orderbook.subscribe')
+            params (list): Method parameters. Defaults to None.
+
+        Raises:
+            NetworkError: Not connected or no reply within timeout
+            ExchangeError: Phemex rejected the request
+
+        Returns:
+            Any: Result of the request
+        """
+        if self._socket is None:
+            raise NetworkError(f"Websocket {self._url} is not connected")
+
+        id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[id] = future
+        message = {"id": id, "method": method, "params": params or []}
+        try:
+            await self._socket.send(json.dumps(message))
+            return await asyncio.wait_for(future, self._timeout)
+        except asyncio.TimeoutError:
+            raise NetworkError(f"Websocket {self._url} did not reply to {method}")
+        except websockets.WebSocketException as e:
+            raise NetworkError(f"Websocket {self._url} failed to send {method}: {e}")
+        finally:
+            self._pending.pop(id, None)
+
+    async def reconnect(self):
+        """Drop the socket and connect again straight away"""
+        if self._socket is not None:
+            self._retry = True
+            await self._socket.close()
+
+    async def close(self):
+        """Close the socket and stop reconnecting"""
+        self._closed = True
+        if self._socket is not None:
+            await self._socket.close()
+        if self._task is not None:
+            await self._task
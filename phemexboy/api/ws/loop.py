@@ -0,0 +1,56 @@
+"""Background event loop running websocket streams for synchronous callers"""
+
+import asyncio
+import threading
+
+
+class EventLoopThread:
+    def __init__(self, name: str = "PhemexStream"):
+        self._name = name
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def loop(self):
+        """Retrieve the background event loop, starting its thread on first use
+
+        Returns:
+            AbstractEventLoop: Loop running on the background thread
+        """
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._loop.run_forever, name=self._name, daemon=True
+                )
+                thread.start()
+            return self._loop
+
+    def submit(self, coroutine: object):
+        """Schedule a coroutine without waiting for it
+
+        Args:
+            coroutine (object): Coroutine to run on the background loop
+
+        Returns:
+            Future: Resolves to the result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop())
+
+    def run(self, coroutine: object, timeout: float = None):
+        """Run a coroutine on the background loop and wait for the result
+
+        Args:
+            coroutine (object): Coroutine to run on the background loop
+            timeout (float): Seconds to wait. Defaults to None.
+
+        Raises:
+            Exception: Any
+
+        Returns:
+            Any: Result of the coroutine
+        """
+        return self.submit(coroutine).result(timeout)
+
+
+# Shared by all streams in the process
+LOOP = EventLoopThread()
@@ -0,0 +1,218 @@
+"""Public trades from Phemex's websocket trade channel kept in a ring buffer"""
+
+import asyncio
+import threading
+import numpy as np
+
+from ccxt import NetworkError
+from phemexboy.api.markets import MarketCache, MARKETS
+from phemexboy.api.session import SESSIONS
+from phemexboy.api.ws.connection import (
+    Connection,
+    WS_URL,
+    channel,
+    load_markets,
+    notify,
+)
+from phemexboy.api.ws.loop import LOOP
+from phemexboy.helpers.arrays import TRADE, TradeRing
+
+
+class TradeStream:
+    def __init__(
+        self,
+        symbol: str,
+        markets: MarketCache = MARKETS,
+        endpoint: object = None,
+        url: str = WS_URL,
+        capacity: int = 100000,
+    ):
+        self.symbol = symbol
+        self._markets = markets
+        # Only used to look up the market, never for requests
+        self._endpoint = endpoint if endpoint else SESSIONS.endpoint()
+        self._market = None
+        self._channel = None
+        self._price_scale = 1.0
+        self._size_scale = 1.0
+        # Newest trade in nanoseconds, snapshots after a reconnect repeat older ones
+        self._last = 0
+        self._synced = threading.Event()
+        self._callbacks = []
+        self._connection = Connection(
+            url,
+            on_open=self._subscribe,
+            on_message=self._handle,
+            on_close=self._synced.clear,
+        )
+        self.trades = TradeRing(capacity)
+        # Counts subscriptions, trades may have been missed between two of them
+        self.epoch = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def __aenter__(self):
+        await self.astart()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    def __len__(self):
+        return len(self.trades)
+
+    @property
+    def synced(self):
+        """Check if trades are arriving
+
+        Returns:
+            Bool: Snapshot received and connection open
+        """
+        return self._synced.is_set() and self._connection.connected
+
+    async def _subscribe(self, connection: Connection):
+        """Subscribe on every connect, Phemex replies with the latest trades
+
+        Args:
+            connection (Connection): Newly opened connection
+        """
+        self._synced.clear()
+        self.epoch += 1
+        try:
+            await connection.request(f"{self._channel}.subscribe", [self._market["id"]])
+        except NetworkError:
+            # Dropped before the reply, the next connect subscribes again
+            pass
+
+    def _parse(self, rows: list):
+        """Convert [nanoseconds, side, price, size] rows into trades, oldest first
+
+        Args:
+            rows (list): Raw trades
+
+        Returns:
+            Tuple: (TRADE array, nanosecond timestamps)
+        """
+        count = len(rows)
+        nanoseconds = np.fromiter((int(row[0]) for row in rows), np.int64, count)
+        order = np.argsort(nanoseconds, kind="stable")
+
+        trades = np.empty(count, dtype=TRADE)
+        trades["timestamp"] = nanoseconds // 1000000
+        trades["price"] = np.fromiter(
+            (float(row[2]) for row in rows), np.float64, count
+        )
+        trades["size"] = np.fromiter((float(row[3]) for row in rows), np.float64, count)
+        trades["side"] = np.fromiter(
+            (1 if row[1] == "Buy" else -1 for row in rows), np.int8, count
+        )
+        # Scaled integers except on the perpetual channel
+        trades["price"] /= self._price_scale
+        trades["size"] /= self._size_scale
+        return trades[order], nanoseconds[order]
+
+    def _handle(self, message: dict):
+        """Append new trades and call listeners
+
+        Args:
+            message (dict): Decoded trade message
+        """
+        if message.get("symbol") != self._market["id"]:
+            return
+        rows = message.get("trades", message.get("trades_p"))
+        if rows is None:
+            return
+
+        trades, nanoseconds = self._parse(rows)
+        fresh = nanoseconds > self._last
+        trades = trades[fresh]
+        if len(trades):
+            self._last = int(nanoseconds[fresh][-1])
+            self.trades.extend(trades)
+        self._synced.set()
+
+        if len(trades):
+            for callback in self._callbacks:
+                notify(callback, trades)
+
+    def listen(self, callback: object):
+        """Call callback with every batch of new trades
+
+        Args:
+            callback (object): Function taking a TRADE array, oldest first, runs on the stream's event loop
+        """
+        self._callbacks.append(callback)
+
+    def unlisten(self, callback: object):
+        """Stop calling a callback added with listen
+
+        Args:
+            callback (object): Function passed to listen
+        """
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def latest(self, n: int = None):
+        """Newest trades without copying or locking
+
+        Args:
+            n (int): Number of trades. Defaults to None (all kept).
+
+        Returns:
+            Array: TRADE view, oldest first, overwritten by later trades
+        """
+        return self.trades.latest(n)
+
+    def ready(self, timeout: float = None):
+        """Block until the first trades arrive
+
+        Args:
+            timeout (float): Seconds to wait. Defaults to None.
+
+        Returns:
+            Bool: Stream is synced
+        """
+        return self._synced.wait(timeout)
+
+    async def aready(self, timeout: float = None):
+        """Wait until the first trades arrive
+
+        Args:
+            timeout (float): Seconds to wait. Defaults to None.
+
+        Returns:
+            Bool: Stream is synced
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._synced.wait, timeout)
+
+    async def astart(self):
+        """Connect and subscribe on the running event loop"""
+        if self._market is None:
+            await load_markets(self._markets, self._endpoint)
+            market = self._endpoint.market(self.symbol)
+            self._channel = channel(market, "trade")
+            if self._channel == "trade":
+                self._price_scale = 10.0 ** market["priceScale"]
+                if market["spot"]:
+                    self._size_scale = 10.0 ** market["valueScale"]
+            self._market = market
+        await self._connection.start()
+
+    async def aclose(self):
+        """Unsubscribe by closing the connection"""
+        await self._connection.close()
+        self._synced.clear()
+
+    def start(self):
+        """Connect and subscribe on the shared background event loop"""
+        LOOP.run(self.astart())
+
+    def close(self):
+        """Close a stream started with start"""
+        LOOP.run(self.aclose())
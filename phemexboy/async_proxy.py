@@ -0,0 +1,1319 @@
+"""Async API Wrapper Module"""
+
+import os
+import ccxt.async_support as ccxt_async
+
+from ccxt import NetworkError, ExchangeError
+from dotenv import load_dotenv
+
+from .api.aio.public import AsyncPublicClient
+from .api.aio.auth.client import AsyncAuthClient
+from .exceptions import InvalidCodeError
+from .interfaces.aio.auth.client_interface import AsyncAuthClientInterface
+from .interfaces.aio.public_interface import AsyncPublicClientInterface
+
+load_dotenv()
+
+
+class AsyncProxy(AsyncPublicClientInterface, AsyncAuthClientInterface):
+    def __init__(self, verbose: bool = False):
+        self._verbose = verbose
+        try:
+            self._log("Connecting to AsyncPublicClient and AsyncAuthClient", end=", ")
+            # Public and auth requests share one session and rate limiter
+            self._endpoint = ccxt_async.phemex(
+                {
+                    "apiKey": os.getenv("KEY"),
+                    "secret": os.getenv("SECRET"),
+                    "enableRateLimit": True,
+                }
+            )
+            self._pub_client = AsyncPublicClient(endpoint=self._endpoint)
+            self._auth_client = AsyncAuthClient(endpoint=self._endpoint)
+        except NetworkError as e:
+            print(
+                f"NetworkError - Failed to initialize AsyncPublicClient and AsyncAuthClient: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - Failed to initialize AsyncPublicClient and AsyncAuthClient: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"Failed to initialize AsyncPublicClient and AsyncAuthClient: {e}")
+            raise
+        else:
+            self._log("done.")
+
+    def _log(self, msg: str, end: str = None):
+        """Print message to output if not silent
+
+        Args:
+            msg (str): Message to print to output
+            end (str): String appended after the last value. Default a newline.
+        """
+        if self._verbose:
+            print(msg, end=end)
+
+    # --------------------------- PublicClient Methods --------------------------- #
+
+    def timeframes(self):
+        """Retrieve all timeframes available for exchange
+
+        Raises:
+            Exception: PublicClient failed to retrieve timeframes
+
+        Returns:
+            List: All available timeframes
+        """
+        tfs = None
+        try:
+            self._log("Attempting to retrieve timeframes,", end=" ")
+            tfs = self._pub_client.timeframes()
+        except Exception as e:
+            print(f"PublicClient failed to retrieve timeframes: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return tfs
+
+    def codes(self):
+        """A list of markets that the exchange offers
+
+        Raises:
+            Exception: PublicClient failed to retrieve codes
+
+        Returns:
+            List: Available markets
+        """
+        codes = None
+        try:
+            self._log("Attempting to retrieve market codes,", end=" ")
+            codes = self._pub_client.codes()
+        except Exception as e:
+            print(f"PublicClient failed to retrieve codes: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return codes
+
+    async def currencies(self):
+        """Retrieve all currencies the exchange offers
+
+        Raises:
+            NetworkError: PublicClient failed to retrieve currencies
+            ExchangeError: PublicClient failed to retrieve currencies
+            Exception: PublicClient failed to retrieve currencies
+
+        Returns:
+            Dictionary: All exchange currencies
+        """
+        currencies = None
+        try:
+            self._log("Attempting to retrieve currencies,", end=" ")
+            currencies = await self._pub_client.currencies()
+        except NetworkError as e:
+            print(f"NetworkError - PublicClient failed to retrieve currencies: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - PublicClient failed to retrieve currencies: {e}")
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to retrieve currencies: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return currencies
+
+    def symbol(self, base: str, quote: str, code: str):
+        """Creates a symbol representing the asset pairing
+
+        Args:
+            base (str): Currency you are buying (ex. 'btc')
+            quote (str): Currency you are selling (ex. 'usd')
+            code (str): Market code (ex. 'spot')
+
+        Raises:
+            InvalidCodeError: Wrong market code
+            Exception: PublicClient failed to create symbol
+
+        Returns:
+            String: Formatted base and quote currency symbol
+        """
+        symbol = None
+        try:
+            if code not in self.codes():
+                raise InvalidCodeError()
+
+            self._log(
+                f"Creating symbol - base: {base}, quote: {quote}, code: {code},",
+                end=" ",
+            )
+            symbol = self._pub_client.symbol(base, quote, code)
+        except InvalidCodeError as e:
+            print(f"PublicClient failed to create symbol for {base} and {quote}: {e}")
+            print(
+                "\nPlease call proxy.codes() in order to retrieve the current market codes that are offered\n"
+            )
+            print(f"Codes: {self.codes()}")
+        except Exception as e:
+            print(f"PublicClient failed to create symbol: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return symbol
+
+    async def bbo(self, symbol: str):
+        """Retrieve best bid and best ask of asset pair
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NetworkError: PublicClient failed to retrieve best bid and ask for {symbol}
+            ExchangeError: PublicClient failed to retrieve best bid and ask for {symbol}
+            Exception: PublicClient failed to retrieve best bid and ask for {symbol}
+
+        Returns:
+            Dictionary: symbol, bid, ask and timestamp
+        """
+        bbo = None
+        try:
+            self._log(f"Attempting to retrieve best bid and ask for {symbol},", end=" ")
+            bbo = await self._pub_client.bbo(symbol)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to retrieve best bid and ask for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to retrieve best bid and ask for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to retrieve best bid and ask for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return bbo
+
+    async def price(self, symbol: str, side: str = "ask"):
+        """Retrieve price of asset pair
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            side (str): Side of the book, 'ask' or 'bid'. Defaults to 'ask'.
+
+        Raises:
+            InvalidSideError: Side must be either "ask" or "bid"
+            NetworkError: PublicClient failed to retrieve price for {symbol}
+            ExchangeError: PublicClient failed to retrieve price for {symbol}
+            Exception: PublicClient failed to retrieve price for {symbol}
+
+        Returns:
+            Float: Current best price on side for base currency
+        """
+        price = None
+        try:
+            self._log(f"Attempting to retrieve {side} price for {symbol},", end=" ")
+            price = await self._pub_client.price(symbol, side)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to retrieve price for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to retrieve price for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to retrieve price for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return price
+
+    async def tickers(self, symbols: list = None):
+        """Retrieve tickers for many symbols with one request per market kind
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies, None for every market. Defaults to None.
+
+        Raises:
+            NetworkError: PublicClient failed to retrieve tickers
+            ExchangeError: PublicClient failed to retrieve tickers
+            Exception: PublicClient failed to retrieve tickers
+
+        Returns:
+            Dictionary: Symbol -> ticker
+        """
+        tickers = None
+        try:
+            self._log(f"Attempting to retrieve tickers for {symbols},", end=" ")
+            tickers = await self._pub_client.tickers(symbols)
+        except NetworkError as e:
+            print(f"NetworkError - PublicClient failed to retrieve tickers: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - PublicClient failed to retrieve tickers: {e}")
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to retrieve tickers: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return tickers
+
+    async def prices(self, symbols: list, side: str = "ask"):
+        """Retrieve prices for many symbols at once
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+            side (str): Side of the book, 'ask' or 'bid'. Defaults to 'ask'.
+
+        Raises:
+            InvalidSideError: Side must be either "ask" or "bid"
+            NetworkError: PublicClient failed to retrieve prices
+            ExchangeError: PublicClient failed to retrieve prices
+            Exception: PublicClient failed to retrieve prices
+
+        Returns:
+            Dictionary: Symbol -> current best price on side
+        """
+        prices = None
+        try:
+            self._log(f"Attempting to retrieve {side} prices for {symbols},", end=" ")
+            prices = await self._pub_client.prices(symbols, side)
+        except NetworkError as e:
+            print(f"NetworkError - PublicClient failed to retrieve prices: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - PublicClient failed to retrieve prices: {e}")
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to retrieve prices: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return prices
+
+    async def ohlcv(
+        self,
+        symbol: str,
+        tf: str,
+        since: str = None,
+        until: str = None,
+        backfill: bool = False,
+        progress: object = None,
+        cache: bool = False,
+        as_array: bool = False,
+        as_frame: bool = False,
+    ):
+        """Retrieve the open - high - low - close - volume data from exchange
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (str): Optional start date for retrieving OHLCV data, YEAR-MONTH-DAY (ex. 2018-12-01), Default is None.
+            until (str): Optional date to stop backfilling before, YEAR-MONTH-DAY. Defaults to now.
+            backfill (bool): Page forward from since until now instead of returning a single page. Defaults to False.
+            progress (object): Called as progress(candles, timestamp, end) after each backfilled page. Defaults to None.
+            cache (bool): Read from the local store after fetching only candles newer than the last stored one,
+                since is where an empty store starts. Defaults to False.
+            as_array (bool): Return a structured array with OHLCV dtype instead of lists. Defaults to False.
+            as_frame (bool): Return a pandas DataFrame indexed by open time instead of lists. Defaults to False.
+
+        Raises:
+            NetworkError: PublicClient failed to retrieve candlestick data for {symbol} on timeframe {tf} since {since}
+            ExchangeError: PublicClient failed to retrieve candlestick data for {symbol} on timeframe {tf} since {since}
+            Exception: PublicClient failed to retrieve candlestick data for {symbol} on timeframe {tf} since {since}
+
+        Returns:
+            List: Candle data for timeframe, Array or DataFrame when requested
+        """
+        ohlcv = None
+        try:
+            self._log(
+                f"Attempting to retrieve candlestick data for {symbol} on timeframe {tf} since {since},",
+                end=" ",
+            )
+            ohlcv = await self._pub_client.ohlcv(
+                symbol, tf, since, until, backfill, progress, cache, as_array, as_frame
+            )
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to retrieve candlestick data for {symbol} on timeframe {tf} since {since}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to retrieve candlestick data for {symbol} on timeframe {tf} since {since}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(
+                f"PublicClient failed to retrieve candlestick data for {symbol} on timeframe {tf} since {since}: {e}"
+            )
+            raise
+        else:
+            self._log("done.")
+
+        return ohlcv
+
+    async def iter_ohlcv(
+        self,
+        symbol: str,
+        tf: str,
+        since: str,
+        until: str = None,
+        page_size: int = 1000,
+        as_array: bool = False,
+    ):
+        """Yield candle pages as they arrive instead of collecting the whole range
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (str): Start date, YEAR-MONTH-DAY (ex. 2018-12-01)
+            until (str): Date to stop before, YEAR-MONTH-DAY. Defaults to now.
+            page_size (int): Candles requested per page. Defaults to 1000.
+            as_array (bool): Yield structured arrays with OHLCV dtype instead of lists. Defaults to False.
+
+        Raises:
+            NetworkError: PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}
+            ExchangeError: PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}
+            Exception: PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}
+
+        Yields:
+            List: Candles newer than the previous page, oldest first
+        """
+        try:
+            self._log(
+                f"Streaming candlestick data for {symbol} on timeframe {tf} since {since}"
+            )
+            async for page in self._pub_client.iter_ohlcv(
+                symbol, tf, since, until, page_size, as_array
+            ):
+                yield page
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(
+                f"PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}: {e}"
+            )
+            raise
+
+    async def repair(self, symbol: str, tf: str, since: str = None, until: str = None):
+        """Refetch only the windows missing from the stored candles of symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the stored candles
+            since (str): Date the series should start at, YEAR-MONTH-DAY (ex. 2018-12-01). Defaults to None.
+            until (str): Date the series should reach, YEAR-MONTH-DAY. Defaults to None.
+
+        Raises:
+            NetworkError: PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}
+            ExchangeError: PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}
+            Exception: PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}
+
+        Returns:
+            Int: Number of candles added to the store
+        """
+        added = None
+        try:
+            self._log(
+                f"Attempting to repair candlestick data for {symbol} on timeframe {tf},",
+                end=" ",
+            )
+            added = await self._pub_client.repair(symbol, tf, since, until)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(
+                f"PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}: {e}"
+            )
+            raise
+        else:
+            self._log("done.")
+
+        return added
+
+    async def status(self):
+        """Retrieve the current network status of exchange
+
+        Raises:
+            NetworkError: PublicClient failed to retrieve exchange status
+            ExchangeError: PublicClient failed to retrieve exchange status
+            Exception: PublicClient failed to retrieve exchange status
+
+        Returns:
+            Dictionary: Current exchange status
+        """
+        status = None
+        try:
+            self._log("Attempting to retrieve exchange status,", end=" ")
+            status = await self._pub_client.status()
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to retrieve exchange status: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to retrieve exchange status: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to retrieve exchange status: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return status
+
+    async def orderbook(self, symbol: str, depth: int = None, info: bool = False):
+        """Retrieve orderbook for symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            depth (int): Levels per side to return, 30 or less uses Phemex's smaller book. Defaults to None (all).
+            info (bool): Include the raw exchange response as info. Defaults to False.
+
+        Raises:
+            NetworkError: PublicClient failed to retrieve orderbook for {symbol}
+            ExchangeError: PublicClient failed to retrieve orderbook for {symbol}
+            Exception: PublicClient failed to retrieve orderbook for {symbol}
+
+        Returns:
+            OrderBook: Current orderbook for symbol, reads like the ccxt dictionary
+        """
+        orderbook = None
+        try:
+            self._log(f"Attempting to retrieve orderbook for {symbol},", end=" ")
+            orderbook = await self._pub_client.orderbook(symbol, depth, info)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to retrieve orderbook for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to retrieve orderbook for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to retrieve orderbook for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return orderbook
+
+    async def watch_orderbook(self, symbol: str, timeout: float = 10):
+        """Keep the orderbook for symbol current over a websocket, orderbook() then reads it locally
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            timeout (float): Seconds to wait for the first snapshot. Defaults to 10.
+
+        Raises:
+            NetworkError: PublicClient failed to watch orderbook for {symbol}
+            ExchangeError: PublicClient failed to watch orderbook for {symbol}
+            Exception: PublicClient failed to watch orderbook for {symbol}
+
+        Returns:
+            OrderBookStream: Stream keeping the book current
+        """
+        stream = None
+        try:
+            self._log(f"Attempting to watch orderbook for {symbol},", end=" ")
+            stream = await self._pub_client.watch_orderbook(symbol, timeout)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to watch orderbook for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to watch orderbook for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to watch orderbook for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return stream
+
+    async def watch_trades(
+        self, symbol: str, capacity: int = 100000, timeout: float = 10
+    ):
+        """Stream public trades for symbol into a preallocated ring buffer
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            capacity (int): Trades kept before the oldest is overwritten. Defaults to 100000.
+            timeout (float): Seconds to wait for the first trades. Defaults to 10.
+
+        Raises:
+            NetworkError: PublicClient failed to watch trades for {symbol}
+            ExchangeError: PublicClient failed to watch trades for {symbol}
+            Exception: PublicClient failed to watch trades for {symbol}
+
+        Returns:
+            TradeStream: Stream holding the latest trades, read them with latest(n)
+        """
+        stream = None
+        try:
+            self._log(f"Attempting to watch trades for {symbol},", end=" ")
+            stream = await self._pub_client.watch_trades(symbol, capacity, timeout)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to watch trades for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to watch trades for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to watch trades for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return stream
+
+    async def watch_candles(self, symbol: str, tfs: list, timeout: float = 10):
+        """Build candles for symbol from its trade stream, storing them as they close
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tfs (list): Timeframes to build (ex. ['1m', '1h'])
+            timeout (float): Seconds to wait for the first trades. Defaults to 10.
+
+        Raises:
+            NetworkError: PublicClient failed to watch candles for {symbol}
+            ExchangeError: PublicClient failed to watch candles for {symbol}
+            Exception: PublicClient failed to watch candles for {symbol}
+
+        Returns:
+            CandleStream: Stream firing listeners as candles close, partial(tf) reads the open one
+        """
+        stream = None
+        try:
+            self._log(f"Attempting to watch candles for {symbol},", end=" ")
+            stream = await self._pub_client.watch_candles(symbol, tfs, timeout)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to watch candles for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to watch candles for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to watch candles for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return stream
+
+    async def unwatch_candles(self, symbol: str):
+        """Stop building candles for symbol, the trade stream keeps running
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            Exception: PublicClient failed to unwatch candles for {symbol}
+        """
+        try:
+            self._log(f"Attempting to unwatch candles for {symbol},", end=" ")
+            await self._pub_client.unwatch_candles(symbol)
+        except Exception as e:
+            print(f"PublicClient failed to unwatch candles for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+    async def unwatch_trades(self, symbol: str):
+        """Close the trade stream for symbol and the candles built from it
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            Exception: PublicClient failed to unwatch trades for {symbol}
+        """
+        try:
+            self._log(f"Attempting to unwatch trades for {symbol},", end=" ")
+            await self._pub_client.unwatch_trades(symbol)
+        except Exception as e:
+            print(f"PublicClient failed to unwatch trades for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+    async def unwatch_orderbook(self, symbol: str):
+        """Close the websocket book for symbol, orderbook() requests it again
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            Exception: PublicClient failed to unwatch orderbook for {symbol}
+        """
+        try:
+            self._log(f"Attempting to unwatch orderbook for {symbol},", end=" ")
+            await self._pub_client.unwatch_orderbook(symbol)
+        except Exception as e:
+            print(f"PublicClient failed to unwatch orderbook for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+    async def refresh_markets(self):
+        """Download market metadata now instead of waiting for the cache to expire
+
+        Raises:
+            NetworkError: PublicClient failed to refresh markets
+            ExchangeError: PublicClient failed to refresh markets
+            Exception: PublicClient failed to refresh markets
+        """
+        try:
+            self._log("Attempting to refresh markets,", end=" ")
+            # Markets are shared, refreshing once updates both clients
+            await self._pub_client.refresh_markets()
+        except NetworkError as e:
+            print(f"NetworkError - PublicClient failed to refresh markets: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - PublicClient failed to refresh markets: {e}")
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to refresh markets: {e}")
+            raise
+        else:
+            self._log("done.")
+
+    # ---------------------------- AuthClient Methods ---------------------------- #
+
+    async def balance(self, currency: str, code: str):
+        """Retrieve the balance of an asset on exchange
+
+        Args:
+            currency (str): The currency balance to retrieve (ex. 'BTC')
+            code (str): Market code (ex. 'spot')
+
+        Raises:
+            InvalidCodeError: Wrong code
+            NetworkError: AuthClient failed to retrieve balance for {currency} on {code} market
+            ExchangeError: AuthClient failed to retrieve balance for {currency} on {code} market
+            Exception: AuthClient failed to retrieve balance for {currency} on {code} market
+
+        Returns:
+            Float: Balance for account
+        """
+        balance = None
+        try:
+            if code not in self.codes():
+                raise InvalidCodeError()
+
+            self._log(
+                f"Attempting to retrieve the balance for {currency} on {code} market",
+                end=", ",
+            )
+            balance = await self._auth_client.balance(currency, code)
+        except InvalidCodeError as e:
+            print(f"AuthClient failed to retrieve balance for {currency}: {e}")
+            print(
+                "\nPlease call proxy.codes() in order to retrieve the current market codes that are offered\n"
+            )
+            print(f"Codes: {self.codes()}")
+        except NetworkError as e:
+            print(
+                f"NetworkError - AuthClient failed to retrieve balance for {currency} on {code} market: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AuthClient failed to retrieve balance for {currency} on {code} market: {e}"
+            )
+            raise
+        except Exception as e:
+            print(
+                f"AuthClient failed to retrieve balance for {currency} on {code} market: {e}"
+            )
+            raise
+        else:
+            self._log("done.")
+
+        return balance
+
+    async def buy(
+        self,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float = None,
+        config: dict = {},
+    ):
+        """Places a buy order
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (float): Amount of base currency you would like to buy
+            price (float, optional): Set limit order price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NetworkError: AuthClient failed to place order
+            ExchangeError: AuthClient failed to place order
+            Exception: AuthClient failed to place order
+
+        Returns:
+            OrderClient: Object that represents open order and allows for interaction
+        """
+        client = None
+        try:
+            self._log(
+                f"Attempting to place {type} buy order for {symbol} at {price} using {amount} with settings {config}",
+                end=", ",
+            )
+            client = await self._auth_client.buy(symbol, type, amount, price, config)
+            self._log(f"OrderClient retrieved", end=", ")
+        except NetworkError as e:
+            print(f"NetworkError - AuthClient failed to place order: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - AuthClient failed to place order: {e}")
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to place order: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return client
+
+    async def sell(
+        self,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float = None,
+        config: dict = {},
+    ):
+        """Places a sell order
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (float): Amount of base currency you would like to buy
+            price (float, optional): Set limit order price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NetworkError: AuthClient failed to place order
+            ExchangeError: AuthClient failed to place order
+            Exception: AuthClient failed to place order
+
+        Returns:
+            OrderClient: Object that represents open order and allows for interaction
+        """
+        client = None
+        try:
+            self._log(
+                f"Attempting to place {type} sell order for {symbol} at {price} using {amount} with settings {config}",
+                end=", ",
+            )
+            client = await self._auth_client.sell(symbol, type, amount, price, config)
+            self._log(f"OrderClient retrieved", end=", ")
+        except NetworkError as e:
+            print(f"NetworkError - AuthClient failed to place order: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - AuthClient failed to place order: {e}")
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to place order: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return client
+
+    async def long(
+        self,
+        symbol: str,
+        type: str,
+        amount: int,
+        price: float = None,
+        sl: float = None,
+        tp: float = None,
+        config: dict = {},
+    ):
+        """Open a long position
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (int): Number of contracts to open
+            price (float, optional): Set limit order price. Defaults to None.
+            sl (float, optional): Set stop loss price. Defaults to None.
+            tp (float, optional): Set take profit price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            Exception: AuthClient failed to open long position
+
+        Returns:
+            OrderClient: Object that represents open order and allows for interaction
+        """
+        client = None
+        try:
+            self._log(
+                f"Attempting to open long position with {type} buy order for {symbol} at {price} using {amount} with settings {config}",
+                end=", ",
+            )
+            client = await self._auth_client.long(
+                symbol, type, amount, price, sl, tp, config
+            )
+            self._log(f"OrderClient retrieved", end=", ")
+        except Exception as e:
+            print(f"AuthClient failed to open long position: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return client
+
+    async def short(
+        self,
+        symbol: str,
+        type: str,
+        amount: int,
+        price: float = None,
+        sl: float = None,
+        tp: float = None,
+        config: dict = {},
+    ):
+        """Open a short position
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (int): Number of contracts to open
+            price (float, optional): Set limit order price. Defaults to None.
+            sl (float, optional): Set stop loss price. Defaults to None.
+            tp (float, optional): Set take profit price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            Exception: AuthClient failed to open short position
+
+        Returns:
+            OrderClient: Object that represents open order and allows for interaction
+        """
+        client = None
+        try:
+            self._log(
+                f"Attempting to open short position with {type} buy order for {symbol} at {price} using {amount} with settings {config}",
+                end=", ",
+            )
+            client = await self._auth_client.short(
+                symbol, type, amount, price, sl, tp, config
+            )
+            self._log(f"OrderClient retrieved", end=", ")
+        except Exception as e:
+            print(f"AuthClient failed to open short position: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return client
+
+    async def leverage(self, amount: int, symbol: str):
+        """Set future account leverage
+
+        Args:
+            amount (int): Set leverage to this amount
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NetworkError: AuthClient failed to modify leverage
+            ExchangeError: AuthClient failed to modify leverage
+            Exception: AuthClient failed to modify leverage
+
+        Returns:
+            Bool: Leverage successfully set or not
+        """
+        success = False
+        try:
+            self._log(
+                f"Attempting to modify future account leverage to {amount} for {symbol}",
+                end=", ",
+            )
+            success = await self._auth_client.leverage(amount, symbol)
+        except NetworkError as e:
+            print(f"NetworkError - AuthClient failed to modify leverage: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - AuthClient failed to modify leverage: {e}")
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to modify leverage: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return success
+
+    async def position(self, symbol: str):
+        """Create a PositionClient representing the open position for symbol
+
+        Args:
+            symbol(str): Created symbol for base and quote currencies
+
+        Raises:
+            NetworkError: AuthClient failed to retrieve position for {symbol}
+            ExchangeError: AuthClient failed to retrieve position for {symbol}
+            Exception: AuthClient failed to retrieve position for {symbol}
+
+        Returns:
+            PositionClient: Represents open position and allows for interaction
+        """
+        client = None
+        try:
+            self._log(f"Attempting to retrieve position for {symbol}", end=", ")
+            client = await self._auth_client.position(symbol)
+            self._log(f"PositionClient retrieved", end=", ")
+        except NetworkError as e:
+            print(
+                f"NetworkError - AuthClient failed to retrieve position for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AuthClient failed to retrieve position for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to retrieve position for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return client
+
+    async def cancel(self, id: str, symbol: str):
+        """Cancel open order
+
+        Args:
+            id (str): Order id
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NetworkError: AuthClient failed to cancel order for {symbol} with id {id}
+            ExchangeError: AuthClient failed to cancel order for {symbol} with id {id}
+            Exception: AuthClient failed to cancel order for {symbol} with id {id}
+
+        Returns:
+            Dictionary: Order data
+        """
+        data = None
+        try:
+            self._log(f"Attempting to cancel order for {symbol} with id {id}", end=", ")
+            data = await self._auth_client.cancel(id, symbol)
+        except NetworkError as e:
+            print(
+                f"NetworkError - AuthClient failed to cancel order for {symbol} with id {id}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AuthClient failed to cancel order for {symbol} with id {id}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to cancel order for {symbol} with id {id}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return data
+
+    async def amend(
+        self,
+        id: str,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: float,
+        config: dict = {},
+    ):
+        """Amend open order in place, keeping its id and place in the book
+
+        Args:
+            id (str): Order id
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            side (str): Side of order ('buy' or 'sell')
+            amount (float): New amount of base currency
+            price (float): New limit order price
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NetworkError: AuthClient failed to amend order for {symbol} with id {id}
+            ExchangeError: AuthClient failed to amend order for {symbol} with id {id}
+            Exception: AuthClient failed to amend order for {symbol} with id {id}
+
+        Returns:
+            Dictionary: Order data
+        """
+        data = None
+        try:
+            self._log(
+                f"Attempting to amend order for {symbol} with id {id} to {amount} at {price}",
+                end=", ",
+            )
+            data = await self._auth_client.amend(
+                id, symbol, type, side, amount, price, config
+            )
+        except NetworkError as e:
+            print(
+                f"NetworkError - AuthClient failed to amend order for {symbol} with id {id}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AuthClient failed to amend order for {symbol} with id {id}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to amend order for {symbol} with id {id}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return data
+
+    async def order_status(self, id: str, symbol: str, client_id: str = None):
+        """Retrieve the state of a single order by id or client order id
+
+        Args:
+            id (str): Order id, ignored when client_id is given
+            symbol (str): Created symbol for base and quote currencies
+            client_id (str): Client order id set when placing the order. Defaults to None.
+
+        Raises:
+            NetworkError: AuthClient failed to retrieve status of order {id} for {symbol}
+            ExchangeError: AuthClient failed to retrieve status of order {id} for {symbol}
+            Exception: AuthClient failed to retrieve status of order {id} for {symbol}
+
+        Returns:
+            OrderStatus: State, filled amount and average price
+        """
+        data = None
+        try:
+            self._log(
+                f"Attempting to retrieve status of order {client_id or id} for {symbol}",
+                end=", ",
+            )
+            data = await self._auth_client.order_status(id, symbol, client_id)
+        except NetworkError as e:
+            print(
+                f"NetworkError - AuthClient failed to retrieve status of order {client_id or id} for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AuthClient failed to retrieve status of order {client_id or id} for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(
+                f"AuthClient failed to retrieve status of order {client_id or id} for {symbol}: {e}"
+            )
+            raise
+        else:
+            self._log("done.")
+
+        return data
+
+    async def orders(self, symbol: str):
+        """Retrieve all open orders for symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NetworkError: AuthClient failed to retrieve orders for {symbol}
+            ExchangeError: AuthClient failed to retrieve orders for {symbol}
+            Exception: AuthClient failed to retrieve orders for {symbol}
+
+        Returns:
+            List: All open orders
+        """
+        data = None
+        try:
+            self._log(f"Attempting to retrieve orders for {symbol}", end=", ")
+            data = await self._auth_client.orders(symbol)
+        except NetworkError as e:
+            print(
+                f"NetworkError - AuthClient failed to retrieve orders for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AuthClient failed to retrieve orders for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to retrieve orders for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return data
+
+    async def open_orders(self, symbol: str):
+        """Retrieve open orders for symbol from a snapshot shared by every order client
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NetworkError: AuthClient failed to retrieve open orders for {symbol}
+            ExchangeError: AuthClient failed to retrieve open orders for {symbol}
+            Exception: AuthClient failed to retrieve open orders for {symbol}
+
+        Returns:
+            Dictionary: Open orders by id, shared and must not be modified
+        """
+        data = None
+        try:
+            self._log(f"Attempting to retrieve open orders for {symbol}", end=", ")
+            data = await self._auth_client.open_orders(symbol)
+        except NetworkError as e:
+            print(
+                f"NetworkError - AuthClient failed to retrieve open orders for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AuthClient failed to retrieve open orders for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to retrieve open orders for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return data
+
+    async def watch_account(self, timeout: float = 10):
+        """Push order, fill and position updates from the private websocket into open clients
+
+        Args:
+            timeout (float): Seconds to wait for login and subscription. Defaults to 10.
+
+        Raises:
+            NetworkError: AuthClient failed to watch account
+            ExchangeError: AuthClient failed to watch account
+            Exception: AuthClient failed to watch account
+
+        Returns:
+            AccountStream: Stream pushing the updates
+        """
+        stream = None
+        try:
+            self._log("Attempting to watch account,", end=" ")
+            stream = await self._auth_client.watch_account(timeout)
+        except NetworkError as e:
+            print(f"NetworkError - AuthClient failed to watch account: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - AuthClient failed to watch account: {e}")
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to watch account: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return stream
+
+    async def unwatch_account(self):
+        """Close the private websocket, open clients request their state again
+
+        Raises:
+            Exception: AuthClient failed to unwatch account
+        """
+        try:
+            self._log("Attempting to unwatch account,", end=" ")
+            await self._auth_client.unwatch_account()
+        except Exception as e:
+            print(f"AuthClient failed to unwatch account: {e}")
+            raise
+        else:
+            self._log("done.")
+
+    # ------------------------------ Client Methods ------------------------------ #
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        """Close websocket streams, then the shared exchange session"""
+        await self._pub_client.close()
+        await self._auth_client.close()
+        await self._endpoint.close()
+
+    def verbose(self):
+        """Turn on logging"""
+        self._verbose = True
+
+    def silent(self):
+        """Turn off logging"""
+        self._verbose = False
@@ -10,9 +10,17 @@ class CancellationError(Exception):
     pass
 
 
+class OrderFilledError(Exception):
+    pass
+
+
 class InvalidRequestError(Exception):
     pass
 
 
 class InvalidPositionError(Exception):
     pass
+
+
+class InvalidSideError(Exception):
+    pass
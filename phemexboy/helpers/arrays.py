@@ -0,0 +1,155 @@
+"""Typed arrays for candle and trade data"""
+
+import numpy as np
+
+# One candle, timestamps in milliseconds
+OHLCV = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+
+# One trade, side is 1 for buys and -1 for sells
+TRADE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("price", "<f8"),
+        ("size", "<f8"),
+        ("side", "<i1"),
+    ]
+)
+
+
+def to_array(candles: list):
+    """Convert candles returned by the exchange into a structured array
+
+    Args:
+        candles (list): Candle data, [timestamp, open, high, low, close, volume] rows
+
+    Returns:
+        Array: Contiguous array with OHLCV dtype
+    """
+    return np.fromiter(map(tuple, candles), dtype=OHLCV, count=len(candles))
+
+
+def to_frame(data: object):
+    """Wrap candles in a pandas DataFrame indexed by open time
+
+    Args:
+        data (object): OHLCV structured array or dictionary of column arrays
+
+    Raises:
+        ImportError: pandas is not installed
+
+    Returns:
+        DataFrame: One row per candle, columns share memory with data
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError("pandas is required for DataFrames: pip install pandas")
+
+    columns = {name: data[name] for name in OHLCV.names}
+    index = pd.to_datetime(columns["timestamp"], unit="ms", utc=True)
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+class OhlcvBuffer:
+    def __init__(self, capacity: int = 1000):
+        self._data = np.empty(max(capacity, 1), dtype=OHLCV)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, candles: list):
+        """Append a page of candles, growing the buffer when full
+
+        Args:
+            candles (list): Candle data, oldest first
+        """
+        size = self._size + len(candles)
+        if size > len(self._data):
+            data = np.empty(max(size, 2 * len(self._data)), dtype=OHLCV)
+            data[: self._size] = self._data[: self._size]
+            self._data = data
+
+        self._data[self._size : size] = to_array(candles)
+        self._size = size
+
+    def array(self):
+        """Retrieve the candles appended so far
+
+        Returns:
+            Array: View of the filled part of the buffer
+        """
+        return self._data[: self._size]
+
+
+class TradeRing:
+    def __init__(self, capacity: int = 100000):
+        # Every trade is written twice, capacity apart, so the newest trades
+        # are always one contiguous slice and reading never copies
+        self._capacity = max(capacity, 1)
+        self._data = np.zeros(2 * self._capacity, dtype=TRADE)
+        self._count = 0
+
+    def __len__(self):
+        return min(self._count, self._capacity)
+
+    @property
+    def capacity(self):
+        """Number of trades kept
+
+        Returns:
+            Int: Trades kept before the oldest is overwritten
+        """
+        return self._capacity
+
+    @property
+    def count(self):
+        """Number of trades written since creation, including overwritten ones
+
+        Returns:
+            Int: Trades written
+        """
+        return self._count
+
+    def extend(self, trades: object):
+        """Write trades over the oldest ones
+
+        Args:
+            trades (object): TRADE structured array, oldest first
+        """
+        # Trades beyond capacity would be overwritten straight away
+        skipped = max(len(trades) - self._capacity, 0)
+        start = self._count + skipped
+        trades = trades[skipped:]
+
+        index = (start + np.arange(len(trades))) % self._capacity
+        self._data[index] = trades
+        self._data[index + self._capacity] = trades
+        # Readers only see the new trades once both copies are written
+        self._count = start + len(trades)
+
+    def latest(self, n: int = None):
+        """Newest trades without copying or locking
+
+        The view is overwritten by later trades, copy it to keep it.
+
+        Args:
+            n (int): Number of trades. Defaults to None (all kept).
+
+        Returns:
+            Array: View of up to n trades, oldest first
+        """
+        count = self._count
+        size = min(count, self._capacity)
+        n = size if n is None else min(n, size)
+        end = (count - 1) % self._capacity + self._capacity + 1 if count else 0
+        return self._data[end - n : end]
@@ -0,0 +1,52 @@
+"""Find missing candles in a series"""
+
+import numpy as np
+
+from phemexboy.helpers.resample import resolution
+
+
+def gaps(timestamps: object, tf: str, since: int = None, until: int = None):
+    """Find windows with no candles
+
+    Args:
+        timestamps (object): Array of candle open times in milliseconds, oldest first
+        tf (str): Timeframe of the candles
+        since (int): Millisecond timestamp the series should start at. Defaults to None.
+        until (int): Millisecond timestamp the series should reach. Defaults to None.
+
+    Returns:
+        Array: (start, end) rows of missing open times, end exclusive
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    length = resolution(tf)
+
+    if not len(timestamps):
+        if since is None or until is None or since >= until:
+            return np.empty((0, 2), dtype=np.int64)
+        return np.array([[since, until]], dtype=np.int64)
+
+    # A step longer than one candle skips every open time in between
+    steps = np.diff(timestamps)
+    holes = np.flatnonzero(steps > length)
+    windows = np.column_stack((timestamps[holes] + length, timestamps[holes + 1]))
+
+    if since is not None and since < timestamps[0]:
+        windows = np.vstack(([[since, timestamps[0]]], windows))
+    if until is not None and timestamps[-1] + length < until:
+        windows = np.vstack((windows, [[timestamps[-1] + length, until]]))
+    return windows.astype(np.int64)
+
+
+def missing(windows: object, tf: str):
+    """Count the candles missing from gap windows
+
+    Args:
+        windows (object): (start, end) rows returned by gaps
+        tf (str): Timeframe of the candles
+
+    Returns:
+        Int: Number of missing candles
+    """
+    windows = np.asarray(windows, dtype=np.int64).reshape(-1, 2)
+    length = resolution(tf)
+    return int(((windows[:, 1] - windows[:, 0] + length - 1) // length).sum())
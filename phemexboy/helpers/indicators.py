@@ -0,0 +1,340 @@
+"""Technical indicators over candle arrays
+
+Batch functions compute a whole series at once, values are NaN until enough
+candles have been seen. The classes hold rolling state and update in constant
+time per candle, returning the same values as the batch functions.
+"""
+
+import math
+import numpy as np
+
+from collections import deque
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _smooth(values: object, alpha: float, seed: float):
+    """Exponentially smooth values starting from seed
+
+    Runs in blocks short enough for the closed form to stay within float range,
+    y[i] = (1 - alpha) ** (i + 1) * seed + alpha * sum((1 - alpha) ** (i - k) * values[k])
+
+    Args:
+        values (object): Array to smooth
+        alpha (float): Weight of the newest value
+        seed (float): Smoothed value before the first one
+
+    Returns:
+        Array: Smoothed values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        return values.copy()
+
+    # Longest block where decay ** -block stays below 1e200
+    block = max(1, int(200 * math.log(10) / -math.log(decay)))
+    out = np.empty(len(values))
+    for start in range(0, len(values), block):
+        chunk = values[start : start + block]
+        powers = decay ** np.arange(len(chunk))
+        sums = np.cumsum(chunk / powers)
+        out[start : start + len(chunk)] = decay * powers * seed + alpha * powers * sums
+        seed = out[start + len(chunk) - 1]
+    return out
+
+
+def sma(values: object, period: int):
+    """Simple moving average
+
+    Args:
+        values (object): Array of prices
+        period (int): Number of candles to average
+
+    Returns:
+        Array: Averages, NaN for the first period - 1 candles
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1 :] = sliding_window_view(values, period).mean(axis=1)
+    return out
+
+
+def ema(values: object, period: int):
+    """Exponential moving average seeded with the simple average of the first period candles
+
+    Args:
+        values (object): Array of prices
+        period (int): Number of candles, weight of the newest is 2 / (period + 1)
+
+    Returns:
+        Array: Averages, NaN for the first period - 1 candles
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        seed = values[:period].mean()
+        out[period - 1] = seed
+        out[period:] = _smooth(values[period:], 2 / (period + 1), seed)
+    return out
+
+
+def _wilder(values: object, period: int):
+    """Wilder's moving average seeded with the simple average of the first period values
+
+    Args:
+        values (object): Array to smooth
+        period (int): Number of values, weight of the newest is 1 / period
+
+    Returns:
+        Array: Averages, NaN for the first period - 1 values
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        seed = values[:period].mean()
+        out[period - 1] = seed
+        out[period:] = _smooth(values[period:], 1 / period, seed)
+    return out
+
+
+def atr(high: object, low: object, close: object, period: int = 14):
+    """Average true range
+
+    Args:
+        high (object): Array of candle highs
+        low (object): Array of candle lows
+        close (object): Array of candle closes
+        period (int): Number of candles. Defaults to 14.
+
+    Returns:
+        Array: Average true range, NaN for the first period - 1 candles
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+
+    ranges = high - low
+    previous = close[:-1]
+    ranges[1:] = np.maximum.reduce(
+        [ranges[1:], np.abs(high[1:] - previous), np.abs(low[1:] - previous)]
+    )
+    return _wilder(ranges, period)
+
+
+def rsi(close: object, period: int = 14):
+    """Relative strength index
+
+    Args:
+        close (object): Array of candle closes
+        period (int): Number of candles. Defaults to 14.
+
+    Returns:
+        Array: Index between 0 and 100, NaN for the first period candles
+    """
+    close = np.asarray(close, dtype=np.float64)
+    out = np.full(len(close), np.nan)
+    if len(close) <= period:
+        return out
+
+    deltas = np.diff(close)
+    gains = _wilder(np.clip(deltas, 0, None), period)[period - 1 :]
+    losses = _wilder(np.clip(-deltas, 0, None), period)[period - 1 :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[period:] = np.where(losses == 0, 100.0, 100 - 100 / (1 + gains / losses))
+    return out
+
+
+def bollinger(close: object, period: int = 20, width: float = 2.0):
+    """Bollinger bands using the population standard deviation
+
+    Args:
+        close (object): Array of candle closes
+        period (int): Number of candles. Defaults to 20.
+        width (float): Standard deviations between the middle and outer bands. Defaults to 2.0.
+
+    Returns:
+        Tuple: (middle, upper, lower) arrays, NaN for the first period - 1 candles
+    """
+    close = np.asarray(close, dtype=np.float64)
+    middle = sma(close, period)
+    deviation = np.full(len(close), np.nan)
+    if len(close) >= period:
+        deviation[period - 1 :] = sliding_window_view(close, period).std(axis=1)
+    return middle, middle + width * deviation, middle - width * deviation
+
+
+class SMA:
+    def __init__(self, period: int):
+        self._period = period
+        self._window = deque(maxlen=period)
+        self._sum = 0.0
+        self.value = math.nan
+
+    def update(self, value: float):
+        """Add the newest price
+
+        Args:
+            value (float): Price of the newest candle
+
+        Returns:
+            Float: Current average, NaN until period candles are seen
+        """
+        if len(self._window) == self._period:
+            self._sum -= self._window[0]
+        self._window.append(value)
+        self._sum += value
+
+        if len(self._window) == self._period:
+            self.value = self._sum / self._period
+        return self.value
+
+
+class EMA:
+    def __init__(self, period: int):
+        self._alpha = 2 / (period + 1)
+        self._seed = SMA(period)
+        self.value = math.nan
+
+    def update(self, value: float):
+        """Add the newest price
+
+        Args:
+            value (float): Price of the newest candle
+
+        Returns:
+            Float: Current average, NaN until period candles are seen
+        """
+        if math.isnan(self.value):
+            self.value = self._seed.update(value)
+        else:
+            self.value += self._alpha * (value - self.value)
+        return self.value
+
+
+class _Wilder:
+    def __init__(self, period: int):
+        self._period = period
+        self._seen = 0
+        self._sum = 0.0
+        self.value = math.nan
+
+    def update(self, value: float):
+        """Add the newest value
+
+        Args:
+            value (float): Newest value
+
+        Returns:
+            Float: Current average, NaN until period values are seen
+        """
+        if self._seen < self._period:
+            self._seen += 1
+            self._sum += value
+            if self._seen == self._period:
+                self.value = self._sum / self._period
+        else:
+            self.value += (value - self.value) / self._period
+        return self.value
+
+
+class ATR:
+    def __init__(self, period: int = 14):
+        self._average = _Wilder(period)
+        self._close = None
+        self.value = math.nan
+
+    def update(self, high: float, low: float, close: float):
+        """Add the newest candle
+
+        Args:
+            high (float): Candle high
+            low (float): Candle low
+            close (float): Candle close
+
+        Returns:
+            Float: Current average true range, NaN until period candles are seen
+        """
+        true_range = high - low
+        if self._close is not None:
+            true_range = max(
+                true_range, abs(high - self._close), abs(low - self._close)
+            )
+        self._close = close
+        self.value = self._average.update(true_range)
+        return self.value
+
+
+class RSI:
+    def __init__(self, period: int = 14):
+        self._gains = _Wilder(period)
+        self._losses = _Wilder(period)
+        self._close = None
+        self.value = math.nan
+
+    def update(self, close: float):
+        """Add the newest close
+
+        Args:
+            close (float): Candle close
+
+        Returns:
+            Float: Current index between 0 and 100, NaN until period + 1 candles are seen
+        """
+        if self._close is not None:
+            delta = close - self._close
+            gain = self._gains.update(max(delta, 0.0))
+            loss = self._losses.update(max(-delta, 0.0))
+            if not math.isnan(gain):
+                self.value = 100.0 if loss == 0 else 100 - 100 / (1 + gain / loss)
+        self._close = close
+        return self.value
+
+
+class Bollinger:
+    def __init__(self, period: int = 20, width: float = 2.0):
+        self._period = period
+        self._width = width
+        self._window = deque(maxlen=period)
+        self._mean = 0.0
+        self._squares = 0.0
+        self._slides = 0
+        self.value = (math.nan, math.nan, math.nan)
+
+    def update(self, close: float):
+        """Add the newest close
+
+        Args:
+            close (float): Candle close
+
+        Returns:
+            Tuple: (middle, upper, lower), NaN until period candles are seen
+        """
+        if len(self._window) < self._period:
+            # Welford's update while the window fills
+            self._window.append(close)
+            delta = close - self._mean
+            self._mean += delta / len(self._window)
+            self._squares += delta * (close - self._mean)
+        else:
+            # Slide the window, replacing the oldest close
+            oldest = self._window[0]
+            self._window.append(close)
+            mean = self._mean + (close - oldest) / self._period
+            self._squares += (close - oldest) * (close - mean + oldest - self._mean)
+            self._mean = mean
+
+            # Rounding builds up as the window slides, recompute once per window
+            self._slides += 1
+            if self._slides == self._period:
+                self._slides = 0
+                self._mean = sum(self._window) / self._period
+                self._squares = sum((x - self._mean) ** 2 for x in self._window)
+
+        if len(self._window) == self._period:
+            deviation = math.sqrt(max(self._squares, 0.0) / self._period)
+            self.value = (
+                self._mean,
+                self._mean + self._width * deviation,
+                self._mean - self._width * deviation,
+            )
+        return self.value
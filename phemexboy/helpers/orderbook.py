@@ -0,0 +1,253 @@
+"""Order book backed by price and size arrays"""
+
+import ccxt
+import numpy as np
+
+from collections.abc import Mapping
+from phemexboy.exceptions import InvalidSideError
+
+# Keys of the dictionary ccxt returns for an order book
+KEYS = ("symbol", "bids", "asks", "timestamp", "datetime", "nonce")
+
+
+def _levels(levels: object):
+    """Convert [price, size] levels into an (n, 2) float array
+
+    Args:
+        levels (object): Price levels, best first
+
+    Returns:
+        Array: Price column then size column
+    """
+    data = np.asarray(levels, dtype=np.float64)
+    if not data.size:
+        return np.empty((0, 2))
+    return np.ascontiguousarray(data[:, :2])
+
+
+class OrderBook(Mapping):
+    def __init__(
+        self,
+        symbol: str,
+        bids: object,
+        asks: object,
+        timestamp: int = None,
+        nonce: int = None,
+        info: dict = None,
+    ):
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.nonce = nonce
+        self.info = info
+        # Bids highest price first, asks lowest price first
+        self._bids = _levels(bids)
+        self._asks = _levels(asks)
+        self._bid_depth = np.cumsum(self._bids[:, 1])
+        self._ask_depth = np.cumsum(self._asks[:, 1])
+
+    @classmethod
+    def from_ccxt(cls, data: dict):
+        """Build from the dictionary ccxt returns for an order book
+
+        Args:
+            data (dict): ccxt order book
+
+        Returns:
+            OrderBook: Book holding the same levels
+        """
+        return cls(
+            data.get("symbol"),
+            data["bids"],
+            data["asks"],
+            data.get("timestamp"),
+            data.get("nonce"),
+            data.get("info"),
+        )
+
+    # Read like the ccxt dictionary so existing callers keep working
+    def __getitem__(self, key: str):
+        if key == "bids":
+            return self._bids.tolist()
+        if key == "asks":
+            return self._asks.tolist()
+        if key == "datetime":
+            return ccxt.Exchange.iso8601(self.timestamp) if self.timestamp else None
+        if key in KEYS or (key == "info" and self.info is not None):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(KEYS + ("info",) if self.info is not None else KEYS)
+
+    def __len__(self):
+        return len(KEYS) + (self.info is not None)
+
+    def __str__(self):
+        return f"OrderBook({self.symbol}, bid={self.bid()}, ask={self.ask()}, levels={len(self._bids)}/{len(self._asks)})"
+
+    @property
+    def bids(self):
+        """Bid levels, highest price first
+
+        Returns:
+            Array: (n, 2) price and size, read only
+        """
+        view = self._bids.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def asks(self):
+        """Ask levels, lowest price first
+
+        Returns:
+            Array: (n, 2) price and size, read only
+        """
+        view = self._asks.view()
+        view.flags.writeable = False
+        return view
+
+    def _side(self, side: str):
+        """Levels an order on side executes against
+
+        Args:
+            side (str): 'buy' takes asks, 'sell' takes bids
+
+        Raises:
+            InvalidSideError: Side must be either "buy" or "sell"
+
+        Returns:
+            Tuple: (levels, cumulative sizes)
+        """
+        if side == "buy":
+            return self._asks, self._ask_depth
+        if side == "sell":
+            return self._bids, self._bid_depth
+        raise InvalidSideError('Side must be either "buy" or "sell"')
+
+    def bid(self):
+        """Best bid price
+
+        Returns:
+            Float: Highest bid, NaN when there are no bids
+        """
+        return float(self._bids[0, 0]) if len(self._bids) else np.nan
+
+    def ask(self):
+        """Best ask price
+
+        Returns:
+            Float: Lowest ask, NaN when there are no asks
+        """
+        return float(self._asks[0, 0]) if len(self._asks) else np.nan
+
+    def mid(self):
+        """Price halfway between best bid and best ask
+
+        Returns:
+            Float: Mid price, NaN when a side is empty
+        """
+        return (self.bid() + self.ask()) / 2
+
+    def spread(self, bps: bool = False):
+        """Distance between best ask and best bid
+
+        Args:
+            bps (bool): Return basis points of the mid price. Defaults to False.
+
+        Returns:
+            Float: Spread in quote currency or basis points
+        """
+        spread = self.ask() - self.bid()
+        return spread / self.mid() * 10000 if bps else spread
+
+    def depth(self, bps: float):
+        """Size resting within bps of the mid price
+
+        Args:
+            bps (float): Distance from mid in basis points
+
+        Returns:
+            Tuple: (bid size, ask size)
+        """
+        mid = self.mid()
+        band = mid * bps / 10000
+        # Bids descend, search their negated prices
+        bids = np.searchsorted(-self._bids[:, 0], -(mid - band), side="right")
+        asks = np.searchsorted(self._asks[:, 0], mid + band, side="right")
+        bid_size = self._bid_depth[bids - 1] if bids else 0.0
+        ask_size = self._ask_depth[asks - 1] if asks else 0.0
+        return float(bid_size), float(ask_size)
+
+    def vwap_to_fill(self, amount: float, side: str = "buy"):
+        """Average price of a market order for amount walking the book
+
+        Args:
+            amount (float): Size to fill
+            side (str): 'buy' takes asks, 'sell' takes bids. Defaults to 'buy'.
+
+        Raises:
+            InvalidSideError: Side must be either "buy" or "sell"
+
+        Returns:
+            Float: Volume weighted price, NaN when the book is too thin to fill amount
+        """
+        levels, cumulative = self._side(side)
+        if amount <= 0 or not len(levels) or cumulative[-1] < amount:
+            return np.nan
+
+        # Level that completes the fill, every level before it is taken whole
+        last = int(np.searchsorted(cumulative, amount, side="left"))
+        prices, sizes = levels[: last + 1, 0], levels[: last + 1, 1].copy()
+        sizes[-1] -= cumulative[last] - amount
+        return float(prices @ sizes / amount)
+
+    def imbalance(self, levels: int = 5):
+        """Share of resting size on the bid side of the top levels
+
+        Args:
+            levels (int): Levels per side to include. Defaults to 5.
+
+        Returns:
+            Float: Between -1 (all asks) and 1 (all bids), NaN when both sides are empty
+        """
+        bids = self._bids[:levels, 1].sum()
+        asks = self._asks[:levels, 1].sum()
+        total = bids + asks
+        return float((bids - asks) / total) if total else np.nan
+
+    def cost(self, amount: float, side: str = "buy", fee: float = 0.0):
+        """Estimate what a market order for amount pays beyond the mid price
+
+        Args:
+            amount (float): Size to fill
+            side (str): 'buy' takes asks, 'sell' takes bids. Defaults to 'buy'.
+            fee (float): Taker fee rate (ex. 0.0006). Defaults to 0.0.
+
+        Raises:
+            InvalidSideError: Side must be either "buy" or "sell"
+
+        Returns:
+            Float: Slippage plus fee in quote currency, NaN when the book is too thin
+        """
+        vwap = self.vwap_to_fill(amount, side)
+        slippage = abs(vwap - self.mid()) * amount
+        return float(slippage + vwap * amount * fee)
+
+    def top(self, levels: int):
+        """Keep only the best levels of each side
+
+        Args:
+            levels (int): Levels per side to keep
+
+        Returns:
+            OrderBook: Book limited to levels per side
+        """
+        return OrderBook(
+            self.symbol,
+            self._bids[:levels],
+            self._asks[:levels],
+            self.timestamp,
+            self.nonce,
+            self.info,
+        )
@@ -0,0 +1,266 @@
+"""Build higher timeframe candles from 1m candles or live trades"""
+
+import ccxt
+import numpy as np
+
+from phemexboy.helpers.arrays import OHLCV, to_array
+
+
+def resolution(tf: str):
+    """Length of a candle as Phemex buckets it
+
+    Phemex aligns klines to multiples of a fixed resolution since the epoch,
+    months count as 30 days and years as 360.
+
+    Args:
+        tf (str): Timeframe (ex. '4h')
+
+    Returns:
+        Int: Candle length in milliseconds
+    """
+    if tf.endswith("Y"):
+        return int(tf[:-1]) * 360 * 86400 * 1000
+    return ccxt.Exchange.parse_timeframe(tf) * 1000
+
+
+def _aggregate(data: object, length: int):
+    """Aggregate candles into buckets of length milliseconds
+
+    Args:
+        data (object): OHLCV structured array or dictionary of column arrays, oldest first
+        length (int): Bucket length in milliseconds
+
+    Returns:
+        Array: Candles with OHLCV dtype
+    """
+    timestamps = np.asarray(data["timestamp"])
+    if not len(timestamps):
+        return np.empty(0, dtype=OHLCV)
+
+    starts = timestamps - timestamps % length
+    # Index of the first and last candle in every bucket
+    edges = np.flatnonzero(np.diff(starts)) + 1
+    first = np.concatenate(([0], edges))
+    last = np.concatenate((edges - 1, [len(timestamps) - 1]))
+
+    bars = np.empty(len(first), dtype=OHLCV)
+    bars["timestamp"] = starts[first]
+    bars["open"] = np.asarray(data["open"])[first]
+    bars["high"] = np.maximum.reduceat(np.asarray(data["high"]), first)
+    bars["low"] = np.minimum.reduceat(np.asarray(data["low"]), first)
+    bars["close"] = np.asarray(data["close"])[last]
+    bars["volume"] = np.add.reduceat(np.asarray(data["volume"]), first)
+    return bars
+
+
+def resample(data: object, tf: str):
+    """Aggregate candles into a higher timeframe
+
+    Args:
+        data (object): OHLCV structured array or dictionary of column arrays, oldest first
+        tf (str): Timeframe to build (ex. '1h')
+
+    Returns:
+        Array: Candles with OHLCV dtype, the last one is partial when data ends mid candle
+    """
+    return _aggregate(data, resolution(tf))
+
+
+class Resampler:
+    def __init__(self, tf: str, base: str = "1m"):
+        self._length = resolution(tf)
+        self._base = resolution(base)
+        self._partial = None
+        self._last = None
+
+    @property
+    def partial(self):
+        """Candle still being built
+
+        Returns:
+            Array: Single candle with OHLCV dtype, None when no candle is open
+        """
+        return None if self._partial is None else self._partial[0]
+
+    def _complete(self, bar: object):
+        """Check if the last base candle seen closes bar
+
+        Args:
+            bar (object): Candle with OHLCV dtype
+
+        Returns:
+            Bool: No more base candles belong to bar
+        """
+        return self._last + self._base >= bar["timestamp"] + self._length
+
+    def update(self, candles: object):
+        """Fold closed base candles into the partial candle
+
+        Args:
+            candles (object): Closed base candles, list or OHLCV array, oldest first
+
+        Returns:
+            Array: Candles closed by this update with OHLCV dtype
+        """
+        data = candles if isinstance(candles, np.ndarray) else to_array(candles)
+        if self._last is not None:
+            # Candles already folded in are ignored
+            data = data[data["timestamp"] > self._last]
+        if not len(data):
+            return np.empty(0, dtype=OHLCV)
+
+        self._last = int(data["timestamp"][-1])
+        bars = _aggregate(data, self._length)
+
+        partial = self._partial
+        if partial is not None and partial["timestamp"][0] == bars["timestamp"][0]:
+            first = bars[0]
+            first["open"] = partial["open"][0]
+            first["high"] = max(partial["high"][0], first["high"])
+            first["low"] = min(partial["low"][0], first["low"])
+            first["volume"] += partial["volume"][0]
+        elif partial is not None:
+            bars = np.concatenate((partial, bars))
+
+        if self._complete(bars[-1]):
+            self._partial = None
+            return bars
+
+        self._partial = bars[-1:].copy()
+        return bars[:-1]
+
+
+def _fill(bars: object, length: int, start: int, stop: int, close: float):
+    """Lay bars on every bucket from start to stop, flat candles where nothing traded
+
+    Args:
+        bars (object): Candles with OHLCV dtype inside [start, stop), oldest first
+        length (int): Bucket length in milliseconds
+        start (int): Open time of the first bucket
+        stop (int): Open time after the last bucket
+        close (float): Close carried into empty buckets before the first bar
+
+    Returns:
+        Array: One candle with OHLCV dtype per bucket
+    """
+    timestamps = np.arange(start, stop, length, dtype=np.int64)
+    filled = np.zeros(len(timestamps), dtype=OHLCV)
+    filled["timestamp"] = timestamps
+    index = (bars["timestamp"] - start) // length
+    filled[index] = bars
+
+    traded = np.zeros(len(timestamps), dtype=bool)
+    traded[index] = True
+    # Empty buckets repeat the close of the last bucket that traded
+    source = np.where(traded, np.arange(len(timestamps)), -1)
+    np.maximum.accumulate(source, out=source)
+    closes = np.where(source >= 0, filled["close"][source], close)
+    empty = ~traded
+    for name in ("open", "high", "low", "close"):
+        filled[name][empty] = closes[empty]
+    return filled
+
+
+class CandleBuilder:
+    def __init__(self, tfs: list):
+        self._lengths = {tf: resolution(tf) for tf in tfs}
+        # Per timeframe: bucket still trading, first bucket not emitted, last emitted close
+        self._partial = dict.fromkeys(self._lengths)
+        self._next = dict.fromkeys(self._lengths)
+        self._close = dict.fromkeys(self._lengths)
+
+    @property
+    def tfs(self):
+        """Timeframes being built
+
+        Returns:
+            List: Timeframes
+        """
+        return list(self._lengths)
+
+    def partial(self, tf: str):
+        """Candle still being built
+
+        Args:
+            tf (str): Timeframe of the candle
+
+        Returns:
+            Array: Single candle with OHLCV dtype, None when nothing traded since the last close
+        """
+        partial = self._partial[tf]
+        return None if partial is None else partial[0]
+
+    def update(self, trades: object):
+        """Fold trades into the partial candles
+
+        A bucket closes once a trade lands in a later one, buckets skipped in
+        between are closed as flat candles with no volume.
+
+        Args:
+            trades (object): TRADE array, oldest first
+
+        Returns:
+            Dictionary: Candles closed by this update with OHLCV dtype per timeframe
+        """
+        data = np.empty(len(trades), dtype=OHLCV)
+        data["timestamp"] = trades["timestamp"]
+        for name in ("open", "high", "low", "close"):
+            data[name] = trades["price"]
+        data["volume"] = trades["size"]
+
+        closed = {}
+        for tf, length in self._lengths.items():
+            fresh = data
+            if self._next[tf] is not None:
+                # Trades arriving after their bucket was closed are dropped
+                fresh = data[data["timestamp"] >= self._next[tf]]
+            if not len(fresh):
+                closed[tf] = np.empty(0, dtype=OHLCV)
+                continue
+
+            bars = _aggregate(fresh, length)
+            partial = self._partial[tf]
+            if partial is not None and partial["timestamp"][0] == bars["timestamp"][0]:
+                first = bars[0]
+                first["open"] = partial["open"][0]
+                first["high"] = max(partial["high"][0], first["high"])
+                first["low"] = min(partial["low"][0], first["low"])
+                first["volume"] += partial["volume"][0]
+            elif partial is not None:
+                bars = np.concatenate((partial, bars))
+
+            start = self._next[tf]
+            if start is None:
+                start = int(bars["timestamp"][0])
+            stop = int(bars["timestamp"][-1])
+            closed[tf] = _fill(bars[:-1], length, start, stop, self._close[tf])
+            self._partial[tf] = bars[-1:].copy()
+            self._next[tf] = stop
+            if len(closed[tf]):
+                self._close[tf] = closed[tf]["close"][-1]
+        return closed
+
+    def flush(self, now: int):
+        """Close every bucket that ended by now, even without a later trade
+
+        Args:
+            now (int): Millisecond timestamp, no trade older than it is expected anymore
+
+        Returns:
+            Dictionary: Candles closed with OHLCV dtype per timeframe
+        """
+        closed = {}
+        for tf, length in self._lengths.items():
+            start = self._next[tf]
+            stop = now - now % length
+            if start is None or stop <= start:
+                closed[tf] = np.empty(0, dtype=OHLCV)
+                continue
+
+            partial = self._partial[tf]
+            bars = partial if partial is not None else np.empty(0, dtype=OHLCV)
+            closed[tf] = _fill(bars, length, start, stop, self._close[tf])
+            self._partial[tf] = None
+            self._next[tf] = stop
+            self._close[tf] = closed[tf]["close"][-1]
+        return closed
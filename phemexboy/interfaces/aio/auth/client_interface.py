@@ -0,0 +1,251 @@
+"""Async Auth Client Interface"""
+
+import abc
+
+
+class AsyncAuthClientInterface(abc.ABC):
+    @abc.abstractmethod
+    async def leverage(self, amount: int, symbol: str):
+        """Set future account leverage
+
+        Args:
+            amount (int): Set leverage to this amount
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NotImplementedError: Must implement when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def order_status(self, id: str, symbol: str, client_id: str = None):
+        """Retrieve the state of a single order by id or client order id
+
+        Args:
+            id (str): Order id, ignored when client_id is given
+            symbol (str): Created symbol for base and quote currencies
+            client_id (str): Client order id set when placing the order. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement before subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def balance(self, currency: str, code: str):
+        """Retrieve the balance of an asset on exchange
+
+        Args:
+            currency (str): The currency balance to retrieve (ex. 'BTC')
+            code (str): Market code (ex. 'spot')
+
+        Raises:
+            NotImplementedError: Must implement when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def position(self, symbol: str):
+        """Create a PositionClient representing the open position for symbol
+
+        Args:
+            symbol(str): Created symbol for base and quote currencies
+
+        Raises:
+            NotImplementedError: Must implement when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def buy(
+        self,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float = None,
+        config: dict = {},
+    ):
+        """Places a buy order
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (float): Amount of base currency you would like to buy
+            price (float, optional): Set limit order price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def sell(
+        self,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float = None,
+        config: dict = {},
+    ):
+        """Places a sell order
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (float): Amount of base currency you would like to buy
+            price (float, optional): Set limit order price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def long(
+        self,
+        symbol: str,
+        type: str,
+        amount: int,
+        price: float = None,
+        sl: float = None,
+        tp: float = None,
+        config: dict = {},
+    ):
+        """Open a long position
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (int): Number of contracts to open
+            price (float, optional): Set limit order price. Defaults to None.
+            sl (float, optional): Set stop loss price. Defaults to None.
+            tp (float, optional): Set take profit price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def short(
+        self,
+        symbol: str,
+        type: str,
+        amount: int,
+        price: float = None,
+        sl: float = None,
+        tp: float = None,
+        config: dict = {},
+    ):
+        """Open a short position
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            amount (int): Number of contracts to open
+            price (float, optional): Set limit order price. Defaults to None.
+            sl (float, optional): Set stop loss price. Defaults to None.
+            tp (float, optional): Set take profit price. Defaults to None.
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def orders(self, symbol: str):
+        """Retrieve all open orders for symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NotImplementedError: Must implement before subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def open_orders(self, symbol: str):
+        """Retrieve open orders for symbol from a snapshot shared by every order client
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NotImplementedError: Must implement before subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def cancel(self, id: str, symbol: str):
+        """Cancel open order
+
+        Args:
+            id (str): Order id
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NotImplementedError: Must implement before subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def amend(
+        self,
+        id: str,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: float,
+        config: dict = {},
+    ):
+        """Amend open order in place, keeping its id and place in the book
+
+        Args:
+            id (str): Order id
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            side (str): Side of order ('buy' or 'sell')
+            amount (float): New amount of base currency
+            price (float): New limit order price
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement before subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def watch_account(self, timeout: float = 10):
+        """Push order, fill and position updates from the private websocket into open clients
+
+        Args:
+            timeout (float): Seconds to wait for login and subscription. Defaults to 10.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def unwatch_account(self):
+        """Close the private websocket
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def refresh_markets(self):
+        """Download market metadata now instead of waiting for the cache to expire
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
@@ -0,0 +1,279 @@
+"""Async Public Client Interface"""
+
+import abc
+
+
+class AsyncPublicClientInterface(abc.ABC):
+    @abc.abstractmethod
+    def timeframes(self):
+        """Retrieve all timeframes available for exchange
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def codes(self):
+        """A list of markets that the exchange offers
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def symbol(self, base: str, quote: str, code: str):
+        """Creates a symbol representing the asset pairing
+
+        Args:
+            base (str): Currency you are buying (ex. 'btc')
+            quote (str): Currency you are selling (ex. 'usdt')
+            code (str): Market code (ex. 'spot')
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def bbo(self, symbol: str):
+        """Retrieve best bid and best ask of asset pair
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def price(self, symbol: str, side: str = "ask"):
+        """Retrieve price of asset pair
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            side (str): Side of the book, 'ask' or 'bid'. Defaults to 'ask'.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def tickers(self, symbols: list = None):
+        """Retrieve tickers for many symbols with one request per market kind
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies, None for every market. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def prices(self, symbols: list, side: str = "ask"):
+        """Retrieve prices for many symbols at once
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+            side (str): Side of the book, 'ask' or 'bid'. Defaults to 'ask'.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def ohlcv(
+        self,
+        symbol: str,
+        tf: str,
+        since: str = None,
+        until: str = None,
+        backfill: bool = False,
+        progress: object = None,
+        cache: bool = False,
+        as_array: bool = False,
+        as_frame: bool = False,
+    ):
+        """Retrieve the open - high - low - close - volume data from exchange
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (str): Optional start date for retrieving OHLCV data, YEAR-MONTH-DAY (ex. 2018-12-01)
+            until (str): Optional date to stop backfilling before, YEAR-MONTH-DAY. Defaults to now.
+            backfill (bool): Page forward from since until now instead of returning a single page. Defaults to False.
+            progress (object): Called as progress(candles, timestamp, end) after each backfilled page. Defaults to None.
+            cache (bool): Read from the local store after fetching only candles newer than the last stored one,
+                since is where an empty store starts. Defaults to False.
+            as_array (bool): Return a structured array with OHLCV dtype instead of lists. Defaults to False.
+            as_frame (bool): Return a pandas DataFrame indexed by open time instead of lists. Defaults to False.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def iter_ohlcv(
+        self,
+        symbol: str,
+        tf: str,
+        since: str,
+        until: str = None,
+        page_size: int = 1000,
+        as_array: bool = False,
+    ):
+        """Yield candle pages as they arrive instead of collecting the whole range
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (str): Start date, YEAR-MONTH-DAY (ex. 2018-12-01)
+            until (str): Date to stop before, YEAR-MONTH-DAY. Defaults to now.
+            page_size (int): Candles requested per page. Defaults to 1000.
+            as_array (bool): Yield structured arrays with OHLCV dtype instead of lists. Defaults to False.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def repair(self, symbol: str, tf: str, since: str = None, until: str = None):
+        """Refetch only the windows missing from the stored candles of symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the stored candles
+            since (str): Date the series should start at, YEAR-MONTH-DAY (ex. 2018-12-01). Defaults to None.
+            until (str): Date the series should reach, YEAR-MONTH-DAY. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def currencies(self):
+        """Retrieve all currencies the exchange offers
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def status(self):
+        """Retrieve the current network status of exchange
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def orderbook(self, symbol: str, depth: int = None, info: bool = False):
+        """Retrieve orderbook for symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            depth (int): Levels per side to return, 30 or less uses Phemex's smaller book. Defaults to None (all).
+            info (bool): Include the raw exchange response as info. Defaults to False.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def watch_orderbook(self, symbol: str, timeout: float = 10):
+        """Keep the orderbook for symbol current over a websocket
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            timeout (float): Seconds to wait for the first snapshot. Defaults to 10.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def watch_trades(
+        self, symbol: str, capacity: int = 100000, timeout: float = 10
+    ):
+        """Stream public trades for symbol into a preallocated ring buffer
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            capacity (int): Trades kept before the oldest is overwritten. Defaults to 100000.
+            timeout (float): Seconds to wait for the first trades. Defaults to 10.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def watch_candles(self, symbol: str, tfs: list, timeout: float = 10):
+        """Build candles for symbol from its trade stream, storing them as they close
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tfs (list): Timeframes to build (ex. ['1m', '1h'])
+            timeout (float): Seconds to wait for the first trades. Defaults to 10.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def unwatch_candles(self, symbol: str):
+        """Stop building candles for symbol, the trade stream keeps running
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def unwatch_trades(self, symbol: str):
+        """Close the trade stream for symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def unwatch_orderbook(self, symbol: str):
+        """Close the websocket book for symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def refresh_markets(self):
+        """Download market metadata now instead of waiting for the cache to expire
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
@@ -17,6 +17,20 @@ class AuthClientInterface(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def order_status(self, id: str, symbol: str, client_id: str = None):
+        """Retrieve the state of a single order by id or client order id
+
+        Args:
+            id (str): Order id, ignored when client_id is given
+            symbol (str): Created symbol for base and quote currencies
+            client_id (str): Client order id set when placing the order. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement before subclassing
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def balance(self, currency: str, code: str):
         """Retrieve the balance of an asset on exchange
@@ -154,6 +168,18 @@ class AuthClientInterface(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def open_orders(self, symbol: str):
+        """Retrieve open orders for symbol from a snapshot shared by every order client
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NotImplementedError: Must implement before subclassing
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def cancel(self, id: str, symbol: str):
         """Cancel open order
@@ -166,3 +192,60 @@ class AuthClientInterface(abc.ABC):
             NotImplementedError: Must implement before subclassing
         """
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def amend(
+        self,
+        id: str,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: float,
+        config: dict = {},
+    ):
+        """Amend open order in place, keeping its id and place in the book
+
+        Args:
+            id (str): Order id
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            side (str): Side of order ('buy' or 'sell')
+            amount (float): New amount of base currency
+            price (float): New limit order price
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement before subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def watch_account(self, timeout: float = 10):
+        """Push order, fill and position updates from the private websocket into open clients
+
+        Args:
+            timeout (float): Seconds to wait for login and subscription. Defaults to 10.
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def unwatch_account(self):
+        """Close the private websocket
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def refresh_markets(self):
+        """Download market metadata now instead of waiting for the cache to expire
+
+        Raises:
+            NotImplementedError: Must implement the method when subclassing
+        """
+        raise NotImplementedError
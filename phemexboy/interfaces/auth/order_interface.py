@@ -64,6 +64,15 @@ class OrderClientInterface(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def status(self):
+        """Retrieve this order by id instead of looking for it in open orders
+
+        Raises:
+            NotImplementedError: Must implement when subclassing
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def canceled(self):
         """Check if order was canceled
@@ -112,6 +121,31 @@ class OrderClientInterface(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def schedule_close(
+        self,
+        retry: bool = None,
+        wait: int = 2,
+        price: float = None,
+        tries: int = 1,
+        sl_percent: int = None,
+        tp_percent: int = None,
+    ):
+        """Waits until order is filled without blocking
+
+        Args:
+            retry (bool): Ensure limit order was successfully placed at current ask price
+            wait (int): The amount of time to wait until retry. Defaults to 2 seconds.
+            price (float): Price to retry order at. Defaults to None (will use current market price).
+            tries (int): Number of times to retry. Defaults to 1.
+            sl_percent: Set stop loss percent from price. Defaults to None.
+            tp_percent: Set take profit percent from price. Defaults to None.
+
+        Raises:
+            NotImplementedError: Must implement before subclassing
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def close(
         self,
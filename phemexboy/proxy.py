@@ -1,9 +1,14 @@
 """API Wrapper Module"""
 
+import os
+
 from ccxt import NetworkError, ExchangeError
 
 from .api.public import PublicClient
 from .api.auth.client import AuthClient
+from .api.session import SESSIONS
+from .api.pool import POOL
+from .api.downloader import OhlcvDownloader
 from .exceptions import InvalidCodeError
 from .interfaces.auth.client_interface import AuthClientInterface
 from .interfaces.public_interface import PublicClientInterface
@@ -14,8 +19,10 @@ class Proxy(PublicClientInterface, AuthClientInterface):
         self._verbose = verbose
         try:
             self._log("Connecting to PublicClient and AuthClient", end=", ")
-            self._pub_client = PublicClient()
-            self._auth_client = AuthClient()
+            # Public and auth requests share one session and rate limiter
+            endpoint = SESSIONS.endpoint(os.getenv("KEY"), os.getenv("SECRET"))
+            self._pub_client = PublicClient(endpoint=endpoint)
+            self._auth_client = AuthClient(endpoint=endpoint)
         except NetworkError as e:
             print(
                 f"NetworkError - Failed to initialize PublicClient and AuthClient: {e}"
@@ -154,24 +161,62 @@ class Proxy(PublicClientInterface, AuthClientInterface):
 
         return symbol
 
-    def price(self, symbol: str):
+    def bbo(self, symbol: str):
+        """Retrieve best bid and best ask of asset pair
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NetworkError: PublicClient failed to retrieve best bid and ask for {symbol}
+            ExchangeError: PublicClient failed to retrieve best bid and ask for {symbol}
+            Exception: PublicClient failed to retrieve best bid and ask for {symbol}
+
+        Returns:
+            Dictionary: symbol, bid, ask and timestamp
+        """
+        bbo = None
+        try:
+            self._log(f"Attempting to retrieve best bid and ask for {symbol},", end=" ")
+            bbo = self._pub_client.bbo(symbol)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to retrieve best bid and ask for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to retrieve best bid and ask for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to retrieve best bid and ask for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return bbo
+
+    def price(self, symbol: str, side: str = "ask"):
         """Retrieve price of asset pair
 
         Args:
             symbol (str): Created symbol for base and quote currencies
+            side (str): Side of the book, 'ask' or 'bid'. Defaults to 'ask'.
 
         Raises:
+            InvalidSideError: Side must be either "ask" or "bid"
             NetworkError: PublicClient failed to retrieve price for {symbol}
             ExchangeError: PublicClient failed to retrieve price for {symbol}
             Exception: PublicClient failed to retrieve price for {symbol}
 
         Returns:
-            Float: Current ask price for base currency
+            Float: Current best price on side for base currency
         """
         price = None
         try:
-            self._log(f"Attempting to retrieve price for {symbol},", end=" ")
-            price = self._pub_client.price(symbol)
+            self._log(f"Attempting to retrieve {side} price for {symbol},", end=" ")
+            price = self._pub_client.price(symbol, side)
         except NetworkError as e:
             print(
                 f"NetworkError - PublicClient failed to retrieve price for {symbol}: {e}"
@@ -190,13 +235,97 @@ class Proxy(PublicClientInterface, AuthClientInterface):
 
         return price
 
-    def ohlcv(self, symbol: str, tf: str, since: str = None):
+    def tickers(self, symbols: list = None):
+        """Retrieve tickers for many symbols with one request per market kind
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies, None for every market. Defaults to None.
+
+        Raises:
+            NetworkError: PublicClient failed to retrieve tickers
+            ExchangeError: PublicClient failed to retrieve tickers
+            Exception: PublicClient failed to retrieve tickers
+
+        Returns:
+            Dictionary: Symbol -> ticker
+        """
+        tickers = None
+        try:
+            self._log(f"Attempting to retrieve tickers for {symbols},", end=" ")
+            tickers = self._pub_client.tickers(symbols)
+        except NetworkError as e:
+            print(f"NetworkError - PublicClient failed to retrieve tickers: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - PublicClient failed to retrieve tickers: {e}")
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to retrieve tickers: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return tickers
+
+    def prices(self, symbols: list, side: str = "ask"):
+        """Retrieve prices for many symbols at once
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+            side (str): Side of the book, 'ask' or 'bid'. Defaults to 'ask'.
+
+        Raises:
+            InvalidSideError: Side must be either "ask" or "bid"
+            NetworkError: PublicClient failed to retrieve prices
+            ExchangeError: PublicClient failed to retrieve prices
+            Exception: PublicClient failed to retrieve prices
+
+        Returns:
+            Dictionary: Symbol -> current best price on side
+        """
+        prices = None
+        try:
+            self._log(f"Attempting to retrieve {side} prices for {symbols},", end=" ")
+            prices = self._pub_client.prices(symbols, side)
+        except NetworkError as e:
+            print(f"NetworkError - PublicClient failed to retrieve prices: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - PublicClient failed to retrieve prices: {e}")
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to retrieve prices: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return prices
+
+    def ohlcv(
+        self,
+        symbol: str,
+        tf: str,
+        since: str = None,
+        until: str = None,
+        backfill: bool = False,
+        progress: object = None,
+        cache: bool = False,
+        as_array: bool = False,
+        as_frame: bool = False,
+    ):
         """Retrieve the open - high - low - close - volume data from exchange
 
         Args:
             symbol (str): Created symbol for base and quote currencies
             tf (str): Timeframe to retrieve OHLCV data for
             since (str): Optional start date for retrieving OHLCV data, YEAR-MONTH-DAY (ex. 2018-12-01), Default is None.
+            until (str): Optional date to stop backfilling before, YEAR-MONTH-DAY. Defaults to now.
+            backfill (bool): Page forward from since until now instead of returning a single page. Defaults to False.
+            progress (object): Called as progress(candles, timestamp, end) after each backfilled page. Defaults to None.
+            cache (bool): Read from the local store after fetching only candles newer than the last stored one,
+                since is where an empty store starts. Defaults to False.
+            as_array (bool): Return a structured array with OHLCV dtype instead of lists. Defaults to False.
+            as_frame (bool): Return a pandas DataFrame indexed by open time instead of lists. Defaults to False.
 
         Raises:
             NetworkError: PublicClient failed to retrieve candlestick data for {symbol} on timeframe {tf} since {since}
@@ -204,7 +333,7 @@ class Proxy(PublicClientInterface, AuthClientInterface):
             Exception: PublicClient failed to retrieve candlestick data for {symbol} on timeframe {tf} since {since}
 
         Returns:
-            List: Candle data for timeframe
+            List: Candle data for timeframe, Array or DataFrame when requested
         """
         ohlcv = None
         try:
@@ -212,7 +341,9 @@ class Proxy(PublicClientInterface, AuthClientInterface):
                 f"Attempting to retrieve candlestick data for {symbol} on timeframe {tf} since {since},",
                 end=" ",
             )
-            ohlcv = self._pub_client.ohlcv(symbol, tf, since)
+            ohlcv = self._pub_client.ohlcv(
+                symbol, tf, since, until, backfill, progress, cache, as_array, as_frame
+            )
         except NetworkError as e:
             print(
                 f"NetworkError - PublicClient failed to retrieve candlestick data for {symbol} on timeframe {tf} since {since}: {e}"
@@ -233,6 +364,155 @@ class Proxy(PublicClientInterface, AuthClientInterface):
 
         return ohlcv
 
+    def download(
+        self,
+        symbols: list,
+        tfs: list,
+        since: str,
+        until: str = None,
+        progress: object = None,
+    ):
+        """Download candlestick history for many symbols and timeframes in parallel
+
+        Args:
+            symbols (list): Created symbols for base and quote currencies
+            tfs (list): Timeframes to retrieve OHLCV data for
+            since (str): Start date, YEAR-MONTH-DAY (ex. 2018-12-01)
+            until (str): Date to stop before, YEAR-MONTH-DAY. Defaults to now.
+            progress (object): Called as progress(done, total) after each shard. Defaults to None.
+
+        Raises:
+            NetworkError: PublicClient failed to download candlestick data for {symbols} on timeframes {tfs} since {since}
+            ExchangeError: PublicClient failed to download candlestick data for {symbols} on timeframes {tfs} since {since}
+            Exception: PublicClient failed to download candlestick data for {symbols} on timeframes {tfs} since {since}
+
+        Returns:
+            Dictionary: Symbol -> timeframe -> candle data
+        """
+        candles = None
+        try:
+            self._log(
+                f"Attempting to download candlestick data for {symbols} on timeframes {tfs} since {since},",
+                end=" ",
+            )
+            candles = OhlcvDownloader(self._pub_client).download(
+                symbols, tfs, since, until, progress
+            )
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to download candlestick data for {symbols} on timeframes {tfs} since {since}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to download candlestick data for {symbols} on timeframes {tfs} since {since}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(
+                f"PublicClient failed to download candlestick data for {symbols} on timeframes {tfs} since {since}: {e}"
+            )
+            raise
+        else:
+            self._log("done.")
+
+        return candles
+
+    def iter_ohlcv(
+        self,
+        symbol: str,
+        tf: str,
+        since: str,
+        until: str = None,
+        page_size: int = 1000,
+        as_array: bool = False,
+    ):
+        """Yield candle pages as they arrive instead of collecting the whole range
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe to retrieve OHLCV data for
+            since (str): Start date, YEAR-MONTH-DAY (ex. 2018-12-01)
+            until (str): Date to stop before, YEAR-MONTH-DAY. Defaults to now.
+            page_size (int): Candles requested per page. Defaults to 1000.
+            as_array (bool): Yield structured arrays with OHLCV dtype instead of lists. Defaults to False.
+
+        Raises:
+            NetworkError: PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}
+            ExchangeError: PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}
+            Exception: PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}
+
+        Yields:
+            List: Candles newer than the previous page, oldest first
+        """
+        try:
+            self._log(
+                f"Streaming candlestick data for {symbol} on timeframe {tf} since {since}"
+            )
+            for page in self._pub_client.iter_ohlcv(
+                symbol, tf, since, until, page_size, as_array
+            ):
+                yield page
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(
+                f"PublicClient failed to stream candlestick data for {symbol} on timeframe {tf} since {since}: {e}"
+            )
+            raise
+
+    def repair(self, symbol: str, tf: str, since: str = None, until: str = None):
+        """Refetch only the windows missing from the stored candles of symbol
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tf (str): Timeframe of the stored candles
+            since (str): Date the series should start at, YEAR-MONTH-DAY (ex. 2018-12-01). Defaults to None.
+            until (str): Date the series should reach, YEAR-MONTH-DAY. Defaults to None.
+
+        Raises:
+            NetworkError: PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}
+            ExchangeError: PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}
+            Exception: PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}
+
+        Returns:
+            Int: Number of candles added to the store
+        """
+        added = None
+        try:
+            self._log(
+                f"Attempting to repair candlestick data for {symbol} on timeframe {tf},",
+                end=" ",
+            )
+            added = self._pub_client.repair(symbol, tf, since, until)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(
+                f"PublicClient failed to repair candlestick data for {symbol} on timeframe {tf}: {e}"
+            )
+            raise
+        else:
+            self._log("done.")
+
+        return added
+
     def status(self):
         """Retrieve the current network status of exchange
 
@@ -266,11 +546,13 @@ class Proxy(PublicClientInterface, AuthClientInterface):
 
         return status
 
-    def orderbook(self, symbol: str):
+    def orderbook(self, symbol: str, depth: int = None, info: bool = False):
         """Retrieve orderbook for symbol
 
         Args:
             symbol (str): Created symbol for base and quote currencies
+            depth (int): Levels per side to return, 30 or less uses Phemex's smaller book. Defaults to None (all).
+            info (bool): Include the raw exchange response as info. Defaults to False.
 
         Raises:
             NetworkError: PublicClient failed to retrieve orderbook for {symbol}
@@ -278,12 +560,12 @@ class Proxy(PublicClientInterface, AuthClientInterface):
             Exception: PublicClient failed to retrieve orderbook for {symbol}
 
         Returns:
-            Dictionary: Current orderbook for symbol
+            OrderBook: Current orderbook for symbol, reads like the ccxt dictionary
         """
         orderbook = None
         try:
             self._log(f"Attempting to retrieve orderbook for {symbol},", end=" ")
-            orderbook = self._pub_client.orderbook(symbol)
+            orderbook = self._pub_client.orderbook(symbol, depth, info)
         except NetworkError as e:
             print(
                 f"NetworkError - PublicClient failed to retrieve orderbook for {symbol}: {e}"
@@ -302,6 +584,197 @@ class Proxy(PublicClientInterface, AuthClientInterface):
 
         return orderbook
 
+    def watch_orderbook(self, symbol: str, timeout: float = 10):
+        """Keep the orderbook for symbol current over a websocket, orderbook() then reads it locally
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            timeout (float): Seconds to wait for the first snapshot. Defaults to 10.
+
+        Raises:
+            NetworkError: PublicClient failed to watch orderbook for {symbol}
+            ExchangeError: PublicClient failed to watch orderbook for {symbol}
+            Exception: PublicClient failed to watch orderbook for {symbol}
+
+        Returns:
+            OrderBookStream: Stream keeping the book current
+        """
+        stream = None
+        try:
+            self._log(f"Attempting to watch orderbook for {symbol},", end=" ")
+            stream = self._pub_client.watch_orderbook(symbol, timeout)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to watch orderbook for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to watch orderbook for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to watch orderbook for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return stream
+
+    def watch_trades(self, symbol: str, capacity: int = 100000, timeout: float = 10):
+        """Stream public trades for symbol into a preallocated ring buffer
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            capacity (int): Trades kept before the oldest is overwritten. Defaults to 100000.
+            timeout (float): Seconds to wait for the first trades. Defaults to 10.
+
+        Raises:
+            NetworkError: PublicClient failed to watch trades for {symbol}
+            ExchangeError: PublicClient failed to watch trades for {symbol}
+            Exception: PublicClient failed to watch trades for {symbol}
+
+        Returns:
+            TradeStream: Stream holding the latest trades, read them with latest(n)
+        """
+        stream = None
+        try:
+            self._log(f"Attempting to watch trades for {symbol},", end=" ")
+            stream = self._pub_client.watch_trades(symbol, capacity, timeout)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to watch trades for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to watch trades for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to watch trades for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return stream
+
+    def watch_candles(self, symbol: str, tfs: list, timeout: float = 10):
+        """Build candles for symbol from its trade stream, storing them as they close
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+            tfs (list): Timeframes to build (ex. ['1m', '1h'])
+            timeout (float): Seconds to wait for the first trades. Defaults to 10.
+
+        Raises:
+            NetworkError: PublicClient failed to watch candles for {symbol}
+            ExchangeError: PublicClient failed to watch candles for {symbol}
+            Exception: PublicClient failed to watch candles for {symbol}
+
+        Returns:
+            CandleStream: Stream firing listeners as candles close, partial(tf) reads the open one
+        """
+        stream = None
+        try:
+            self._log(f"Attempting to watch candles for {symbol},", end=" ")
+            stream = self._pub_client.watch_candles(symbol, tfs, timeout)
+        except NetworkError as e:
+            print(
+                f"NetworkError - PublicClient failed to watch candles for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - PublicClient failed to watch candles for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to watch candles for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return stream
+
+    def unwatch_candles(self, symbol: str):
+        """Stop building candles for symbol, the trade stream keeps running
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            Exception: PublicClient failed to unwatch candles for {symbol}
+        """
+        try:
+            self._log(f"Attempting to unwatch candles for {symbol},", end=" ")
+            self._pub_client.unwatch_candles(symbol)
+        except Exception as e:
+            print(f"PublicClient failed to unwatch candles for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+    def unwatch_trades(self, symbol: str):
+        """Close the trade stream for symbol and the candles built from it
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            Exception: PublicClient failed to unwatch trades for {symbol}
+        """
+        try:
+            self._log(f"Attempting to unwatch trades for {symbol},", end=" ")
+            self._pub_client.unwatch_trades(symbol)
+        except Exception as e:
+            print(f"PublicClient failed to unwatch trades for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+    def unwatch_orderbook(self, symbol: str):
+        """Close the websocket book for symbol, orderbook() requests it again
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            Exception: PublicClient failed to unwatch orderbook for {symbol}
+        """
+        try:
+            self._log(f"Attempting to unwatch orderbook for {symbol},", end=" ")
+            self._pub_client.unwatch_orderbook(symbol)
+        except Exception as e:
+            print(f"PublicClient failed to unwatch orderbook for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+    def refresh_markets(self):
+        """Download market metadata now instead of waiting for the cache to expire
+
+        Raises:
+            NetworkError: PublicClient failed to refresh markets
+            ExchangeError: PublicClient failed to refresh markets
+            Exception: PublicClient failed to refresh markets
+        """
+        try:
+            self._log("Attempting to refresh markets,", end=" ")
+            # Markets are shared, refreshing once updates both clients
+            self._pub_client.refresh_markets()
+        except NetworkError as e:
+            print(f"NetworkError - PublicClient failed to refresh markets: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - PublicClient failed to refresh markets: {e}")
+            raise
+        except Exception as e:
+            print(f"PublicClient failed to refresh markets: {e}")
+            raise
+        else:
+            self._log("done.")
+
     # ---------------------------- AuthClient Methods ---------------------------- #
 
     def balance(self, currency: str, code: str):
@@ -648,6 +1121,105 @@ class Proxy(PublicClientInterface, AuthClientInterface):
 
         return data
 
+    def amend(
+        self,
+        id: str,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: float,
+        config: dict = {},
+    ):
+        """Amend open order in place, keeping its id and place in the book
+
+        Args:
+            id (str): Order id
+            symbol (str): Created symbol for base and quote currencies
+            type (str): Type of order (only supports 'market' and 'limit')
+            side (str): Side of order ('buy' or 'sell')
+            amount (float): New amount of base currency
+            price (float): New limit order price
+            config (dict, optional): Optional parameters to send to exchange. Defaults to None.
+
+        Raises:
+            NetworkError: AuthClient failed to amend order for {symbol} with id {id}
+            ExchangeError: AuthClient failed to amend order for {symbol} with id {id}
+            Exception: AuthClient failed to amend order for {symbol} with id {id}
+
+        Returns:
+            Dictionary: Order data
+        """
+        data = None
+        try:
+            self._log(
+                f"Attempting to amend order for {symbol} with id {id} to {amount} at {price}",
+                end=", ",
+            )
+            data = self._auth_client.amend(
+                id, symbol, type, side, amount, price, config
+            )
+        except NetworkError as e:
+            print(
+                f"NetworkError - AuthClient failed to amend order for {symbol} with id {id}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AuthClient failed to amend order for {symbol} with id {id}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to amend order for {symbol} with id {id}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return data
+
+    def order_status(self, id: str, symbol: str, client_id: str = None):
+        """Retrieve the state of a single order by id or client order id
+
+        Args:
+            id (str): Order id, ignored when client_id is given
+            symbol (str): Created symbol for base and quote currencies
+            client_id (str): Client order id set when placing the order. Defaults to None.
+
+        Raises:
+            NetworkError: AuthClient failed to retrieve status of order {id} for {symbol}
+            ExchangeError: AuthClient failed to retrieve status of order {id} for {symbol}
+            Exception: AuthClient failed to retrieve status of order {id} for {symbol}
+
+        Returns:
+            OrderStatus: State, filled amount and average price
+        """
+        data = None
+        try:
+            self._log(
+                f"Attempting to retrieve status of order {client_id or id} for {symbol}",
+                end=", ",
+            )
+            data = self._auth_client.order_status(id, symbol, client_id)
+        except NetworkError as e:
+            print(
+                f"NetworkError - AuthClient failed to retrieve status of order {client_id or id} for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AuthClient failed to retrieve status of order {client_id or id} for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(
+                f"AuthClient failed to retrieve status of order {client_id or id} for {symbol}: {e}"
+            )
+            raise
+        else:
+            self._log("done.")
+
+        return data
+
     def orders(self, symbol: str):
         """Retrieve all open orders for symbol
 
@@ -684,8 +1256,121 @@ class Proxy(PublicClientInterface, AuthClientInterface):
 
         return data
 
+    def open_orders(self, symbol: str):
+        """Retrieve open orders for symbol from a snapshot shared by every order client
+
+        Args:
+            symbol (str): Created symbol for base and quote currencies
+
+        Raises:
+            NetworkError: AuthClient failed to retrieve open orders for {symbol}
+            ExchangeError: AuthClient failed to retrieve open orders for {symbol}
+            Exception: AuthClient failed to retrieve open orders for {symbol}
+
+        Returns:
+            Dictionary: Open orders by id, shared and must not be modified
+        """
+        data = None
+        try:
+            self._log(f"Attempting to retrieve open orders for {symbol}", end=", ")
+            data = self._auth_client.open_orders(symbol)
+        except NetworkError as e:
+            print(
+                f"NetworkError - AuthClient failed to retrieve open orders for {symbol}: {e}"
+            )
+            raise
+        except ExchangeError as e:
+            print(
+                f"ExchangeError - AuthClient failed to retrieve open orders for {symbol}: {e}"
+            )
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to retrieve open orders for {symbol}: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return data
+
+    def watch_account(self, timeout: float = 10):
+        """Push order, fill and position updates from the private websocket into open clients
+
+        Args:
+            timeout (float): Seconds to wait for login and subscription. Defaults to 10.
+
+        Raises:
+            NetworkError: AuthClient failed to watch account
+            ExchangeError: AuthClient failed to watch account
+            Exception: AuthClient failed to watch account
+
+        Returns:
+            AccountStream: Stream pushing the updates
+        """
+        stream = None
+        try:
+            self._log("Attempting to watch account,", end=" ")
+            stream = self._auth_client.watch_account(timeout)
+        except NetworkError as e:
+            print(f"NetworkError - AuthClient failed to watch account: {e}")
+            raise
+        except ExchangeError as e:
+            print(f"ExchangeError - AuthClient failed to watch account: {e}")
+            raise
+        except Exception as e:
+            print(f"AuthClient failed to watch account: {e}")
+            raise
+        else:
+            self._log("done.")
+
+        return stream
+
+    def unwatch_account(self):
+        """Close the private websocket, open clients request their state again
+
+        Raises:
+            Exception: AuthClient failed to unwatch account
+        """
+        try:
+            self._log("Attempting to unwatch account,", end=" ")
+            self._auth_client.unwatch_account()
+        except Exception as e:
+            print(f"AuthClient failed to unwatch account: {e}")
+            raise
+        else:
+            self._log("done.")
+
     # ------------------------------ Client Methods ------------------------------ #
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Close websocket streams, the shared exchange session stays open for other clients"""
+        self._pub_client.close()
+        self._auth_client.close()
+
+    def submit(self, method: str, *args, **kwargs):
+        """Run a proxy method on the shared worker pool without waiting
+
+        Args:
+            method (str): Name of the proxy method (ex. 'price')
+
+        Returns:
+            Future: Resolves to the result of the method
+        """
+        return POOL.submit(getattr(self, method), *args, **kwargs)
+
+    def metrics(self):
+        """Retrieve queue depth and utilisation of the shared worker pool
+
+        Returns:
+            Dictionary: Worker pool metrics
+        """
+        return POOL.metrics()
+
     def verbose(self):
         """Turn on logging"""
         self._verbose = False
@@ -0,0 +1,56 @@
+"""AsyncProxy Tests"""
+
+import asyncio
+import unittest
+
+from phemexboy.async_proxy import AsyncProxy
+from phemexboy.interfaces.aio.auth.client_interface import AsyncAuthClientInterface
+from phemexboy.interfaces.aio.public_interface import AsyncPublicClientInterface
+from phemexboy.tests.fakes import FakeStream
+
+
+class TestAsyncProxy(unittest.IsolatedAsyncioTestCase):
+    async def test_init(self):
+        async with AsyncProxy() as proxy:
+            self.assertIsInstance(proxy, AsyncAuthClientInterface)
+            self.assertIsInstance(proxy, AsyncPublicClientInterface)
+            self.assertIs(proxy._pub_client._endpoint, proxy._auth_client._endpoint)
+
+    async def test_close(self):
+        streams = [FakeStream() for _ in range(3)]
+        async with AsyncProxy() as proxy:
+            proxy._pub_client._streams["BTC/USD:USD"] = streams[0]
+            proxy._pub_client._trades["BTC/USD:USD"] = streams[1]
+            proxy._auth_client._account = streams[2]
+
+        # Streams are closed with the session instead of outliving it
+        self.assertTrue(all(stream.closed for stream in streams))
+        self.assertEqual(proxy._pub_client._streams, {})
+        self.assertIsNone(proxy._auth_client._account)
+
+    async def test_public(self):
+        async with AsyncProxy() as proxy:
+            spot_symbol = proxy.symbol(base="BTC", quote="USD", code="spot")
+            future_symbol = proxy.symbol(base="BTC", quote="USD", code="future")
+
+            # Requests share one event loop instead of a thread each
+            spot_price, future_price, spot_book, status = await asyncio.gather(
+                proxy.price(spot_symbol),
+                proxy.price(future_symbol),
+                proxy.orderbook(spot_symbol),
+                proxy.status(),
+            )
+            self.assertGreater(spot_price, 0)
+            self.assertGreater(future_price, 0)
+            self.assertGreater(len(spot_book), 0)
+            self.assertGreater(len(status), 0)
+
+            currencies = await proxy.currencies()
+            self.assertIn("BTC", currencies)
+
+    async def test_auth(self):
+        async with AsyncProxy() as proxy:
+            spot_bal = await proxy.balance(currency="USDT", code="spot")
+            fut_bal = await proxy.balance(currency="USD", code="future")
+            self.assertGreaterEqual(spot_bal, 0)
+            self.assertGreaterEqual(fut_bal, 0)
@@ -0,0 +1,189 @@
+"""Shared Test Fakes"""
+
+import ccxt
+
+from ccxt import NotSupported, OrderNotFound
+
+SYMBOL = "BTC/USDT:USDT"
+MINUTE = 60000
+MARKETS = {"BTC/USDT:USDT": {"id": "BTCUSDT", "symbol": "BTC/USDT:USDT"}}
+CURRENCIES = {"USDT": {"id": "USDT", "code": "USDT"}}
+
+
+def candles(start: int, count: int):
+    return [
+        [i * MINUTE, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 10.0 * i]
+        for i in range(start, start + count)
+    ]
+
+
+class FakeMarkets:
+    def load(self, endpoint):
+        pass
+
+    async def aload(self, endpoint):
+        pass
+
+    def restore(self, endpoint):
+        pass
+
+
+def order(id: str, client_id: str = None):
+    return {
+        "id": id,
+        "clientOrderId": client_id,
+        "info": {"symbol": "BTCUSDT"},
+        "status": "open",
+        "symbol": SYMBOL,
+        "type": "limit",
+        "side": "buy",
+        "amount": 0.001,
+        "filled": 0.0,
+        "remaining": 0.001,
+        "average": None,
+        "price": 20000,
+        "timestamp": 1674110665380,
+    }
+
+
+class FakeOrderEndpoint:
+    """Keeps created orders open until filled or canceled"""
+
+    def __init__(self):
+        self.orders = {}
+        self.requests = []
+
+    def create_order(self, symbol, type, side, amount, price=None, params={}):
+        self.requests.append("create_order")
+        id = str(len(self.requests))
+        self.orders[id] = order(id, params.get("clOrdID"))
+        return dict(self.orders[id])
+
+    def fill(self, id):
+        self.orders[id].update(
+            status="closed", filled=0.001, remaining=0.0, average=20000.0
+        )
+
+    def cancel_order(self, id, symbol=None, params={}):
+        self.requests.append("cancel_order")
+        self.orders[id]["status"] = "canceled"
+        return dict(self.orders[id])
+
+    def fetch_open_orders(self, symbol=None, since=None, limit=None, params={}):
+        self.requests.append("fetch_open_orders")
+        return [dict(o) for o in self.orders.values() if o["status"] == "open"]
+
+    def edit_order(self, id, symbol, type, side, amount=None, price=None, params={}):
+        self.requests.append("edit_order")
+        if id not in self.orders or self.orders[id]["status"] != "open":
+            raise OrderNotFound(f"phemex editOrder() {symbol} order {id} not found")
+        self.orders[id].update(amount=amount, remaining=amount, price=price)
+        return dict(self.orders[id])
+
+    def fetch_order(self, id, symbol=None, params={}):
+        self.requests.append("fetch_order")
+        for o in self.orders.values():
+            if o["id"] == id and "clOrdID" not in params:
+                return dict(o)
+            if o["clientOrderId"] and o["clientOrderId"] == params.get("clOrdID"):
+                return dict(o)
+        raise OrderNotFound(
+            f"phemex fetchOrder() {symbol} order with id {id} not found"
+        )
+
+
+class FakeAsyncOrderEndpoint(FakeOrderEndpoint):
+    async def create_order(self, *args, **kwargs):
+        return super().create_order(*args, **kwargs)
+
+    async def cancel_order(self, *args, **kwargs):
+        return super().cancel_order(*args, **kwargs)
+
+    async def fetch_open_orders(self, *args, **kwargs):
+        return super().fetch_open_orders(*args, **kwargs)
+
+    async def fetch_order(self, *args, **kwargs):
+        return super().fetch_order(*args, **kwargs)
+
+    async def edit_order(self, *args, **kwargs):
+        return super().edit_order(*args, **kwargs)
+
+
+class FakeReplaceEndpoint(FakeOrderEndpoint):
+    """Exchange without an amend endpoint"""
+
+    def edit_order(self, *args, **kwargs):
+        self.requests.append("edit_order")
+        raise NotSupported("phemex editOrder() is not supported yet")
+
+
+class FakeTickerEndpoint:
+    """Tickers carry top of book except on USDT settled perpetuals"""
+
+    def __init__(self):
+        self.requests = []
+
+    def market(self, symbol):
+        settle = symbol.split(":")[1]
+        return {"spot": False, "inverse": settle == "USD", "settle": settle}
+
+    def ticker(self, symbol):
+        quoted = self.market(symbol)["settle"] == "USD"
+        bid, ask = (100.0, 101.0) if quoted else (None, None)
+        return {"symbol": symbol, "bid": bid, "ask": ask, "timestamp": 1}
+
+    def fetch_ticker(self, symbol, params={}):
+        self.requests.append("fetch_ticker")
+        return self.ticker(symbol)
+
+    def fetch_tickers(self, symbols=None, params={}):
+        self.requests.append("fetch_tickers")
+        return {symbol: self.ticker(symbol) for symbol in symbols}
+
+    def fetch_order_book(self, symbol, limit=None, params={}):
+        self.requests.append("fetch_order_book")
+        return {"bids": [[99.0, 1.0]], "asks": [[102.0, 1.0]], "timestamp": 2}
+
+
+class FakeBookEndpoint(ccxt.phemex):
+    """Resolves BTCUSDT without loading markets"""
+
+    def market(self, symbol):
+        return {
+            "id": "BTCUSDT",
+            "symbol": symbol,
+            "spot": False,
+            "linear": True,
+            "settle": "USDT",
+            "priceScale": 0,
+        }
+
+
+class FakeStream:
+    """Records being closed instead of holding a socket"""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeMarketEndpoint:
+    """Counts downloads instead of requesting markets"""
+
+    def __init__(self):
+        self.markets = None
+        self.currencies = None
+        self.downloads = 0
+
+    def load_markets(self, reload=False):
+        self.downloads += 1
+        self.set_markets(list(MARKETS.values()), CURRENCIES)
+
+    def set_markets(self, markets, currencies=None):
+        self.markets = {market["symbol"]: market for market in markets}
+        self.currencies = currencies
@@ -0,0 +1,262 @@
+"""Helpers Tests"""
+
+import unittest
+import numpy as np
+
+from phemexboy.helpers.arrays import (
+    OHLCV,
+    TRADE,
+    OhlcvBuffer,
+    TradeRing,
+    to_array,
+    to_frame,
+)
+from phemexboy.helpers.resample import CandleBuilder, Resampler, resample, resolution
+from phemexboy.helpers import indicators
+from phemexboy.helpers.gaps import gaps, missing
+from phemexboy.helpers.orderbook import OrderBook
+from phemexboy.exceptions import InvalidSideError
+from phemexboy.tests.fakes import MINUTE, candles
+
+
+class TestArrays(unittest.TestCase):
+    def test_to_array(self):
+        data = to_array(candles(0, 5))
+
+        self.assertEqual(data.dtype, OHLCV)
+        self.assertEqual(data["timestamp"].tolist(), [i * MINUTE for i in range(5)])
+        self.assertEqual(data["close"].tolist(), [1.5, 2.5, 3.5, 4.5, 5.5])
+
+    def test_buffer(self):
+        buffer = OhlcvBuffer(capacity=3)
+        # Pages larger than the capacity grow the buffer
+        buffer.extend(candles(0, 2))
+        buffer.extend(candles(2, 5))
+
+        self.assertEqual(len(buffer), 7)
+        self.assertEqual(buffer.array().tolist(), to_array(candles(0, 7)).tolist())
+
+    def test_to_frame(self):
+        try:
+            import pandas
+        except ImportError:
+            self.skipTest("pandas is not installed")
+
+        data = to_array(candles(0, 5))
+        frame = to_frame(data)
+
+        self.assertEqual(list(frame.columns), list(OHLCV.names))
+        self.assertTrue(np.shares_memory(frame["close"].to_numpy(), data))
+
+    def test_trade_ring(self):
+        ring = TradeRing(capacity=5)
+        self.assertEqual(len(ring.latest(3)), 0)
+
+        trades = np.zeros(12, dtype=TRADE)
+        trades["timestamp"] = np.arange(12)
+        ring.extend(trades[:3])
+        ring.extend(trades[3:9])
+        self.assertEqual(ring.latest()["timestamp"].tolist(), [4, 5, 6, 7, 8])
+        self.assertEqual(ring.latest(2)["timestamp"].tolist(), [7, 8])
+        self.assertEqual((len(ring), ring.count), (5, 9))
+
+        # Wrapped around, still a view rather than a copy
+        ring.extend(trades[9:])
+        self.assertEqual(ring.latest(4)["timestamp"].tolist(), [8, 9, 10, 11])
+        self.assertTrue(np.shares_memory(ring.latest(), ring._data))
+
+
+class TestResample(unittest.TestCase):
+    def test_resolution(self):
+        self.assertEqual(resolution("4h"), 4 * 60 * MINUTE)
+        self.assertEqual(resolution("1M"), 30 * 24 * 60 * MINUTE)
+        self.assertEqual(resolution("1Y"), 360 * 24 * 60 * MINUTE)
+
+    def test_resample(self):
+        # Starts mid bucket, the first 5m candle only holds 3 minutes
+        bars = resample(to_array(candles(2, 10)), "5m")
+
+        self.assertEqual(bars["timestamp"].tolist(), [0, 5 * MINUTE, 10 * MINUTE])
+        self.assertEqual(bars["open"].tolist(), [3.0, 6.0, 11.0])
+        self.assertEqual(bars["high"].tolist(), [6.0, 11.0, 13.0])
+        self.assertEqual(bars["low"].tolist(), [2.5, 5.5, 10.5])
+        self.assertEqual(bars["close"].tolist(), [5.5, 10.5, 12.5])
+        self.assertEqual(bars["volume"].tolist(), [90.0, 350.0, 210.0])
+
+    def test_resampler(self):
+        resampler = Resampler("5m")
+        closed = []
+        for i in range(0, 12, 3):
+            closed += resampler.update(candles(i, 3)).tolist()
+        # Already folded candles are ignored
+        closed += resampler.update(candles(10, 2)).tolist()
+
+        self.assertEqual(closed, resample(to_array(candles(0, 10)), "5m").tolist())
+        self.assertEqual(
+            resampler.partial.tolist(),
+            resample(to_array(candles(10, 2)), "5m")[0].tolist(),
+        )
+
+        # The last minute of a bucket closes it
+        self.assertEqual(len(resampler.update(candles(12, 3))), 1)
+        self.assertIsNone(resampler.partial)
+
+    def test_candle_builder(self):
+        trades = np.zeros(4, dtype=TRADE)
+        trades["timestamp"] = [10000, 30000, 70000, 250000]
+        trades["price"] = [2.0, 3.0, 1.0, 4.0]
+        trades["size"] = [1.0, 1.0, 2.0, 1.0]
+        builder = CandleBuilder(["1m", "5m"])
+
+        closed = builder.update(trades[:3])
+        self.assertEqual(closed["1m"].tolist(), [(0, 2.0, 3.0, 2.0, 3.0, 2.0)])
+        self.assertEqual(len(closed["5m"]), 0)
+        self.assertEqual(
+            builder.partial("1m").tolist(), (MINUTE, 1.0, 1.0, 1.0, 1.0, 2.0)
+        )
+
+        # Minutes without trades close flat at the last price
+        closed = builder.update(trades[3:])
+        self.assertEqual(
+            closed["1m"].tolist(),
+            [
+                (MINUTE, 1.0, 1.0, 1.0, 1.0, 2.0),
+                (2 * MINUTE, 1.0, 1.0, 1.0, 1.0, 0.0),
+                (3 * MINUTE, 1.0, 1.0, 1.0, 1.0, 0.0),
+            ],
+        )
+
+        # Boundaries passing without trades close the open candles
+        closed = builder.flush(5 * MINUTE + 500)
+        self.assertEqual(closed["1m"]["timestamp"].tolist(), [4 * MINUTE])
+        self.assertEqual(closed["5m"].tolist(), [(0, 2.0, 4.0, 1.0, 4.0, 5.0)])
+        self.assertIsNone(builder.partial("5m"))
+
+        # Late trades for closed buckets are dropped
+        closed = builder.update(trades[3:])
+        self.assertEqual((len(closed["1m"]), builder.partial("1m")), (0, None))
+
+
+class TestIndicators(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.close = 30000 + np.cumsum(rng.normal(size=500) * 20)
+        self.high = self.close + rng.random(500) * 30
+        self.low = self.close - rng.random(500) * 30
+
+    def assertSeries(self, batch, incremental):
+        np.testing.assert_allclose(batch, incremental, rtol=1e-9, equal_nan=True)
+
+    def test_sma(self):
+        result = indicators.sma([1.0, 2.0, 3.0, 4.0], 2)
+        self.assertSeries(result, [np.nan, 1.5, 2.5, 3.5])
+
+        sma = indicators.SMA(20)
+        incremental = [sma.update(close) for close in self.close]
+        self.assertSeries(indicators.sma(self.close, 20), incremental)
+
+    def test_ema(self):
+        # Seeded with the simple average of the first period closes
+        result = indicators.ema([1.0, 2.0, 3.0, 4.0], 2)
+        self.assertSeries(result, [np.nan, 1.5, 2.5, 3.5])
+
+        ema = indicators.EMA(20)
+        incremental = [ema.update(close) for close in self.close]
+        self.assertSeries(indicators.ema(self.close, 20), incremental)
+
+    def test_atr(self):
+        atr = indicators.ATR(14)
+        incremental = [
+            atr.update(high, low, close)
+            for high, low, close in zip(self.high, self.low, self.close)
+        ]
+        batch = indicators.atr(self.high, self.low, self.close, 14)
+
+        self.assertTrue(np.isnan(batch[12]))
+        self.assertSeries(batch, incremental)
+
+    def test_rsi(self):
+        self.assertEqual(indicators.rsi(np.arange(20.0), 14)[-1], 100.0)
+
+        rsi = indicators.RSI(14)
+        incremental = [rsi.update(close) for close in self.close]
+        batch = indicators.rsi(self.close, 14)
+
+        self.assertTrue(np.isnan(batch[13]))
+        self.assertTrue(((batch[14:] >= 0) & (batch[14:] <= 100)).all())
+        self.assertSeries(batch, incremental)
+
+    def test_bollinger(self):
+        bands = indicators.Bollinger(20, 2.0)
+        incremental = np.array([bands.update(close) for close in self.close]).T
+        batch = indicators.bollinger(self.close, 20, 2.0)
+
+        for expected, result in zip(batch, incremental):
+            self.assertSeries(expected, result)
+
+
+class TestGaps(unittest.TestCase):
+    def test_gaps(self):
+        timestamps = [i * MINUTE for i in [2, 3, 4, 7, 8, 12]]
+        windows = gaps(timestamps, "1m", since=0, until=15 * MINUTE)
+
+        self.assertEqual(
+            windows.tolist(),
+            [
+                [0, 2 * MINUTE],
+                [5 * MINUTE, 7 * MINUTE],
+                [9 * MINUTE, 12 * MINUTE],
+                [13 * MINUTE, 15 * MINUTE],
+            ],
+        )
+        self.assertEqual(missing(windows, "1m"), 9)
+
+    def test_no_gaps(self):
+        self.assertEqual(gaps([i * MINUTE for i in range(10)], "1m").tolist(), [])
+        self.assertEqual(gaps([], "1m", 0, 5 * MINUTE).tolist(), [[0, 5 * MINUTE]])
+
+
+class TestOrderBook(unittest.TestCase):
+    def setUp(self):
+        self.book = OrderBook.from_ccxt(
+            {
+                "symbol": "BTC/USDT:USDT",
+                "bids": [[100.0, 1.0], [99.0, 2.0], [98.0, 3.0]],
+                "asks": [[101.0, 1.0], [102.0, 2.0], [103.0, 5.0]],
+                "timestamp": 1650000000000,
+                "nonce": None,
+            }
+        )
+
+    def test_dictionary(self):
+        self.assertEqual(self.book["bids"][0], [100.0, 1.0])
+        self.assertEqual(self.book["datetime"], "2022-04-15T05:20:00.000Z")
+        self.assertNotIn("info", self.book)
+
+    def test_prices(self):
+        self.assertEqual(self.book.mid(), 100.5)
+        self.assertEqual(self.book.spread(), 1.0)
+        self.assertAlmostEqual(self.book.spread(bps=True), 1 / 100.5 * 10000)
+
+    def test_depth(self):
+        self.assertEqual(self.book.depth(50), (1.0, 1.0))
+        self.assertEqual(self.book.depth(150), (3.0, 3.0))
+
+    def test_vwap_to_fill(self):
+        self.assertEqual(self.book.vwap_to_fill(2, "buy"), 101.5)
+        self.assertAlmostEqual(self.book.vwap_to_fill(2.5, "sell"), 99.4)
+        # Not enough size resting to fill
+        self.assertTrue(np.isnan(self.book.vwap_to_fill(100)))
+        self.assertRaises(InvalidSideError, self.book.vwap_to_fill, 1, "long")
+
+    def test_imbalance(self):
+        self.assertEqual(self.book.imbalance(2), 0.0)
+        self.assertEqual(self.book.imbalance(3), (6 - 8) / 14)
+
+    def test_cost(self):
+        self.assertEqual(self.book.cost(2, "buy"), 2.0)
+        self.assertAlmostEqual(self.book.cost(2, "buy", fee=0.001), 2.203)
+
+
+if __name__ == "__main__":
+    unittest.main()
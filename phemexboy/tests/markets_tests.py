@@ -0,0 +1,89 @@
+"""MarketCache Tests"""
+
+import os
+import json
+import unittest
+
+from time import time
+from tempfile import TemporaryDirectory
+from phemexboy.api.markets import MarketCache
+from phemexboy.tests.fakes import FakeMarketEndpoint, CURRENCIES, MARKETS
+
+
+class TestMarketCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "markets.json")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def age(self, seconds: int):
+        with open(self.path) as f:
+            data = json.load(f)
+        data["timestamp"] = time() - seconds
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+        return data["timestamp"]
+
+    def test_snapshot(self):
+        endpoint = FakeMarketEndpoint()
+        MarketCache(snapshot=self.path).load(endpoint)
+        self.assertEqual(endpoint.downloads, 1)
+        self.assertTrue(os.path.exists(self.path))
+
+        # A new process starts from the snapshot without downloading
+        restored = FakeMarketEndpoint()
+        cache = MarketCache(snapshot=self.path)
+        self.assertTrue(cache.restore(restored))
+        cache.load(restored)
+        self.assertEqual(restored.downloads, 0)
+        self.assertEqual(restored.markets, MARKETS)
+        self.assertEqual(cache.currencies(), CURRENCIES)
+
+    def test_age(self):
+        MarketCache(snapshot=self.path).load(FakeMarketEndpoint())
+        downloaded = self.age(1000)
+
+        endpoint = FakeMarketEndpoint()
+        cache = MarketCache(ttl=900, snapshot=self.path)
+        self.assertTrue(cache.restore(endpoint))
+        # Ttl counts from the download, not from the restore
+        self.assertEqual(cache._loaded_at, downloaded)
+        cache.load(endpoint)
+        self.assertEqual(endpoint.downloads, 1)
+
+        # Too old to restore at all
+        self.age(2000)
+        cache = MarketCache(snapshot=self.path, max_age=1500)
+        self.assertFalse(cache.restore(FakeMarketEndpoint()))
+
+    def test_invalidate(self):
+        endpoint = FakeMarketEndpoint()
+        cache = MarketCache(snapshot=self.path)
+        cache.load(endpoint)
+        cache.load(endpoint)
+        self.assertEqual(endpoint.downloads, 1)
+
+        cache.invalidate()
+        cache.load(endpoint)
+        self.assertEqual(endpoint.downloads, 2)
+
+        # The download is written back for the next process
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)["timestamp"], cache._loaded_at)
+
+    def test_version(self):
+        MarketCache(snapshot=self.path).load(FakeMarketEndpoint())
+        with open(self.path) as f:
+            data = json.load(f)
+        data["ccxt"] = "0.0.0"
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+
+        # Markets parsed by another ccxt release are downloaded again
+        self.assertFalse(MarketCache(snapshot=self.path).restore(FakeMarketEndpoint()))
+
+
+if __name__ == "__main__":
+    unittest.main()
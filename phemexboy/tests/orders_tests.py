@@ -0,0 +1,244 @@
+"""Order Status and OpenOrders Tests"""
+
+import time
+import asyncio
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from ccxt import OrderNotFound
+from phemexboy.api.orders import OpenOrders, OrderStatus
+from phemexboy.exceptions import OrderFilledError
+from phemexboy.api.auth.client import AuthClient
+from phemexboy.api.aio.auth.client import AsyncAuthClient
+from phemexboy.tests.fakes import (
+    FakeAsyncOrderEndpoint,
+    FakeMarkets,
+    FakeOrderEndpoint,
+    FakeReplaceEndpoint,
+    SYMBOL,
+    order,
+)
+
+
+class TestOpenOrders(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def fetch(self, symbol):
+        self.calls.append(symbol)
+        time.sleep(0.05)
+        return [order("1"), order("2")]
+
+    def test_ttl(self):
+        registry = OpenOrders(ttl=60)
+        self.assertEqual(list(registry.get(self.fetch, SYMBOL)), ["1", "2"])
+        self.assertIn("2", registry.get(self.fetch, SYMBOL))
+        self.assertEqual(self.calls, [SYMBOL])
+
+        registry.set_ttl(0)
+        registry.get(self.fetch, SYMBOL)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_concurrent(self):
+        registry = OpenOrders(ttl=60)
+        with ThreadPoolExecutor(8) as executor:
+            results = list(
+                executor.map(lambda _: registry.get(self.fetch, SYMBOL), range(8))
+            )
+
+        # Threads arriving during the request wait for it instead of sending their own
+        self.assertEqual(self.calls, [SYMBOL])
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_invalidate(self):
+        registry = OpenOrders(ttl=60)
+        registry.get(self.fetch, SYMBOL)
+        registry.invalidate(SYMBOL)
+        registry.get(self.fetch, SYMBOL)
+        self.assertEqual(len(self.calls), 2)
+
+        # A request sent before an invalidation is returned but not kept
+        with ThreadPoolExecutor(1) as executor:
+            registry.invalidate()
+            future = executor.submit(registry.get, self.fetch, SYMBOL)
+            time.sleep(0.01)
+            registry.invalidate()
+            future.result()
+        registry.get(self.fetch, SYMBOL)
+        self.assertEqual(len(self.calls), 4)
+
+    def test_order_clients(self):
+        endpoint = FakeOrderEndpoint()
+        client = AuthClient(FakeMarkets(), endpoint, open_orders=OpenOrders(ttl=60))
+        orders = [client.buy(SYMBOL, "limit", 0.001, 20000) for _ in range(10)]
+
+        for _ in range(3):
+            self.assertTrue(all(order.pending() for order in orders))
+            self.assertFalse(any(order.closed() for order in orders))
+        self.assertEqual(endpoint.requests.count("fetch_open_orders"), 1)
+
+        # Canceling requests open orders again on the next check
+        orders[0].cancel()
+        self.assertTrue(orders[0].canceled())
+        self.assertTrue(orders[1].pending())
+        self.assertEqual(endpoint.requests.count("fetch_open_orders"), 2)
+
+
+class TestOrderStatus(unittest.TestCase):
+    def setUp(self):
+        self.endpoint = FakeOrderEndpoint()
+        self.client = AuthClient(FakeMarkets(), self.endpoint)
+
+    def test_parse(self):
+        status = OrderStatus.parse(order("1", "mine"))
+        self.assertEqual(
+            (status.id, status.client_id, status.state), ("1", "mine", "pending")
+        )
+        self.assertEqual(
+            (status.filled, status.remaining, status.average), (0.0, 0.001, None)
+        )
+
+        expired = dict(order("1"), status="expired", filled=None)
+        self.assertEqual(OrderStatus.parse(expired)[3:6], ("canceled", 0.001, 0.0))
+
+    def test_status(self):
+        placed = self.client.buy(SYMBOL, "limit", 0.001, 20000, {"clOrdID": "mine"})
+        self.endpoint.fill("1")
+
+        by_id = self.client.order_status("1", SYMBOL)
+        by_client_id = self.client.order_status(None, SYMBOL, client_id="mine")
+        self.assertEqual(by_id, by_client_id)
+        self.assertEqual(
+            (by_id.state, by_id.filled, by_id.average), ("closed", 0.001, 20000.0)
+        )
+        with self.assertRaises(OrderNotFound):
+            self.client.order_status(None, SYMBOL, client_id="other")
+
+        status = placed.status()
+        self.assertEqual(status.state, "closed")
+        self.assertEqual(placed.query("filled"), 0.001)
+
+    def test_closed(self):
+        filled = self.client.buy(SYMBOL, "limit", 0.001, 20000)
+        canceled = self.client.buy(SYMBOL, "limit", 0.001, 20000)
+        self.endpoint.fill("1")
+        self.endpoint.cancel_order("2")
+
+        # Gone from open orders, fetched once by id to tell filled from canceled
+        for _ in range(3):
+            self.assertTrue(filled.closed())
+            self.assertTrue(canceled.closed())
+        self.assertFalse(filled.canceled())
+        self.assertTrue(canceled.canceled())
+        self.assertEqual(filled.query("average"), 20000.0)
+        self.assertEqual(self.endpoint.requests.count("fetch_order"), 2)
+
+
+class TestEdit(unittest.TestCase):
+    def test_amend(self):
+        endpoint = FakeOrderEndpoint()
+        client = AuthClient(FakeMarkets(), endpoint)
+        orders = [client.buy(SYMBOL, "limit", 0.001, 20000 - i) for i in range(50)]
+        endpoint.requests.clear()
+
+        for i, order in enumerate(orders):
+            order.edit(amount=0.002, price=19000 - i)
+
+        # One request per order, each keeps its id
+        self.assertEqual(endpoint.requests, ["edit_order"] * 50)
+        self.assertEqual(orders[3].query("id"), "4")
+        self.assertEqual(orders[3].query("amount"), 0.002)
+        self.assertEqual(orders[3].query("price"), 19000 - 3 - 0.01)
+
+    def test_replace(self):
+        endpoint = FakeReplaceEndpoint()
+        client = AuthClient(FakeMarkets(), endpoint)
+        order = client.buy(SYMBOL, "limit", 0.001, 20000)
+        endpoint.requests.clear()
+
+        # Falls back to canceling and placing again
+        order.edit(amount=0.001, price=19000)
+        self.assertEqual(
+            endpoint.requests,
+            ["edit_order", "fetch_open_orders", "cancel_order", "create_order"],
+        )
+        self.assertNotEqual(order.query("id"), "1")
+
+    def test_filled(self):
+        endpoint = FakeOrderEndpoint()
+        client = AuthClient(FakeMarkets(), endpoint)
+        order = client.buy(SYMBOL, "limit", 0.001, 20000)
+        endpoint.fill("1")
+
+        # Filled before the amend, placing again would open a second position
+        with self.assertRaises(OrderFilledError):
+            order.edit(amount=0.001, price=19000)
+        self.assertNotIn("create_order", endpoint.requests[1:])
+        self.assertEqual(order.query("id"), "1")
+
+    def test_canceled(self):
+        endpoint = FakeOrderEndpoint()
+        client = AuthClient(FakeMarkets(), endpoint)
+        order = client.buy(SYMBOL, "limit", 0.001, 20000)
+        endpoint.cancel_order("1")
+
+        # Canceled from outside, placed again
+        order.edit(amount=0.001, price=19000)
+        self.assertEqual(endpoint.requests[-1], "create_order")
+        self.assertNotEqual(order.query("id"), "1")
+
+    def test_retry(self):
+        endpoint = FakeOrderEndpoint()
+        client = AuthClient(FakeMarkets(), endpoint)
+        order = client.buy(SYMBOL, "limit", 0.001, 20000)
+        endpoint.requests.clear()
+
+        # A pending order is repriced in place
+        self.assertTrue(order.retry(price=19000))
+        self.assertEqual(endpoint.requests.count("edit_order"), 1)
+        self.assertNotIn("cancel_order", endpoint.requests)
+        self.assertNotIn("create_order", endpoint.requests)
+        self.assertEqual(order.query("id"), "1")
+        self.assertEqual(order.query("price"), 19000 - 0.01)
+
+
+class TestAsyncOpenOrders(unittest.IsolatedAsyncioTestCase):
+    async def test_order_clients(self):
+        endpoint = FakeAsyncOrderEndpoint()
+        client = AsyncAuthClient(
+            FakeMarkets(), endpoint, open_orders=OpenOrders(ttl=60)
+        )
+        orders = [await client.buy(SYMBOL, "limit", 0.001, 20000) for _ in range(10)]
+
+        pending = await asyncio.gather(*(order.pending() for order in orders))
+        closed = await asyncio.gather(*(order.closed() for order in orders))
+        self.assertTrue(all(pending))
+        self.assertFalse(any(closed))
+        self.assertEqual(endpoint.requests.count("fetch_open_orders"), 1)
+
+        await orders[0].cancel()
+        self.assertTrue(await orders[1].pending())
+        self.assertEqual(endpoint.requests.count("fetch_open_orders"), 2)
+
+        endpoint.fill(orders[1].query("id"))
+        client._open_orders.set_ttl(0)
+        self.assertTrue(await orders[1].closed())
+        status = await client.order_status(orders[1].query("id"), SYMBOL)
+        self.assertEqual((status.state, status.filled), ("closed", 0.001))
+        self.assertEqual(orders[1].query("filled"), 0.001)
+
+    async def test_edit(self):
+        endpoint = FakeAsyncOrderEndpoint()
+        client = AsyncAuthClient(FakeMarkets(), endpoint)
+        orders = [await client.buy(SYMBOL, "limit", 0.001, 20000) for _ in range(5)]
+        endpoint.requests.clear()
+
+        await asyncio.gather(*(order.edit(0.001, 19000) for order in orders))
+        self.assertEqual(endpoint.requests, ["edit_order"] * 5)
+        self.assertEqual(orders[0].query("price"), 19000 - 0.01)
+
+        endpoint.requests.clear()
+        self.assertTrue(await orders[1].retry(price=18000))
+        self.assertEqual(endpoint.requests.count("edit_order"), 1)
+        self.assertNotIn("cancel_order", endpoint.requests)
+        self.assertNotIn("create_order", endpoint.requests)
@@ -0,0 +1,76 @@
+"""WorkerPool Tests"""
+
+import unittest
+
+from threading import Event
+from phemexboy.api.pool import WorkerPool
+
+
+class TestWorkerPool(unittest.TestCase):
+    def test_run(self):
+        pool = WorkerPool(workers=2)
+        task = lambda x, y: x + y
+
+        self.assertEqual(pool.run(task, 1, 2), 3)
+        pool.shutdown()
+
+    def test_submit(self):
+        pool = WorkerPool(workers=2)
+        task = lambda x, y: x * y
+
+        futures = [pool.submit(task, i, 2) for i in range(10)]
+        results = [future.result() for future in futures]
+        self.assertEqual(results, [i * 2 for i in range(10)])
+        pool.shutdown()
+
+    def test_gather(self):
+        pool = WorkerPool(workers=2)
+        task = lambda x: x + 1
+
+        results = pool.gather([(task, (i,)) for i in range(5)])
+        self.assertEqual(results, [1, 2, 3, 4, 5])
+
+        # Gathering from inside the pool runs inline
+        nested = pool.submit(pool.gather, [(task, (1,)), (task, (2,))])
+        self.assertEqual(nested.result(timeout=5), [2, 3])
+        pool.shutdown()
+
+    def test_nested_run(self):
+        pool = WorkerPool(workers=1)
+        inner = lambda: "inner"
+        outer = lambda: pool.run(inner)
+
+        # Would deadlock with one worker if nested tasks were queued
+        self.assertEqual(pool.submit(outer).result(timeout=5), "inner")
+        pool.shutdown()
+
+    def test_inside(self):
+        pool = WorkerPool(workers=2)
+
+        self.assertFalse(pool.inside())
+        self.assertTrue(pool.run(pool.inside))
+        pool.shutdown()
+
+    def test_metrics(self):
+        pool = WorkerPool(workers=1)
+        started = Event()
+        release = Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        first = pool.submit(block)
+        started.wait()
+        second = pool.submit(block)
+
+        metrics = pool.metrics()
+        self.assertEqual(metrics["active"], 1)
+        self.assertEqual(metrics["queued"], 1)
+        self.assertEqual(metrics["utilisation"], 1.0)
+
+        release.set()
+        first.result()
+        second.result()
+        self.assertEqual(pool.metrics()["completed"], 2)
+        pool.shutdown()
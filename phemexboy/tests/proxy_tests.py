@@ -12,6 +12,7 @@ from phemexboy.exceptions import (
     OrderTypeError,
 )
 from phemexboy.helpers.conversions import stop_loss, take_profit, usdt_to_crypto
+from phemexboy.tests.fakes import FakeStream
 
 
 class TestProxy(unittest.TestCase):
@@ -22,6 +23,17 @@ class TestProxy(unittest.TestCase):
         self.assertIsInstance(proxy._pub_client, PublicClientInterface)
         self.assertIsInstance(proxy._auth_client, AuthClientInterface)
 
+    def test_close(self):
+        streams = [FakeStream() for _ in range(3)]
+        with Proxy() as proxy:
+            proxy._pub_client._streams["BTC/USD:USD"] = streams[0]
+            proxy._pub_client._trades["BTC/USD:USD"] = streams[1]
+            proxy._auth_client._account = streams[2]
+
+        self.assertTrue(all(stream.closed for stream in streams))
+        self.assertEqual(proxy._pub_client._trades, {})
+        self.assertIsNone(proxy._auth_client._account)
+
     def test_public(self):
         proxy = Proxy()
 
@@ -2,8 +2,71 @@
 
 import unittest
 
+from ccxt import NetworkError
 from phemexboy.api.public import PublicClient
+from phemexboy.api.aio.public import AsyncPublicClient
+from phemexboy.api.downloader import OhlcvDownloader
 from phemexboy.interfaces.public_interface import PublicClientInterface
+from phemexboy.exceptions import InvalidSideError
+from phemexboy.tests.fakes import FakeMarkets, FakeTickerEndpoint
+
+INVERSE = "BTC/USD:USD"
+LINEAR = ["BTC/USDT:USDT", "ETH/USDT:USDT", "SOL/USDT:USDT"]
+
+
+class TestTopOfBook(unittest.TestCase):
+    def setUp(self):
+        self.endpoint = FakeTickerEndpoint()
+        self.client = PublicClient(FakeMarkets(), self.endpoint)
+
+    def test_price(self):
+        self.assertEqual(self.client.price(INVERSE), 101.0)
+        self.assertEqual(self.endpoint.requests, ["fetch_ticker"])
+
+        # Skips the ticker that would leave top of book out
+        self.endpoint.requests.clear()
+        self.assertEqual(self.client.price(LINEAR[0], side="bid"), 99.0)
+        self.assertEqual(self.endpoint.requests, ["fetch_order_book"])
+
+    def test_prices(self):
+        prices = self.client.prices([INVERSE] + LINEAR)
+
+        self.assertEqual(prices, {INVERSE: 101.0, **dict.fromkeys(LINEAR, 102.0)})
+        # One bulk ticker request and one book per linear perpetual
+        self.assertEqual(
+            sorted(self.endpoint.requests),
+            ["fetch_order_book"] * 3 + ["fetch_tickers"],
+        )
+
+
+class DesyncedStream:
+    """Reports synced, then drops sync before the book is read"""
+
+    synced = True
+
+    def orderbook(self, depth=None):
+        raise NetworkError("Orderbook stream is not synced")
+
+
+class TestOrderbookFallback(unittest.TestCase):
+    def test_desync(self):
+        client = PublicClient(FakeMarkets(), FakeTickerEndpoint())
+        client._streams[LINEAR[0]] = DesyncedStream()
+        client._book = lambda symbol, depth, info: ("rest", symbol, depth)
+
+        self.assertEqual(client.orderbook(LINEAR[0], 5), ("rest", LINEAR[0], 5))
+
+
+class TestAsyncOrderbookFallback(unittest.IsolatedAsyncioTestCase):
+    async def test_desync(self):
+        client = AsyncPublicClient(FakeMarkets(), FakeTickerEndpoint())
+        client._streams[LINEAR[0]] = DesyncedStream()
+
+        async def book(symbol, depth, info):
+            return ("rest", symbol, depth)
+
+        client._book = book
+        self.assertEqual(await client.orderbook(LINEAR[0], 5), ("rest", LINEAR[0], 5))
 
 
 class TestPublicClient(unittest.TestCase):
@@ -67,6 +130,35 @@ class TestPublicClient(unittest.TestCase):
         self.assertGreater(spot_price, 0)
         self.assertGreater(future_price, 0)
 
+    def test_bbo(self):
+        client = PublicClient()
+        spot_symbol = client.symbol(base="BTC", quote="USD", code="spot")
+        future_symbol = client.symbol(base="BTC", quote="USD", code="future")
+
+        for symbol in [spot_symbol, future_symbol]:
+            bbo = client.bbo(symbol)
+            self.assertGreater(bbo["ask"], 0)
+            self.assertGreater(bbo["bid"], 0)
+            self.assertGreaterEqual(bbo["ask"], bbo["bid"])
+            self.assertEqual(client.price(symbol, side="bid") > 0, True)
+
+        with self.assertRaises(InvalidSideError):
+            client.price(spot_symbol, side="mid")
+
+    def test_prices(self):
+        client = PublicClient()
+        symbols = [
+            client.symbol(base="BTC", quote="USD", code="spot"),
+            client.symbol(base="ETH", quote="USD", code="spot"),
+            client.symbol(base="BTC", quote="USD", code="future"),
+        ]
+        tickers = client.tickers(symbols)
+        prices = client.prices(symbols)
+
+        for symbol in symbols:
+            self.assertIn(symbol, tickers)
+            self.assertGreater(prices[symbol], 0)
+
     def test_ohlcv(self):
         client = PublicClient()
         spot_symbol = client.symbol(base="BTC", quote="USD", code="spot")
@@ -79,6 +171,50 @@ class TestPublicClient(unittest.TestCase):
         self.assertGreater(len(spot_ohlcv), 0)
         self.assertGreater(len(future_ohlcv), 0)
 
+    def test_backfill(self):
+        client = PublicClient()
+        symbol = client.symbol(base="BTC", quote="USDT", code="future")
+        ohlcv = client.ohlcv(
+            symbol=symbol,
+            tf="1h",
+            since="2022-01-01",
+            until="2022-06-01",
+            backfill=True,
+        )
+        timestamps = [candle[0] for candle in ohlcv]
+
+        # More than one page and no repeated candles
+        self.assertGreater(len(ohlcv), 2000)
+        self.assertEqual(len(timestamps), len(set(timestamps)))
+        self.assertEqual(timestamps, sorted(timestamps))
+
+    def test_iter_ohlcv(self):
+        client = PublicClient()
+        symbol = client.symbol(base="BTC", quote="USDT", code="future")
+        pages = client.iter_ohlcv(
+            symbol=symbol, tf="1h", since="2022-01-01", page_size=500, as_array=True
+        )
+
+        # Stop after two pages, the rest are never fetched
+        first, second = next(pages), next(pages)
+        pages.close()
+        self.assertEqual(len(first), 500)
+        self.assertGreater(second["timestamp"][0], first["timestamp"][-1])
+
+    def test_download(self):
+        client = PublicClient()
+        btc = client.symbol(base="BTC", quote="USDT", code="future")
+        eth = client.symbol(base="ETH", quote="USDT", code="future")
+        candles = OhlcvDownloader(client, shard_size=500).download(
+            [btc, eth], ["1h"], since="2022-01-01", until="2022-03-01"
+        )
+
+        # Shards merged in order without gaps at their edges
+        for symbol in [btc, eth]:
+            timestamps = [candle[0] for candle in candles[symbol]["1h"]]
+            self.assertEqual(len(timestamps), 59 * 24)
+            self.assertEqual(timestamps, sorted(set(timestamps)))
+
     def test_currencies(self):
         client = PublicClient()
         currencies = client.currencies()
@@ -97,3 +233,19 @@ class TestPublicClient(unittest.TestCase):
         orderbook = client.orderbook(symbol)
 
         self.assertGreater(len(orderbook), 0)
+
+    def test_orderbook_depth(self):
+        client = PublicClient()
+        symbol = client.symbol(base="BTC", quote="USD", code="future")
+        orderbook = client.orderbook(symbol, depth=5)
+
+        self.assertEqual(len(orderbook["bids"]), 5)
+        self.assertEqual(len(orderbook["asks"]), 5)
+        self.assertNotIn("info", orderbook)
+        self.assertIn("info", client.orderbook(symbol, depth=5, info=True))
+
+    def test_refresh_markets(self):
+        client = PublicClient()
+        client.refresh_markets()
+
+        self.assertGreater(len(client._markets.currencies()), 0)
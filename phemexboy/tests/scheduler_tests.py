@@ -0,0 +1,122 @@
+"""WaitScheduler and adaptive close Tests"""
+
+import time
+import threading
+import unittest
+
+from phemexboy.api.orders import OpenOrders
+from phemexboy.api.pool import WorkerPool
+from phemexboy.api.scheduler import Backoff, WaitScheduler
+from phemexboy.api.auth.client import AuthClient
+from phemexboy.api.aio.auth.client import AsyncAuthClient
+from phemexboy.tests.fakes import (
+    FakeOrderEndpoint,
+    FakeAsyncOrderEndpoint,
+    FakeMarkets,
+    SYMBOL,
+)
+
+
+def count(delays: list, result: str):
+    for delay in delays:
+        yield delay
+    return result
+
+
+class TestWaitScheduler(unittest.TestCase):
+    def setUp(self):
+        self.pool = WorkerPool(workers=2)
+        self.scheduler = WaitScheduler(self.pool)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_backoff(self):
+        backoff = Backoff(fast=0.25, slow=1, factor=2)
+        self.assertEqual([backoff.next() for _ in range(4)], [0.25, 0.5, 1, 1])
+        backoff.reset()
+        self.assertEqual(backoff.next(), 0.25)
+
+    def test_submit(self):
+        timers = lambda: [
+            thread
+            for thread in threading.enumerate()
+            if thread.name == "PhemexWaitScheduler"
+        ]
+        before = len(timers())
+        futures = [self.scheduler.submit(count([0.01] * 3, i)) for i in range(50)]
+        self.assertEqual(
+            [future.result(timeout=5) for future in futures], list(range(50))
+        )
+
+        # Every wait is timed by one thread
+        self.assertEqual(len(timers()) - before, 1)
+
+    def test_wake(self):
+        steps = count([60], "woken")
+        future = self.scheduler.submit(steps)
+        time.sleep(0.1)
+        self.scheduler.wake(steps)
+        self.assertEqual(future.result(timeout=5), "woken")
+
+    def test_error(self):
+        def fail():
+            yield 0
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            self.scheduler.run(fail())
+
+    def test_run_inside_pool(self):
+        # Runs inline instead of waiting on the pool it is running in
+        nested = self.pool.submit(self.scheduler.run, count([0.01], "inline"))
+        self.assertEqual(nested.result(timeout=5), "inline")
+
+
+class TestAdaptiveClose(unittest.TestCase):
+    def setUp(self):
+        self.endpoint = FakeOrderEndpoint()
+        self.client = AuthClient(
+            FakeMarkets(), self.endpoint, open_orders=OpenOrders(ttl=0)
+        )
+
+    def test_filled(self):
+        order = self.client.buy(SYMBOL, "limit", 0.001, 20000)
+        threading.Timer(0.3, self.endpoint.fill, ["1"]).start()
+
+        started = time.monotonic()
+        self.assertTrue(order.close(wait=30, tries=0))
+        # Seen shortly after the fill instead of at the end of the wait
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(order.query("filled"), 0.001)
+
+    def test_backs_off(self):
+        order = self.client.buy(SYMBOL, "limit", 0.001, 20000)
+        self.assertFalse(order.close(wait=2, tries=0))
+        self.assertTrue(order.canceled())
+        # 0.25, 0.5, 1 then the rest of the window, instead of polling at a fixed rate
+        self.assertLessEqual(self.endpoint.requests.count("fetch_open_orders"), 6)
+
+    def test_schedule_close(self):
+        orders = [self.client.buy(SYMBOL, "limit", 0.001, 20000) for _ in range(20)]
+        futures = [order.schedule_close(wait=30, tries=0) for order in orders]
+        for order in orders:
+            self.endpoint.fill(order.query("id"))
+
+        self.assertTrue(all(future.result(timeout=5) for future in futures))
+
+
+class TestAsyncAdaptiveClose(unittest.IsolatedAsyncioTestCase):
+    async def test_filled(self):
+        endpoint = FakeAsyncOrderEndpoint()
+        client = AsyncAuthClient(FakeMarkets(), endpoint, open_orders=OpenOrders(ttl=0))
+        order = await client.buy(SYMBOL, "limit", 0.001, 20000)
+        threading.Timer(0.3, endpoint.fill, ["1"]).start()
+
+        started = time.monotonic()
+        self.assertTrue(await order.close(wait=30, tries=0))
+        self.assertLess(time.monotonic() - started, 2)
+
+        unfilled = await client.buy(SYMBOL, "limit", 0.001, 20000)
+        self.assertFalse(await unfilled.close(wait=1, tries=0))
+        self.assertTrue(unfilled.canceled())
@@ -0,0 +1,39 @@
+"""SessionRegistry Tests"""
+
+import unittest
+
+from phemexboy.api.session import SessionRegistry
+
+
+class TestSessionRegistry(unittest.TestCase):
+    def setUp(self):
+        self.sessions = SessionRegistry(pool_size=4)
+
+    def tearDown(self):
+        self.sessions.close()
+
+    def test_endpoint(self):
+        public = self.sessions.endpoint()
+        self.assertIs(self.sessions.endpoint(), public)
+
+        # One session per API key, each with its own credentials
+        auth = self.sessions.endpoint("key", "secret")
+        self.assertIs(self.sessions.endpoint("key", "secret"), auth)
+        self.assertIsNot(auth, public)
+        self.assertEqual(auth.apiKey, "key")
+        self.assertFalse(public.apiKey)
+
+    def test_pool_size(self):
+        endpoint = self.sessions.endpoint()
+        adapter = endpoint.session.get_adapter("https://api.phemex.com")
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_close(self):
+        endpoint = self.sessions.endpoint()
+        self.sessions.close()
+        # Sessions are created again after closing
+        self.assertIsNot(self.sessions.endpoint(), endpoint)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""OhlcvStore Tests"""
+
+import os
+import threading
+import unittest
+
+from unittest import mock
+from tempfile import TemporaryDirectory
+from phemexboy.api.store import OhlcvStore
+from phemexboy.helpers.arrays import OHLCV, to_array
+from phemexboy.tests.fakes import MINUTE, candles
+
+
+class FakeClient:
+    def __init__(self, series: list):
+        self.series = series
+        self.requests = []
+
+    def ohlcv(self, symbol, tf, since=None, until=None, backfill=False):
+        self.requests.append(since)
+        if since is None:
+            return self.series[-5:]
+        return [candle for candle in self.series if candle[0] >= since]
+
+
+class TestOhlcvStore(unittest.TestCase):
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.store = OhlcvStore(self.dir.name)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_append(self):
+        self.assertEqual(self.store.append("BTC/USDT:USDT", "1m", candles(0, 10)), 10)
+        # Only candles newer than the last stored one are written
+        self.assertEqual(self.store.append("BTC/USDT:USDT", "1m", candles(5, 10)), 5)
+        self.assertEqual(self.store.last("BTC/USDT:USDT", "1m"), 14 * MINUTE)
+
+    def test_read(self):
+        self.store.append("BTC/USDT:USDT", "1m", candles(0, 10))
+        columns = self.store.read(
+            "BTC/USDT:USDT", "1m", since=2 * MINUTE, until=5 * MINUTE
+        )
+
+        self.assertEqual(
+            columns["timestamp"].tolist(), [2 * MINUTE, 3 * MINUTE, 4 * MINUTE]
+        )
+        self.assertEqual(columns["close"].tolist(), [3.5, 4.5, 5.5])
+        self.assertEqual(self.store.candles("BTC/USDT:USDT", "1m"), candles(0, 10))
+
+    def test_array(self):
+        self.store.append("BTC/USDT:USDT", "1m", candles(0, 10))
+        data = self.store.array("BTC/USDT:USDT", "1m", since=5 * MINUTE)
+
+        self.assertEqual(data.dtype, OHLCV)
+        self.assertEqual(data.tolist(), to_array(candles(5, 5)).tolist())
+
+    def test_resample(self):
+        self.store.append("BTC/USDT:USDT", "1m", candles(0, 120))
+        bars = self.store.resample("BTC/USDT:USDT", "1h", since=30 * MINUTE)
+
+        # Since is moved back to the start of its hour
+        self.assertEqual(bars["timestamp"].tolist(), [0, 60 * MINUTE])
+        self.assertEqual(bars["open"].tolist(), [1.0, 61.0])
+        self.assertEqual(bars["close"].tolist(), [60.5, 120.5])
+
+    def test_splice(self):
+        series = candles(0, 20)
+        self.store.append("BTC/USDT:USDT", "1m", series[:5] + series[8:])
+        self.assertEqual(
+            self.store.gaps("BTC/USDT:USDT", "1m").tolist(), [[5 * MINUTE, 8 * MINUTE]]
+        )
+
+        # Candles already stored are kept, only the missing ones are added
+        self.assertEqual(self.store.splice("BTC/USDT:USDT", "1m", series[4:9]), 3)
+        self.assertEqual(self.store.candles("BTC/USDT:USDT", "1m"), series)
+        self.assertEqual(self.store.gaps("BTC/USDT:USDT", "1m").tolist(), [])
+
+    def test_empty(self):
+        self.assertIsNone(self.store.last("BTC/USDT:USDT", "1m"))
+        self.assertEqual(self.store.candles("BTC/USDT:USDT", "1m"), [])
+
+    def test_interrupted_append(self):
+        self.store.append("BTC/USDT:USDT", "1m", candles(0, 10))
+        # Simulate a crash after only the timestamp column was written
+        path = os.path.join(self.dir.name, "BTC-USDT_USDT", "1m", "timestamp")
+        with open(path, "ab") as f:
+            f.write(b"\0" * 8)
+
+        self.assertEqual(self.store.last("BTC/USDT:USDT", "1m"), 9 * MINUTE)
+        self.store.append("BTC/USDT:USDT", "1m", candles(10, 2))
+        self.assertEqual(self.store.candles("BTC/USDT:USDT", "1m"), candles(0, 12))
+
+    def test_interrupted_splice(self):
+        series = candles(0, 20)
+        self.store.append("BTC/USDT:USDT", "1m", series[:5] + series[8:])
+        path = os.path.join(self.dir.name, "BTC-USDT_USDT", "1m")
+
+        # Simulate a crash after only the timestamp column was swapped in
+        replace = os.replace
+        swapped = []
+
+        def crash(src, dst):
+            if swapped:
+                raise OSError("interrupted")
+            swapped.append(dst)
+            replace(src, dst)
+
+        with mock.patch("os.replace", side_effect=crash):
+            with self.assertRaises(OSError):
+                self.store.splice("BTC/USDT:USDT", "1m", series[4:9])
+
+        # The journal was written, the next access finishes the swap
+        self.assertEqual(self.store.candles("BTC/USDT:USDT", "1m"), series)
+        self.assertFalse(any(name.endswith(".tmp") for name in os.listdir(path)))
+
+        # Columns staged without a journal are dropped
+        with open(os.path.join(path, "close.tmp"), "wb") as f:
+            f.write(b"\0" * 8)
+        self.assertEqual(self.store.candles("BTC/USDT:USDT", "1m"), series)
+        self.assertNotIn("close.tmp", os.listdir(path))
+
+    def test_update(self):
+        client = FakeClient(candles(0, 20))
+        self.assertEqual(self.store.update(client, "BTC/USDT:USDT", "1m", since=0), 20)
+
+        client.series = candles(0, 25)
+        self.assertEqual(self.store.update(client, "BTC/USDT:USDT", "1m"), 5)
+        # Second update only asks for candles after the last stored one
+        self.assertEqual(client.requests, [0, 20 * MINUTE])
+        self.assertEqual(self.store.candles("BTC/USDT:USDT", "1m"), candles(0, 25))
+
+
+class AsyncFakeClient(FakeClient):
+    async def ohlcv(self, *args, **kwargs):
+        return super().ohlcv(*args, **kwargs)
+
+
+class TestAsyncUpdate(unittest.IsolatedAsyncioTestCase):
+    async def test_aupdate(self):
+        with TemporaryDirectory() as path:
+            store = OhlcvStore(path)
+            threads = []
+            append = store.append
+
+            def record(*args):
+                threads.append(threading.get_ident())
+                return append(*args)
+
+            client = AsyncFakeClient(candles(0, 20))
+            with mock.patch.object(store, "append", side_effect=record):
+                written = await store.aupdate(client, "BTC/USDT:USDT", "1m", since=0)
+
+            self.assertEqual(written, 20)
+            # Written on the executor instead of blocking the event loop
+            self.assertNotIn(threading.get_ident(), threads)
+            self.assertEqual(store.candles("BTC/USDT:USDT", "1m"), candles(0, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,478 @@
+"""Websocket Stream Tests"""
+
+import json
+import asyncio
+import unittest
+import websockets
+import ccxt.async_support as ccxt_async
+
+from tempfile import TemporaryDirectory
+from ccxt import ExchangeError
+from phemexboy.api.store import OhlcvStore
+from phemexboy.api.ws.book import OrderBookStream
+from phemexboy.api.ws.candles import CandleStream
+from phemexboy.api.ws.trades import TradeStream
+from phemexboy.api.aio.auth.client import AsyncAuthClient
+from phemexboy.tests.fakes import FakeBookEndpoint, FakeMarkets, SYMBOL
+
+
+def book(type: str, sequence: int, bids: list, asks: list):
+    return {
+        "orderbook_p": {
+            "bids": [[str(price), str(size)] for price, size in bids],
+            "asks": [[str(price), str(size)] for price, size in asks],
+        },
+        "depth": 30,
+        "sequence": sequence,
+        "symbol": "BTCUSDT",
+        "timestamp": sequence * 1000000,
+        "type": type,
+    }
+
+
+def trades(type: str, rows: list):
+    return {
+        "sequence": 1,
+        "symbol": "BTCUSDT",
+        "trades_p": [
+            [ns, side, str(price), str(size)] for ns, side, price, size in rows
+        ],
+        "type": type,
+    }
+
+
+MARKET = {
+    "id": "BTCUSDT",
+    "symbol": SYMBOL,
+    "base": "BTC",
+    "quote": "USDT",
+    "settle": "USDT",
+    "type": "swap",
+    "spot": False,
+    "swap": True,
+    "linear": True,
+    "inverse": False,
+    "contract": True,
+    "contractSize": 1,
+    "precision": {},
+    "limits": {},
+}
+
+
+class FakeAuthEndpoint(ccxt_async.phemex):
+    def __init__(self):
+        super().__init__({"apiKey": "key", "secret": "secret"})
+        self.markets = {SYMBOL: MARKET}
+        self.markets_by_id = {"BTCUSDT": [MARKET]}
+        self.symbols = [SYMBOL]
+        self.requests = []
+
+    async def create_order(self, symbol, type, side, amount, price=None, params={}):
+        self.requests.append("create_order")
+        return {
+            "id": "abc",
+            "info": {"symbol": "BTCUSDT"},
+            "status": "open",
+            "symbol": symbol,
+            "type": type,
+            "side": side,
+            "amount": amount,
+            "price": price,
+        }
+
+    async def fetch_open_orders(self, symbol=None, since=None, limit=None, params={}):
+        self.requests.append("fetch_open_orders")
+        return []
+
+    async def fetch_order(self, id, symbol=None, params={}):
+        self.requests.append("fetch_order")
+        return {"id": id, "symbol": symbol, "status": "closed", "filled": 0.001}
+
+    async def fetch_positions(self, symbols=None, params={}):
+        self.requests.append("fetch_positions")
+        return [{"info": {}, "symbol": SYMBOL, "contracts": 0.001, "side": "long"}]
+
+
+def order(status: str, filled: str):
+    return {
+        "orderID": "abc",
+        "clOrdID": "",
+        "symbol": "BTCUSDT",
+        "side": "Buy",
+        "ordType": "Limit",
+        "ordStatus": status,
+        "orderQty": "0.001",
+        "cumQty": filled,
+        "leavesQty": "0",
+        "priceRp": "20000",
+        "execPriceRp": "20000",
+        "closedPnlRv": "0",
+        "timeInForce": "PostOnly",
+        "actionTimeNs": "1674110665380190869",
+        "transactTimeNs": "1674110665387882268",
+    }
+
+
+def position(size: str):
+    return {
+        "symbol": "BTCUSDT",
+        "side": "Buy",
+        "posSide": "Long",
+        "size": size,
+        "avgEntryPriceRp": "20000",
+        "currency": "USDT",
+    }
+
+
+class Replay:
+    """Local stand in for Phemex, replays one recorded script per connection"""
+
+    def __init__(self, scripts: list = None, reject: bool = False):
+        self.scripts = scripts or [[]]
+        self.reject = reject
+        self.requests = []
+        self.sockets = set()
+        self.connections = 0
+        self.server = None
+
+    async def __aenter__(self):
+        self.server = await websockets.serve(self._serve, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def subscriptions(self):
+        return [r for r in self.requests if r["method"].endswith(".subscribe")]
+
+    async def _serve(self, socket):
+        script = self.scripts[min(self.connections, len(self.scripts) - 1)]
+        self.connections += 1
+        self.sockets.add(socket)
+        sent = False
+        try:
+            async for raw in socket:
+                request = json.loads(raw)
+                self.requests.append(request)
+                reply = {"id": request["id"], "error": None, "result": "pong"}
+                if request["method"] == "user.auth" and self.reject:
+                    reply["error"] = {"code": 6012, "message": "invalid login token"}
+                elif request["method"] in ["user.auth", "server.ping"]:
+                    reply["result"] = {"status": "success"}
+                elif request["method"].endswith(".subscribe"):
+                    reply["result"] = {"status": "success"}
+                await socket.send(json.dumps(reply))
+
+                if request["method"].endswith(".subscribe") and not sent:
+                    # Phemex answers a subscription with the current state
+                    sent = True
+                    for message in script:
+                        await socket.send(json.dumps(message))
+        finally:
+            self.sockets.discard(socket)
+
+    async def push(self, message: dict):
+        for socket in list(self.sockets):
+            await socket.send(json.dumps(message))
+
+
+class TestOrderBookStream(unittest.IsolatedAsyncioTestCase):
+    async def run_stream(self, scripts: list, updates: int):
+        async with Replay(scripts) as replay:
+            stream = OrderBookStream(
+                SYMBOL, FakeMarkets(), FakeBookEndpoint(), replay.url
+            )
+            seen = []
+            done = asyncio.Event()
+
+            def record(stream):
+                seen.append(stream.orderbook())
+                if len(seen) == updates:
+                    done.set()
+
+            stream.listen(record)
+            async with stream:
+                await asyncio.wait_for(done.wait(), 5)
+            return stream, replay, seen
+
+    async def test_deltas(self):
+        script = [
+            # Sent before the snapshot, already included in it
+            book("incremental", 9, [[100, 5]], []),
+            book("snapshot", 10, [[100, 1], [99, 2]], [[101, 1], [102, 2]]),
+            book("incremental", 11, [[100, 0], [99.5, 3]], [[101, 4]]),
+        ]
+        stream, replay, seen = await self.run_stream([script], 2)
+
+        self.assertEqual(replay.subscriptions[0]["method"], "orderbook_p.subscribe")
+        self.assertEqual(replay.subscriptions[0]["params"], ["BTCUSDT"])
+        self.assertEqual(seen[0]["bids"], [[100.0, 1.0], [99.0, 2.0]])
+        self.assertEqual(seen[1]["bids"], [[99.5, 3.0], [99.0, 2.0]])
+        self.assertEqual(seen[1]["asks"], [[101.0, 4.0], [102.0, 2.0]])
+        self.assertEqual(seen[1]["nonce"], 11)
+        self.assertEqual(seen[1].mid(), 100.25)
+        self.assertEqual(stream.resyncs, 0)
+
+    async def test_sequence_resync(self):
+        first = [
+            book("snapshot", 10, [[100, 1]], [[101, 1]]),
+            # Sequence went backwards, the book can't be trusted
+            book("incremental", 10, [[100, 2]], []),
+            book("incremental", 12, [[100, 3]], []),
+        ]
+        second = [book("snapshot", 20, [[100, 7]], [[101, 1]])]
+        stream, replay, seen = await self.run_stream([first, second], 2)
+
+        self.assertEqual(stream.resyncs, 1)
+        self.assertEqual(len(replay.subscriptions), 2)
+        self.assertEqual([b["nonce"] for b in seen], [10, 20])
+        self.assertEqual(seen[1]["bids"], [[100.0, 7.0]])
+
+    async def test_crossed_resync(self):
+        first = [
+            book("snapshot", 10, [[100, 1]], [[101, 1]]),
+            book("incremental", 11, [[101.5, 1]], []),
+        ]
+        second = [book("snapshot", 20, [[100, 1]], [[101, 1]])]
+        stream, replay, seen = await self.run_stream([first, second], 2)
+
+        self.assertEqual(stream.resyncs, 1)
+        self.assertEqual([b["nonce"] for b in seen], [10, 20])
+
+    async def test_failing_listener(self):
+        script = [
+            book("snapshot", 10, [[100, 1]], [[101, 1]]),
+            book("incremental", 11, [[100, 2]], []),
+        ]
+        async with Replay([script]) as replay:
+            stream = OrderBookStream(
+                SYMBOL, FakeMarkets(), FakeBookEndpoint(), replay.url
+            )
+            seen = []
+            synced, done = asyncio.Event(), asyncio.Event()
+
+            def fail(stream):
+                raise ValueError("listener failed")
+
+            def record(stream):
+                seen.append(stream.orderbook()["nonce"])
+                if len(seen) == 2:
+                    synced.set()
+                if len(seen) == 3:
+                    done.set()
+
+            stream.listen(fail)
+            stream.listen(record)
+            async with stream:
+                await asyncio.wait_for(synced.wait(), 5)
+                # Unreadable messages and failing listeners leave the reader running
+                for socket in list(replay.sockets):
+                    await socket.send("not json")
+                await replay.push(book("incremental", 12, [[100, 3]], []))
+                await asyncio.wait_for(done.wait(), 5)
+
+        self.assertEqual(seen, [10, 11, 12])
+        self.assertEqual(replay.connections, 1)
+        self.assertEqual(stream.resyncs, 0)
+
+    async def test_depth(self):
+        levels = [[100 - i, 1] for i in range(10)]
+        script = [book("snapshot", 10, levels, [[101 + i, 1] for i in range(10)])]
+        async with Replay([script]) as replay:
+            stream = OrderBookStream(
+                SYMBOL, FakeMarkets(), FakeBookEndpoint(), replay.url
+            )
+            async with stream:
+                self.assertTrue(await stream.aready(5))
+                top = stream.orderbook(depth=3)
+            self.assertFalse(stream.synced)
+
+        self.assertEqual(top["bids"], [[100.0, 1.0], [99.0, 1.0], [98.0, 1.0]])
+        self.assertEqual(top.ask(), 101.0)
+
+
+class TestTradeStream(unittest.IsolatedAsyncioTestCase):
+    async def test_trades(self):
+        second = 1000000000
+        first = [
+            # Snapshots list the newest trade first
+            trades(
+                "snapshot", [(2 * second, "Sell", 101, 2), (1 * second, "Buy", 100, 1)]
+            ),
+            trades("incremental", [(3 * second, "Buy", 102, 3)]),
+        ]
+        # After a reconnect the snapshot repeats trades already stored
+        again = [
+            trades(
+                "snapshot", [(4 * second, "Buy", 103, 4), (3 * second, "Buy", 102, 3)]
+            )
+        ]
+        async with Replay([first, again]) as replay:
+            stream = TradeStream(
+                SYMBOL, FakeMarkets(), FakeBookEndpoint(), replay.url, 10
+            )
+            batches = []
+            stream.listen(lambda batch: batches.append(batch["timestamp"].tolist()))
+            async with stream:
+                self.assertTrue(await stream.aready(5))
+                while len(stream) < 3:
+                    await asyncio.sleep(0.01)
+                await stream._connection.reconnect()
+                while len(stream) < 4:
+                    await asyncio.sleep(0.01)
+
+        self.assertEqual(replay.subscriptions[0]["method"], "trade_p.subscribe")
+        latest = stream.latest()
+        self.assertEqual(latest["timestamp"].tolist(), [1000, 2000, 3000, 4000])
+        self.assertEqual(latest["price"].tolist(), [100.0, 101.0, 102.0, 103.0])
+        self.assertEqual(latest["side"].tolist(), [1, -1, 1, 1])
+        self.assertEqual(stream.latest(1)["size"].tolist(), [4.0])
+        self.assertEqual(batches, [[1000, 2000], [3000], [4000]])
+
+
+class FakeClient:
+    """Serves REST candles, the latest page only holds the first one"""
+
+    def __init__(self, series: list):
+        self.series = series
+        self.requests = []
+
+    def ohlcv(self, symbol, tf, since=None, until=None, backfill=False):
+        self.requests.append(since)
+        if since is None:
+            return self.series[:1]
+        return [candle for candle in self.series if candle[0] >= since]
+
+
+class TestCandleStream(unittest.IsolatedAsyncioTestCase):
+    async def test_candles(self):
+        second, minute = 1000000000, 60000
+        first = [
+            trades(
+                "snapshot",
+                [(70 * second, "Sell", 101, 1), (10 * second, "Buy", 100, 1)],
+            ),
+            trades("incremental", [(130 * second, "Buy", 102, 1)]),
+            trades("incremental", [(190 * second, "Buy", 103, 1)]),
+        ]
+        # Trades between the drop and the snapshot are missing, nothing in minute 5
+        again = [
+            trades(
+                "snapshot",
+                [
+                    (370 * second, "Buy", 105, 1),
+                    (250 * second, "Buy", 104, 1),
+                    (190 * second, "Buy", 103, 1),
+                ],
+            ),
+        ]
+        rest = [[i * minute, 1.0, 1.0, 1.0, 1.0, 99.0] for i in range(5)]
+        client = FakeClient(rest)
+
+        with TemporaryDirectory() as path:
+            store = OhlcvStore(path)
+            async with Replay([first, again]) as replay:
+                stream = TradeStream(
+                    SYMBOL, FakeMarkets(), FakeBookEndpoint(), replay.url
+                )
+                candles = CandleStream(stream, ["1m"], client, store)
+                closed = []
+                candles.listen(
+                    lambda tf, bars: closed.extend(bars["timestamp"].tolist())
+                )
+                async with candles, stream:
+                    while store.last(SYMBOL, "1m") != 2 * minute:
+                        await asyncio.sleep(0.01)
+                    await stream._connection.reconnect()
+                    while store.last(SYMBOL, "1m") != 5 * minute:
+                        await asyncio.sleep(0.01)
+                    self.assertEqual(candles.partial("1m")["close"], 105.0)
+
+            stored = store.array(SYMBOL, "1m")
+
+        self.assertEqual(closed, [i * minute for i in range(6)])
+        self.assertEqual(stored["timestamp"].tolist(), [i * minute for i in range(6)])
+        # Live candles where every trade was seen, REST where the stream joined or dropped
+        self.assertEqual(stored["volume"].tolist(), [99.0, 1.0, 1.0, 99.0, 99.0, 0.0])
+        self.assertEqual(stored["close"][-1], 104.0)
+        self.assertEqual(client.requests, [None, 3 * minute])
+
+
+class TestAccountStream(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.endpoint = FakeAuthEndpoint()
+        self.auth = AsyncAuthClient(FakeMarkets(), self.endpoint)
+
+    async def push(self, replay, stream, message):
+        arrived = asyncio.Event()
+        stream.listen(lambda kind, update: arrived.set())
+        await replay.push(message)
+        await asyncio.wait_for(arrived.wait(), 5)
+
+    async def test_orders(self):
+        async with Replay() as replay:
+            stream = await self.auth.watch_account(5, replay.url)
+            methods = [r["method"] for r in replay.requests]
+            self.assertEqual(methods[0], "user.auth")
+            self.assertEqual(
+                methods[1:], ["wo.subscribe", "aop.subscribe", "aop_p.subscribe"]
+            )
+
+            client = await self.auth.buy(SYMBOL, "limit", 0.001, 20000)
+            await self.push(replay, stream, {"orders_p": [order("New", "0")]})
+            self.assertTrue(await client.pending())
+            self.assertFalse(await client.closed())
+
+            # close() wakes on the fill instead of sleeping for wait
+            closing = asyncio.ensure_future(client.close(wait=30))
+            await asyncio.sleep(0.05)
+            await replay.push({"orders_p": [order("Filled", "0.001")]})
+            self.assertTrue(await asyncio.wait_for(closing, 5))
+            self.assertEqual(client._order["filled"], 0.001)
+
+            await self.auth.close()
+
+        # State came from the stream, open orders were never requested
+        self.assertEqual(self.endpoint.requests, ["create_order"])
+
+    async def test_positions(self):
+        async with Replay() as replay:
+            stream = await self.auth.watch_account(5, replay.url)
+            client = await self.auth.position(SYMBOL)
+            self.assertFalse(client.closed())
+
+            await self.push(replay, stream, {"positions_p": [position("0")]})
+            self.assertTrue(client.closed())
+            await self.auth.close()
+
+    async def test_reconnect(self):
+        async with Replay() as replay:
+            stream = await self.auth.watch_account(5, replay.url)
+            client = await self.auth.buy(SYMBOL, "limit", 0.001, 20000)
+            await self.push(replay, stream, {"orders_p": [order("New", "0")]})
+
+            # Updates may have been missed while disconnected
+            await stream._connection.reconnect()
+            while stream.epoch < 2 or not stream.synced:
+                await asyncio.sleep(0.01)
+            self.assertTrue(await client.closed())
+            # Gone from open orders, then fetched by id to learn it filled
+            self.assertEqual(
+                self.endpoint.requests[-2:], ["fetch_open_orders", "fetch_order"]
+            )
+            self.assertFalse(client.canceled())
+            await self.auth.close()
+
+    async def test_rejected(self):
+        async with Replay(reject=True) as replay:
+            with self.assertRaises(ExchangeError):
+                await self.auth.watch_account(5, replay.url)
+            self.assertIsNone(self.auth._account)
+
+
+if __name__ == "__main__":
+    unittest.main()